@@ -1,4 +1,2 @@
-from api.project_api import router as project_router
-from api.tenent_api import router as tenent_router
-from api.user_api import router as user_router
-from api.auth_api import router as auth_router
\ No newline at end of file
+# 라우터는 순환 import를 피하기 위해 각 모듈에서 직접 import합니다.
+# (auth.security -> api.dependency -> api 패키지 초기화 -> api.auth_api -> auth)
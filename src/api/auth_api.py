@@ -1,15 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
 from datetime import timedelta
 
 from service.user_service import UserService
-from api.dependency import get_user_service
+from api.dependency import get_user_service, get_auth_user_service
+from api.etag import user_etag, is_not_modified, not_modified_response
 from api.schemas.auth_schema import Token, SignupRequest, EmailVerificationRequest, ResetPasswordRequest
 from api.schemas.user_schema import UserResponse
-from auth import create_access_token, get_current_user
+from auth import create_access_token, get_current_active_user
+from config import AuthConfig
 from domain import User
+from monitoring.route import TimedRoute
 
-router = APIRouter(tags=["Auth"])
+router = APIRouter(tags=["Auth"], route_class=TimedRoute)
 
 @router.post("/signup", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def signup(
@@ -35,7 +38,7 @@ async def signup(
 @router.post("/login", response_model=Token)
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    user_service: UserService = Depends(get_user_service)
+    user_service: UserService = Depends(get_auth_user_service)
 ):
     """사용자 로그인 및 JWT 토큰 발급"""
     try:
@@ -43,7 +46,7 @@ async def login(
         user = await user_service.authenticate_user(form_data.username, form_data.password)
         
         # 액세스 토큰 생성
-        access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+        access_token_expires = timedelta(minutes=AuthConfig.ACCESS_TOKEN_EXPIRE_MINUTES)
         access_token = create_access_token(
             data={
                 "sub": str(user.id),
@@ -73,9 +76,15 @@ async def logout(
 
 @router.get("/me", response_model=UserResponse)
 async def me(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_active_user)
 ):
     """현재 로그인한 사용자 정보 조회"""
+    etag = user_etag(current_user)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    response.headers["ETag"] = etag
     return current_user
 
 @router.post("/send-email")
@@ -0,0 +1,24 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+
+from service.change_feed_service import ChangeFeedService
+from api.dependency import get_change_feed_service
+from exception.domain import ChangeFeedException
+from monitoring.route import TimedRoute
+
+router = APIRouter(prefix="/changes", tags=["Changes"], route_class=TimedRoute)
+
+@router.get("/{entity_type}")
+async def get_changes(
+    entity_type: str = Path(..., description="user, project, project_member"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (처음이면 생략)"),
+    limit: int = Query(100, ge=1),
+    tenant_id: Optional[int] = Query(None),
+    change_feed_service: ChangeFeedService = Depends(get_change_feed_service)
+):
+    """커서 이후 생성/수정/삭제된 엔티티 조회"""
+    try:
+        return await change_feed_service.get_changes(entity_type, cursor, limit, tenant_id)
+    except ChangeFeedException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -1,10 +1,29 @@
+from api.dependency.session import (
+    get_db,
+    get_auth_db,
+    get_auth_session_factory,
+    get_read_db,
+    get_tenant_session_manager,
+    open_read_session
+)
+from api.dependency.tenant import get_current_tenant_id
 from api.dependency.repository import (
     get_user_repository,
+    get_auth_user_repository,
+    get_auth_user_repository_factory,
+    get_read_user_repository,
     get_project_repository,
     get_project_member_repository,
-    get_tenant_repository
+    get_tenant_repository,
+    get_loaders,
+    get_change_feed_repository,
+    memory_repository_overrides
 )
 from api.dependency.service import (
     get_user_service,
+    get_auth_user_service,
+    get_auth_user_service_factory,
+    get_read_user_service,
     get_project_service,
+    get_change_feed_service,
 )
\ No newline at end of file
@@ -1,15 +1,42 @@
+from contextlib import asynccontextmanager
+from typing import AsyncContextManager, AsyncIterator, Callable
+
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from db.session import get_db
-from repository.pg import UserPgRepository, ProjectPgRepository, ProjectMemberPgRepository, TenantPgRepository
-from repository.interface import IUserRepository, IProjectRepository, IProjectMemberRepository, ITenantRepository
+from cache import get_tenant_cache
+from api.dependency.session import get_db, get_auth_db, get_read_db, get_auth_session_factory
+from repository.pg import UserPgRepository, ProjectPgRepository, ProjectMemberPgRepository, TenantPgRepository, ChangeFeedPgRepository
+from repository.memory import MemoryStore, get_memory_store, UserMemoryRepository, ProjectMemoryRepository, ProjectMemberMemoryRepository, TenantMemoryRepository
+from repository.loader import Loaders
+from repository.interface import IUserRepository, IProjectRepository, IProjectMemberRepository, ITenantRepository, IChangeFeedRepository
 
 
 async def get_user_repository(session: AsyncSession = Depends(get_db)) -> IUserRepository:
     return UserPgRepository(session)
 
 
+async def get_auth_user_repository(session: AsyncSession = Depends(get_auth_db)) -> IUserRepository:
+    return UserPgRepository(session)
+
+
+async def get_auth_user_repository_factory(
+    open_session: Callable[[], AsyncContextManager[AsyncSession]] = Depends(get_auth_session_factory)
+) -> Callable[[], AsyncContextManager[IUserRepository]]:
+    """auth lane 세션을 블록 안에서만 사용하는 사용자 저장소 팩토리"""
+
+    @asynccontextmanager
+    async def open_repository() -> AsyncIterator[IUserRepository]:
+        async with open_session() as session:
+            yield UserPgRepository(session)
+
+    return open_repository
+
+
+async def get_read_user_repository(session: AsyncSession = Depends(get_read_db)) -> IUserRepository:
+    return UserPgRepository(session)
+
+
 async def get_project_repository(session: AsyncSession = Depends(get_db)) -> IProjectRepository:
     return ProjectPgRepository(session)
 
@@ -19,4 +46,55 @@ async def get_project_member_repository(session: AsyncSession = Depends(get_db))
 
 
 async def get_tenant_repository(session: AsyncSession = Depends(get_db)) -> ITenantRepository:
-    return TenantPgRepository(session)
+    return TenantPgRepository(session, get_tenant_cache())
+
+
+async def get_change_feed_repository(session: AsyncSession = Depends(get_read_db)) -> IChangeFeedRepository:
+    return ChangeFeedPgRepository(session)
+
+
+async def get_loaders(session: AsyncSession = Depends(get_db)) -> Loaders:
+    """요청 단위 일괄 조회 로더 의존성 함수"""
+    return Loaders.for_session(session, get_tenant_cache())
+
+
+def memory_repository_overrides(store: MemoryStore = None) -> dict:
+    """
+    저장소 의존성을 메모리 저장소로 바꾸는 dependency_overrides 목록
+
+    DB 세션을 열지 않으므로 서비스/API 오버헤드를 DB 비용과 분리해 측정할 수 있습니다.
+    """
+    store = store or get_memory_store()
+
+    async def user_repository() -> IUserRepository:
+        return UserMemoryRepository(store)
+
+    async def project_repository() -> IProjectRepository:
+        return ProjectMemoryRepository(store)
+
+    async def project_member_repository() -> IProjectMemberRepository:
+        return ProjectMemberMemoryRepository(store)
+
+    async def tenant_repository() -> ITenantRepository:
+        return TenantMemoryRepository(store)
+
+    @asynccontextmanager
+    async def open_user_repository() -> AsyncIterator[IUserRepository]:
+        yield UserMemoryRepository(store)
+
+    async def user_repository_factory() -> Callable[[], AsyncContextManager[IUserRepository]]:
+        return open_user_repository
+
+    async def loaders() -> Loaders:
+        return Loaders(UserMemoryRepository(store), ProjectMemoryRepository(store), ProjectMemberMemoryRepository(store), TenantMemoryRepository(store))
+
+    return {
+        get_user_repository: user_repository,
+        get_auth_user_repository: user_repository,
+        get_auth_user_repository_factory: user_repository_factory,
+        get_read_user_repository: user_repository,
+        get_project_repository: project_repository,
+        get_project_member_repository: project_member_repository,
+        get_tenant_repository: tenant_repository,
+        get_loaders: loaders,
+    }
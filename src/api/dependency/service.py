@@ -1,13 +1,24 @@
+from contextlib import asynccontextmanager
+from typing import AsyncContextManager, AsyncIterator, Callable
+
 from fastapi import Depends
 
+from cache import get_user_cache, get_email_filter
+from db.shard import get_email_directory
+
 from service.user_service import UserService
 from service.project_service import ProjectService
-from repository.interface import IUserRepository, IProjectRepository, IProjectMemberRepository, ITenantRepository
+from service.change_feed_service import ChangeFeedService
+from repository.interface import IUserRepository, IProjectRepository, IProjectMemberRepository, ITenantRepository, IChangeFeedRepository
 from api.dependency.repository import (
     get_user_repository,
+    get_auth_user_repository,
+    get_auth_user_repository_factory,
+    get_read_user_repository,
     get_project_repository,
     get_project_member_repository,
-    get_tenant_repository
+    get_tenant_repository,
+    get_change_feed_repository
 )
 
 
@@ -17,7 +28,42 @@ async def get_user_service(
     """
     사용자 서비스 의존성 함수
     """
-    return UserService(user_repository)
+    return UserService(user_repository, get_user_cache(), get_email_filter(), get_email_directory())
+
+
+async def get_auth_user_service(
+    user_repository: IUserRepository = Depends(get_auth_user_repository)
+) -> UserService:
+    """
+    인증 필수 경로(auth lane) 사용자 서비스 의존성 함수
+    """
+    return UserService(user_repository, get_user_cache(), get_email_filter(), get_email_directory())
+
+
+async def get_auth_user_service_factory(
+    open_repository: Callable[[], AsyncContextManager[IUserRepository]] = Depends(get_auth_user_repository_factory)
+) -> Callable[[], AsyncContextManager[UserService]]:
+    """
+    auth lane 세션을 블록 안에서만 사용하는 사용자 서비스 팩토리 의존성 함수
+
+    토큰 검증 후 엔드포인트가 실행되는 동안 auth lane 커넥션을 점유하지 않도록 합니다.
+    """
+
+    @asynccontextmanager
+    async def open_service() -> AsyncIterator[UserService]:
+        async with open_repository() as user_repository:
+            yield UserService(user_repository, get_user_cache(), get_email_filter(), get_email_directory())
+
+    return open_service
+
+
+async def get_read_user_service(
+    user_repository: IUserRepository = Depends(get_read_user_repository)
+) -> UserService:
+    """
+    읽기 전용(replica) 사용자 서비스 의존성 함수
+    """
+    return UserService(user_repository, get_user_cache(), get_email_filter(), get_email_directory())
 
 
 async def get_project_service(
@@ -28,3 +74,12 @@ async def get_project_service(
     프로젝트 서비스 의존성 함수
     """
     return ProjectService(project_repository, project_member_repository)
+
+
+async def get_change_feed_service(
+    change_feed_repository: IChangeFeedRepository = Depends(get_change_feed_repository)
+) -> ChangeFeedService:
+    """
+    변경 피드 서비스 의존성 함수
+    """
+    return ChangeFeedService(change_feed_repository)
@@ -0,0 +1,144 @@
+import hashlib
+from contextlib import asynccontextmanager
+from typing import AsyncContextManager, AsyncIterator, Callable, Optional
+
+from fastapi import Depends, HTTPException, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.session import PgSessionManager, DEFAULT_LANE, AUTH_LANE, BULK_LANE
+from db.fairness import TenantQuotaTimeoutException
+from db.shard import get_shard_router
+from exception.domain import TenantMovingException
+from api.dependency.tenant import get_current_tenant_id
+
+
+def _get_pin_key(request: Request) -> Optional[str]:
+    """
+    read-your-writes 고정에 사용할 클라이언트 식별 키를 구합니다.
+
+    토큰 원문을 고정 목록에 보관하지 않도록 토큰의 사용자(sub)를 키로 쓰고,
+    검증할 수 없는 토큰은 해시값을 사용합니다. 토큰이 없으면 클라이언트 주소를 사용합니다.
+    """
+    # auth 패키지가 api.dependency를 import하므로 순환 import를 피하기 위해 지역 import
+    from auth.jwt import decode_token
+
+    authorization = request.headers.get("authorization")
+    if authorization:
+        scheme, _, token = authorization.partition(" ")
+        if scheme.lower() == "bearer" and token:
+            try:
+                user_id = decode_token(token).get("sub")
+            except HTTPException:
+                user_id = None
+            if user_id is not None:
+                return f"user:{user_id}"
+        return "token:" + hashlib.sha256(authorization.encode("utf-8")).hexdigest()
+    return request.client.host if request.client else None
+
+
+async def get_tenant_session_manager(
+    tenant_id: Optional[int] = Depends(get_current_tenant_id)
+) -> PgSessionManager:
+    """테넌트가 저장된 샤드의 세션 매니저를 제공하는 의존성 함수"""
+    router = get_shard_router()
+    await router.refresh_directory()
+    try:
+        return router.session_manager_for(tenant_id)
+    except TenantMovingException as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": str(int(router.refresh_seconds) + 1)}
+        )
+
+
+async def _open_session(request: Request, session_manager: PgSessionManager, tenant_id: Optional[int], read_only: bool, lane: str):
+    try:
+        async for session in session_manager.get_db(read_only=read_only, pin_key=_get_pin_key(request), tenant_id=tenant_id, lane=lane):
+            yield session
+    except TenantQuotaTimeoutException as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        )
+
+
+async def get_db(
+    request: Request,
+    tenant_id: Optional[int] = Depends(get_current_tenant_id),
+    session_manager: PgSessionManager = Depends(get_tenant_session_manager)
+) -> AsyncSession:
+    """비동기 데이터베이스 세션을 제공하는 의존성 함수"""
+    async for session in _open_session(request, session_manager, tenant_id, read_only=False, lane=DEFAULT_LANE):
+        yield session
+
+
+async def get_auth_db(
+    request: Request,
+    tenant_id: Optional[int] = Depends(get_current_tenant_id),
+    session_manager: PgSessionManager = Depends(get_tenant_session_manager)
+) -> AsyncSession:
+    """토큰 검증/로그인 등 인증 필수 경로 전용 풀(auth lane)의 세션을 제공하는 의존성 함수"""
+    async for session in _open_session(request, session_manager, tenant_id, read_only=False, lane=AUTH_LANE):
+        yield session
+
+
+async def get_auth_session_factory(
+    request: Request,
+    tenant_id: Optional[int] = Depends(get_current_tenant_id),
+    session_manager: PgSessionManager = Depends(get_tenant_session_manager)
+) -> Callable[[], AsyncContextManager[AsyncSession]]:
+    """
+    auth lane 세션을 필요한 동안만 여는 팩토리를 제공하는 의존성 함수
+
+    get_auth_db는 응답이 끝날 때까지 세션을 유지하므로, 토큰 검증처럼 다른 세션을 함께 쓰는
+    요청 앞단의 짧은 조회는 이 팩토리로 `async with` 블록 안에서만 auth lane 커넥션을 사용합니다.
+    """
+
+    @asynccontextmanager
+    async def open_session() -> AsyncIterator[AsyncSession]:
+        sessions = _open_session(request, session_manager, tenant_id, read_only=False, lane=AUTH_LANE)
+        session = await sessions.__anext__()
+        try:
+            yield session
+        finally:
+            # 제너레이터를 끝까지 진행시켜 세션과 테넌트 슬롯을 반납
+            async for _ in sessions:
+                pass
+
+    return open_session
+
+
+async def get_read_db(
+    request: Request,
+    tenant_id: Optional[int] = Depends(get_current_tenant_id),
+    session_manager: PgSessionManager = Depends(get_tenant_session_manager)
+) -> AsyncSession:
+    """
+    모든 조회를 replica에서 수행하는 읽기 전용 세션을 제공하는 의존성 함수
+
+    대량 목록 조회에 사용되므로 primary로 고정된 경우에도 bulk lane 풀을 사용합니다.
+    """
+    async for session in _open_session(request, session_manager, tenant_id, read_only=True, lane=BULK_LANE):
+        yield session
+
+
+
+@asynccontextmanager
+async def open_read_session(request: Request, session_manager: PgSessionManager, tenant_id: Optional[int]) -> AsyncIterator[AsyncSession]:
+    """
+    응답 스트리밍처럼 요청 핸들러가 끝난 뒤에도 사용하는 읽기 전용(bulk lane) 세션을 엽니다.
+
+    스트리밍 본문 안에서 `async with`로 열어야 본문을 보내지 않고 끝난 응답(첫 청크 전의
+    연결 종료, 미들웨어 오류)이 슬롯과 커넥션을 잡고 있지 않습니다. 이 경우 슬롯/커넥션 대기
+    실패는 응답 헤더를 보낸 뒤에 발생하므로 503 대신 스트림이 중단됩니다.
+    """
+    sessions = _open_session(request, session_manager, tenant_id, read_only=True, lane=BULK_LANE)
+    session = await sessions.__anext__()
+    try:
+        yield session
+    finally:
+        # aclose()는 중첩된 세션 제너레이터까지 닫지 않으므로 끝까지 진행시켜 슬롯과 세션을 반납
+        async for _ in sessions:
+            pass
@@ -0,0 +1,65 @@
+from typing import Optional
+
+from fastapi import HTTPException, Request
+
+from db.shard import get_email_directory
+
+
+def _as_tenant_id(value) -> Optional[int]:
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return None
+
+
+async def _tenant_id_from_body(request: Request) -> Optional[int]:
+    """
+    본문에서 테넌트를 구합니다. (토큰이 없는 가입/로그인 요청용)
+
+    JSON 본문은 tenant_id 필드를, 로그인 폼은 username(이메일)을 전역 이메일 디렉터리에서 찾습니다.
+    FastAPI가 이미 읽은 본문을 다시 사용하므로 추가로 요청 본문을 읽지 않습니다.
+    """
+    if request.method not in ("POST", "PUT", "PATCH"):
+        return None
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith("application/json"):
+        try:
+            body = await request.json()
+        except ValueError:
+            return None
+        return _as_tenant_id(body.get("tenant_id")) if isinstance(body, dict) else None
+    if content_type.startswith(("application/x-www-form-urlencoded", "multipart/form-data")):
+        email = (await request.form()).get("username")
+        if isinstance(email, str) and email:
+            directory = get_email_directory()
+            return await directory.tenant_for(email) if directory is not None else None
+    return None
+
+
+async def get_current_tenant_id(request: Request) -> Optional[int]:
+    """
+    요청이 속한 테넌트 ID를 구합니다.
+
+    경로/쿼리 파라미터로 지정한 tenant_id를 우선 사용합니다. (다른 테넌트의 데이터를 요청하면
+    호출자가 아니라 요청한 테넌트의 샤드로 가야 함) 없으면 Bearer 토큰의 tenant_id 클레임,
+    그다음 본문(가입 요청의 tenant_id, 로그인 폼의 이메일)을 사용합니다.
+    테넌트를 알 수 없으면 None을 반환합니다.
+    """
+    # auth 패키지가 api.dependency를 import하므로 순환 import를 피하기 위해 지역 import
+    from auth.jwt import decode_token
+
+    for params in (request.path_params, request.query_params):
+        tenant_id = _as_tenant_id(params.get("tenant_id"))
+        if tenant_id is not None:
+            return tenant_id
+
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and token:
+        try:
+            tenant_id = _as_tenant_id(decode_token(token).get("tenant_id"))
+        except HTTPException:
+            tenant_id = None
+        if tenant_id is not None:
+            return tenant_id
+    return await _tenant_id_from_body(request)
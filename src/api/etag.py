@@ -0,0 +1,40 @@
+import hashlib
+from datetime import datetime
+from typing import Iterable, Optional, Tuple
+
+from fastapi import Request, Response, status
+
+
+def make_etag(versions: Iterable[Tuple[int, Optional[datetime]]]) -> str:
+    """(ID, 수정 시각) 목록으로 strong ETag를 생성합니다."""
+    digest = hashlib.sha256()
+    for id, updated_at in versions:
+        digest.update(f"{id}:{updated_at.isoformat() if updated_at else ''};".encode())
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def user_etag(user) -> str:
+    """사용자 하나의 ETag"""
+    return make_etag([(user.id, user.updated_at)])
+
+
+def users_etag(users) -> str:
+    """사용자 목록의 ETag (순서와 구성이 바뀌어도 달라짐)"""
+    return make_etag((user.id, user.updated_at) for user in users)
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더가 현재 ETag와 일치하는지 확인합니다."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match는 weak 비교를 사용
+    candidates = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return etag in candidates
+
+
+def not_modified_response(etag: str) -> Response:
+    """본문 없이 ETag만 담은 304 응답"""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
@@ -0,0 +1,61 @@
+import csv
+import io
+import logging
+import time
+from typing import AsyncIterator
+
+from api.serialization import dumps, user_to_dict
+
+EXPORT_FIELDS = ["id", "email", "name", "tenant_id", "is_admin", "email_verified", "created_at", "updated_at"]
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+logger = logging.getLogger("notaai.export")
+
+
+def _ndjson_row(user) -> bytes:
+    return dumps(user_to_dict(user)) + b"\n"
+
+
+def _csv_row(user) -> bytes:
+    row = user_to_dict(user)
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow([
+        row[field].isoformat() if hasattr(row[field], "isoformat") else row[field]
+        for field in EXPORT_FIELDS
+    ])
+    return buffer.getvalue().encode("utf-8")
+
+
+async def stream_users_export(
+    users: AsyncIterator,
+    format: str,
+    label: str,
+    chunk_rows: int = 500,
+) -> AsyncIterator[bytes]:
+    """
+    사용자 스트림을 NDJSON 또는 CSV 바이트 청크로 변환합니다.
+
+    chunk_rows개씩 모아서 내보내고, 끝나면 처리량(rows/s)을 기록합니다.
+    """
+    encode = _csv_row if format == "csv" else _ndjson_row
+    rows = 0
+    started = time.perf_counter()
+    try:
+        chunk = []
+        if format == "csv":
+            chunk.append(",".join(EXPORT_FIELDS).encode("utf-8") + b"\r\n")
+        async for user in users:
+            chunk.append(encode(user))
+            rows += 1
+            if len(chunk) >= chunk_rows:
+                yield b"".join(chunk)
+                chunk = []
+        if chunk:
+            yield b"".join(chunk)
+    finally:
+        elapsed = time.perf_counter() - started
+        logger.info("내보내기 %s: %d rows, %.3fs, %.0f rows/s", label, rows, elapsed, rows / elapsed if elapsed else 0)
@@ -0,0 +1,85 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import PlainTextResponse
+
+from auth.security import get_current_admin_user
+from cache import get_user_cache, get_email_filter
+from db.shard import get_shard_router
+from config import MonitoringConfig
+from monitoring import get_loop_lag_monitor, get_slow_query_log
+from monitoring.profiler import get_profile_store, get_route_sampler
+from monitoring.route import TimedRoute
+
+# 내부 구현(쿼리, 호출 스택, 테넌트 지표)이 드러나므로 관리자만 조회할 수 있음
+router = APIRouter(
+    prefix="/metrics",
+    tags=["Metrics"],
+    route_class=TimedRoute,
+    dependencies=[Depends(get_current_admin_user)],
+)
+
+@router.get("/db/tenants")
+async def get_tenant_db_metrics():
+    """샤드/lane별 테넌트 DB 세션 대기 지표 조회"""
+    shard_router = get_shard_router()
+    return {
+        shard: {lane: limiter.snapshot() for lane, limiter in manager.fair_limiters.items()}
+        for shard, manager in shard_router.managers.items()
+    }
+
+
+@router.get("/cache/users")
+async def get_user_cache_metrics():
+    """사용자 캐시 적중률 지표 조회"""
+    return get_user_cache().stats()
+
+
+@router.get("/cache/emails")
+async def get_email_filter_metrics():
+    """이메일 존재 여부 필터 지표 조회"""
+    return get_email_filter().stats()
+
+
+@router.get("/loop")
+async def get_loop_lag_metrics():
+    """이벤트 루프 지연 백분위수와 루프를 막은 호출 스택 조회"""
+    return get_loop_lag_monitor().stats()
+
+
+
+@router.get("/slow-queries")
+async def get_slow_queries(top: int = 20, order_by: str = "total"):
+    """정규화된 쿼리별 느린 쿼리 상위 목록 조회 (order_by: total, max, count, avg)"""
+    try:
+        return get_slow_query_log().top(top, order_by)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+def _require_profiling() -> None:
+    if not MonitoringConfig.PROFILING_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="프로파일링이 비활성화되어 있습니다")
+
+
+@router.get("/profiles")
+async def list_profiles():
+    """저장된 요청 프로파일 목록 조회"""
+    _require_profiling()
+    return get_profile_store().list()
+
+
+@router.get("/profiles/routes")
+async def get_route_hot_stacks(top: int = 10):
+    """백그라운드 샘플링으로 집계한 라우트별 hot stack 조회"""
+    _require_profiling()
+    sampler = get_route_sampler()
+    return {"samples": sampler.samples, "routes": sampler.hot_stacks(top)}
+
+
+@router.get("/profiles/{request_id}", response_class=PlainTextResponse)
+async def get_profile(request_id: str):
+    """요청 프로파일 조회 (샘플링은 flamegraph용 folded 스택, cProfile은 pstats 텍스트)"""
+    _require_profiling()
+    profile = get_profile_store().get(request_id)
+    if profile is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="프로파일을 찾을 수 없습니다")
+    return PlainTextResponse(profile.render())
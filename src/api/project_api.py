@@ -1,3 +1,78 @@
-from fastapi import APIRouter, Depends
+from typing import Dict, List, Optional
 
-router = APIRouter() 
\ No newline at end of file
+from fastapi import APIRouter, Depends, HTTPException, Path, status
+
+from api.dependency import get_loaders, get_project_service
+from api.schemas.project_schema import ProjectMemberResponse, ProjectResponse
+from api.serialization import user_to_dict
+from domain import User
+from domain.project import ProjectMember
+from exception.domain import ProjectNotFoundException
+from monitoring import query_budget
+from monitoring.route import TimedRoute
+from repository.loader import Loaders
+from service.project_service import ProjectService
+
+router = APIRouter(prefix="/projects", tags=["Projects"], route_class=TimedRoute)
+
+
+def _member_to_dict(member: ProjectMember, users: Dict[int, Optional[User]]) -> dict:
+    user = users.get(member.user_id)
+    return {
+        "id": member.id,
+        "project_id": member.project_id,
+        "user_id": member.user_id,
+        "role": member.role,
+        "invited_by": member.invited_by,
+        "created_at": member.created_at,
+        "user": user_to_dict(user) if user is not None else None,
+    }
+
+
+async def _load_users(loaders: Loaders, user_ids: List[int]) -> Dict[int, Optional[User]]:
+    # 멤버마다 get_by_id를 호출하지 않고 같은 tick의 조회를 IN 쿼리 하나로 묶음
+    user_ids = list(dict.fromkeys(user_ids))
+    return dict(zip(user_ids, await loaders.users.load_many(user_ids)))
+
+
+@router.get("/{project_id}", response_model=ProjectResponse)
+@query_budget(3)
+async def get_project(
+    project_id: int = Path(...),
+    loaders: Loaders = Depends(get_loaders)
+):
+    """프로젝트와 소유자, 멤버(사용자 정보 포함) 조회"""
+    project = await loaders.projects.load(project_id)
+    if project is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(ProjectNotFoundException(str(project_id))))
+
+    users = await _load_users(loaders, [project.owner_id, *(member.user_id for member in project.members)])
+    owner = users.get(project.owner_id)
+    return {
+        "id": project.id,
+        "name": project.name,
+        "description": project.description,
+        "owner_id": project.owner_id,
+        "tenant_id": project.tenant_id,
+        "created_at": project.created_at,
+        "updated_at": project.updated_at,
+        "owner": user_to_dict(owner) if owner is not None else None,
+        "members": [_member_to_dict(member, users) for member in project.members],
+    }
+
+
+@router.get("/{project_id}/members", response_model=List[ProjectMemberResponse])
+@query_budget(3)
+async def get_project_members(
+    project_id: int = Path(...),
+    project_service: ProjectService = Depends(get_project_service),
+    loaders: Loaders = Depends(get_loaders)
+):
+    """프로젝트 멤버 목록 조회 (사용자 정보 포함)"""
+    try:
+        members = await project_service.get_project_members(project_id)
+    except ProjectNotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    users = await _load_users(loaders, [member.user_id for member in members])
+    return [_member_to_dict(member, users) for member in members]
@@ -0,0 +1,27 @@
+from pydantic import BaseModel
+from typing import Optional, List
+from datetime import datetime
+
+from api.schemas.user_schema import UserResponse
+
+
+class ProjectMemberResponse(BaseModel):
+    id: int
+    project_id: int
+    user_id: int
+    role: str
+    invited_by: Optional[int] = None
+    created_at: datetime
+    user: Optional[UserResponse] = None
+
+
+class ProjectResponse(BaseModel):
+    id: int
+    name: str
+    description: Optional[str] = None
+    owner_id: int
+    tenant_id: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    owner: Optional[UserResponse] = None
+    members: List[ProjectMemberResponse] = []
@@ -38,3 +38,9 @@ class UserResponse(UserBase):
 
     class Config:
         orm_mode = True
+
+
+
+class UserBatchResponse(BaseModel):
+    users: List[UserResponse]
+    missing_ids: List[int]
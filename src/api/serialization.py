@@ -0,0 +1,61 @@
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterable, List
+
+from fastapi.responses import Response
+
+from config import APIConfig
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson은 선택 의존성
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__}은 JSON으로 직렬화할 수 없습니다")
+
+
+def dumps(content: Any) -> bytes:
+    """orjson이 있으면 orjson으로, 없으면 표준 json으로 인코딩합니다."""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(Response):
+    """검증을 마친 dict/list를 그대로 인코딩하는 JSON 응답"""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def user_to_dict(user) -> Dict[str, Any]:
+    """도메인 User를 UserResponse와 같은 형태의 dict로 변환합니다. (신뢰할 수 있는 도메인 객체 전용)"""
+    return {
+        "email": user.email,
+        "name": user.name,
+        "id": user.id,
+        "tenant_id": user.tenant_id,
+        "is_admin": user.is_admin,
+        "email_verified": user.email_verified,
+        "created_at": user.created_at,
+        "updated_at": user.updated_at,
+    }
+
+
+def users_response(users: Iterable, headers: Dict[str, str] = None, fast: bool = None):
+    """
+    사용자 목록 응답을 생성합니다.
+
+    빠른 직렬화 모드에서는 response_model 검증을 거치지 않는 FastJSONResponse를,
+    그 외에는 FastAPI가 UserResponse로 직렬화할 목록을 그대로 반환합니다.
+    """
+    fast = APIConfig.FAST_SERIALIZATION if fast is None else fast
+    if not fast:
+        return users
+    return FastJSONResponse([user_to_dict(user) for user in users], headers=headers)
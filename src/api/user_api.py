@@ -1,43 +1,106 @@
-from fastapi import APIRouter, Depends, Path, Query, HTTPException, status
+from fastapi import APIRouter, Depends, Path, Query, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
 from typing import List
 
 from service.user_service import UserService
-from api.dependency import get_user_service
+from db.session import PgSessionManager
+from repository.pg import UserPgRepository
+from api.dependency import get_user_service, get_read_user_service, get_tenant_session_manager, open_read_session
+from api.export import EXPORT_MEDIA_TYPES, stream_users_export
+from api.serialization import users_response
+from api.etag import make_etag, user_etag, users_etag, is_not_modified, not_modified_response
 from api.schemas.user_schema import (
     UserCreate, 
     UserUpdate, 
     UserResponse, 
+    UserBatchResponse,
     PasswordChange,
     EmailVerification
 )
+from monitoring import query_budget
+from monitoring.route import TimedRoute
 
-router = APIRouter(prefix="/users", tags=["Users"])
+router = APIRouter(prefix="/users", tags=["Users"], route_class=TimedRoute)
+
+# 일괄 조회 한 번에 요청할 수 있는 최대 ID 수
+MAX_BATCH_IDS = 5000
 
 @router.get("", response_model=List[UserResponse])
+@query_budget(2)
 async def get_users(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
-    user_service: UserService = Depends(get_user_service)
+    user_service: UserService = Depends(get_read_user_service)
 ):
     """모든 사용자 조회"""
-    return await user_service.get_all_users(skip, limit)
+    if request.headers.get("if-none-match"):
+        etag = make_etag(await user_service.get_user_versions(skip, limit))
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+
+    users = await user_service.get_all_user(skip, limit)
+    etag = users_etag(users)
+    response.headers["ETag"] = etag
+    return users_response(users, headers={"ETag": etag})
 
 @router.get("/admins", response_model=List[UserResponse])
+@query_budget(2)
 async def get_admin_users(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
-    user_service: UserService = Depends(get_user_service)
+    user_service: UserService = Depends(get_read_user_service)
 ):
     """관리자 사용자 목록 조회"""
-    return await user_service.get_admin_users(skip, limit)
+    if request.headers.get("if-none-match"):
+        etag = make_etag(await user_service.get_user_versions(skip, limit, admin_only=True))
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+
+    users = await user_service.get_admin_users(skip, limit)
+    etag = users_etag(users)
+    response.headers["ETag"] = etag
+    return users_response(users, headers={"ETag": etag})
+
+@router.get("/batch", response_model=UserBatchResponse)
+@query_budget(1)
+async def get_users_by_ids(
+    ids: str = Query(..., description="콤마로 구분된 사용자 ID 목록"),
+    user_service: UserService = Depends(get_read_user_service)
+):
+    """여러 사용자 일괄 조회 (없는 ID는 missing_ids로 반환)"""
+    try:
+        user_ids = [int(id) for id in ids.split(",") if id.strip()]
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="ids는 콤마로 구분된 정수여야 합니다")
+    if len(user_ids) > MAX_BATCH_IDS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"한 번에 최대 {MAX_BATCH_IDS}개까지 조회할 수 있습니다")
+
+    users, missing_ids = await user_service.get_users_by_ids(user_ids)
+    return {"users": users, "missing_ids": missing_ids}
 
 @router.get("/{user_id}", response_model=UserResponse)
+@query_budget(2)
 async def get_user(
+    request: Request,
+    response: Response,
     user_id: int = Path(...),
     user_service: UserService = Depends(get_user_service)
 ):
     """특정 사용자 조회"""
-    return await user_service.get_user_by_id(user_id)
+    if request.headers.get("if-none-match"):
+        updated_at = await user_service.get_user_version(user_id)
+        if updated_at is not None:
+            etag = make_etag([(user_id, updated_at)])
+            if is_not_modified(request, etag):
+                return not_modified_response(etag)
+
+    user = await user_service.get_user_by_id(user_id)
+    response.headers["ETag"] = user_etag(user)
+    return user
 
 @router.post("", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def create_user(
@@ -60,12 +123,13 @@ async def update_user(
     user_service: UserService = Depends(get_user_service)
 ):
     """사용자 정보 업데이트"""
-    user = await user_service.get_user_by_id(user_id)
+    user = await user_service.get_user_by_id(user_id, with_credentials=True)
     
     if user_data.name:
         user.name = user_data.name
     if user_data.email:
         user.email = user_data.email
+    user.update_timestamp()
     
     return await user_service.update_user(user)
 
@@ -111,14 +175,47 @@ async def verify_user_email(
     return await user_service.verify_email(user_id, verification_data.email_code)
 
 @router.get("/by-tenant/{tenant_id}", response_model=List[UserResponse])
+@query_budget(2)
 async def get_users_by_tenant(
+    request: Request,
+    response: Response,
     tenant_id: int = Path(...),
     skip: int = 0,
     limit: int = 100,
-    user_service: UserService = Depends(get_user_service)
+    user_service: UserService = Depends(get_read_user_service)
 ):
     """테넌트별 사용자 목록 조회"""
-    return await user_service.get_users_by_tenant(tenant_id, skip, limit)
+    if request.headers.get("if-none-match"):
+        etag = make_etag(await user_service.get_user_versions(skip, limit, tenant_id=tenant_id))
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+
+    users = await user_service.get_users_by_tenant(tenant_id, skip, limit)
+    etag = users_etag(users)
+    response.headers["ETag"] = etag
+    return users_response(users, headers={"ETag": etag})
+
+@router.get("/by-tenant/{tenant_id}/export")
+async def export_users_by_tenant(
+    request: Request,
+    tenant_id: int = Path(...),
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    session_manager: PgSessionManager = Depends(get_tenant_session_manager)
+):
+    """테넌트 사용자 전체를 NDJSON/CSV로 스트리밍 내보내기"""
+    async def export_chunks():
+        # 응답 스트리밍이 끝날 때까지 세션을 유지해야 하므로 의존성 대신 본문 안에서 직접 세션을 엶
+        # (본문을 보내지 않고 끝난 응답은 세션을 열지 않음)
+        async with open_read_session(request, session_manager, tenant_id) as session:
+            user_service = UserService(UserPgRepository(session))
+            async for chunk in stream_users_export(user_service.stream_users_by_tenant(tenant_id), format, label=f"tenant={tenant_id}"):
+                yield chunk
+
+    return StreamingResponse(
+        export_chunks(),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="tenant-{tenant_id}-users.{format}"'}
+    )
 
 @router.get("/by-email", response_model=UserResponse)
 async def get_user_by_email(
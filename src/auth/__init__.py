@@ -1,2 +1,2 @@
 from auth.jwt import create_access_token
-from auth.security import get_current_user
\ No newline at end of file
+from auth.security import get_current_user, get_current_active_user, get_current_admin_user
\ No newline at end of file
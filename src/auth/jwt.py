@@ -6,9 +6,11 @@ from passlib.context import CryptContext
 from fastapi import HTTPException, status
 
 from config import AuthConfig
+from monitoring.timing import timed_function
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+@timed_function("jwt")
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     """
     JWT 액세스 토큰을 생성합니다.
@@ -26,6 +28,7 @@ def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta]
     return encoded_jwt
 
 
+@timed_function("jwt")
 def decode_token(token: str) -> Dict[str, Any]:
     """
     JWT 토큰을 디코딩합니다.
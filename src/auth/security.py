@@ -1,22 +1,25 @@
+from typing import AsyncContextManager, Callable
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from typing import Optional
+from jose import JWTError
 
 from domain import User
 from auth.jwt import decode_token
 from service.user_service import UserService
-from api.dependency import get_user_service
-from api.schemas.auth_schema import TokenData
+from api.dependency import get_auth_user_service_factory
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="login")
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    user_service: UserService = Depends(get_user_service)
+    open_user_service: Callable[[], AsyncContextManager[UserService]] = Depends(get_auth_user_service_factory)
 ) -> User:
     """
     현재 인증된 사용자를 가져옵니다.
+
+    auth lane 세션은 사용자 조회 동안만 열고 바로 반납하므로, 엔드포인트가 실행되는 동안에는
+    엔드포인트 자신의 세션만 커넥션을 사용합니다.
     """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -34,8 +37,32 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
     
-    user = await user_service.get_user_by_id(user_id)
+    async with open_user_service() as user_service:
+        user = await user_service.get_user_by_id(int(user_id))
     if user is None:
         raise credentials_exception
     
-    return user
\ No newline at end of file
+    return user
+
+
+async def get_current_active_user(
+    current_user: User = Depends(get_current_user)
+) -> User:
+    """
+    현재 인증된 활성 사용자를 가져옵니다.
+    """
+    return current_user
+
+
+async def get_current_admin_user(
+    current_user: User = Depends(get_current_active_user)
+) -> User:
+    """
+    현재 인증된 관리자 사용자를 가져옵니다.
+    """
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자 권한이 필요합니다",
+        )
+    return current_user
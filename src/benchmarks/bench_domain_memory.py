@@ -0,0 +1,83 @@
+"""
+도메인 객체 메모리 사용량 벤치마크
+
+DB에서 읽은 행처럼 엔티티마다 새 datetime 객체를 받아 User/Project/ProjectMember/Tenant를
+count개 생성하고, tracemalloc으로 목록이 유지하는 메모리를 엔티티당 바이트로 출력합니다.
+(생성 중에만 쓰이고 버려지는 임시 객체는 포함되지 않음)
+
+    cd src && python -m benchmarks.bench_domain_memory --count 100000
+"""
+import argparse
+import gc
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Callable, List
+
+from domain import Project, ProjectMember, Tenant, User
+
+BASE_TIME = datetime(2024, 1, 1)
+
+
+def _timestamps(i: int):
+    # DB 드라이버는 컬럼마다 별도의 datetime 객체를 만듦
+    return BASE_TIME + timedelta(seconds=i), BASE_TIME + timedelta(seconds=i)
+
+
+def make_user(i: int) -> User:
+    created_at, updated_at = _timestamps(i)
+    return User(
+        id=i, email=f"user{i}@example.com", name=f"User {i}", password_hash="$2b$12$" + "x" * 53,
+        tenant_id=1, created_at=created_at, updated_at=updated_at,
+    )
+
+
+def make_project(i: int) -> Project:
+    created_at, updated_at = _timestamps(i)
+    return Project(id=i, name=f"Project {i}", description=None, owner_id=i, tenant_id=1, created_at=created_at, updated_at=updated_at)
+
+
+def make_member(i: int) -> ProjectMember:
+    created_at, updated_at = _timestamps(i)
+    return ProjectMember(id=i, project_id=i, user_id=i, role="VIEWER", invited_by=1, created_at=created_at, updated_at=updated_at)
+
+
+def make_tenant(i: int) -> Tenant:
+    created_at, updated_at = _timestamps(i)
+    return Tenant(id=i, name=f"Tenant {i}", created_at=created_at, updated_at=updated_at)
+
+
+FACTORIES = {
+    "User": make_user,
+    "Project": make_project,
+    "ProjectMember": make_member,
+    "Tenant": make_tenant,
+}
+
+
+def retained_bytes(factory: Callable[[int], object], count: int) -> int:
+    """factory로 만든 count개의 엔티티 목록이 유지하는 메모리(바이트)"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        entities: List[object] = [factory(i) for i in range(count)]
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del entities
+    return retained
+
+
+def main(count: int) -> None:
+    print(f"{'entity':<15} {'count':>8} {'total MiB':>10} {'bytes/entity':>13}")
+    for name, factory in FACTORIES.items():
+        retained = retained_bytes(factory, count)
+        print(f"{name:<15} {count:>8} {retained / 2 ** 20:>10.2f} {retained / count:>13.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="도메인 객체 메모리 사용량 벤치마크 (tracemalloc)")
+    parser.add_argument("--count", type=int, default=100000, help="종류별로 생성할 엔티티 수")
+    args = parser.parse_args()
+    main(args.count)
@@ -0,0 +1,248 @@
+"""
+요청마다 실행되는 도메인/인증/매핑 경로 마이크로벤치마크
+
+JWT 발급/검증, DB 모델 <-> 도메인 변환, 역할 권한 조회, 이메일 코드 생성,
+UserResponse 직렬화의 호출당 시간을 측정하고 저장된 기준값(baseline)과 비교합니다.
+기준값보다 중앙값이 threshold 비율 이상 느려진 벤치마크가 있으면 종료 코드 1을 반환합니다.
+
+기준값은 측정한 머신에 종속되므로 비교할 머신(CI 등)에서 다시 저장해야 합니다.
+
+    cd src && python -m benchmarks.bench_hot_paths --save-baseline
+    cd src && python -m benchmarks.bench_hot_paths --threshold 0.2
+    cd src && python -m benchmarks.bench_hot_paths --filter jwt
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from contextlib import ExitStack, contextmanager
+from datetime import datetime
+from typing import Callable, Dict, List
+from unittest.mock import patch
+
+from api.schemas.user_schema import UserResponse
+from api.serialization import dumps, user_to_dict
+from auth.jwt import create_access_token, decode_token
+from config import AuthConfig
+from db.model.project import ProjectModel, ProjectMemberModel
+from db.model.user import UserModel
+from domain import User
+from domain.permission import ROLE_ACTIONS, Action
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+DEFAULT_THRESHOLD = 0.25
+LARGE_PROJECT_MEMBERS = 1000
+USER_LIST_SIZE = 100
+
+
+def _user(i: int = 1) -> User:
+    now = datetime(2024, 1, 1)
+    return User(
+        id=i, email=f"user{i}@example.com", name=f"User {i}", password_hash="hash",
+        tenant_id=1, created_at=now, updated_at=now,
+    )
+
+
+@contextmanager
+def jwt_config():
+    """환경 변수 없이 실행해도 측정할 수 있도록 비어 있는 JWT 설정만 블록 안에서 채우고 되돌립니다."""
+    with ExitStack() as stack:
+        if not AuthConfig.SECRET_KEY:
+            stack.enter_context(patch.object(AuthConfig, "SECRET_KEY", "benchmark-secret"))
+        if not AuthConfig.ALGORITHM:
+            stack.enter_context(patch.object(AuthConfig, "ALGORITHM", "HS256"))
+        yield
+
+
+def bench_create_access_token() -> Callable:
+    data = {"sub": "user1@example.com", "tenant_id": 1}
+    return lambda: create_access_token(data)
+
+
+def bench_decode_token() -> Callable:
+    token = create_access_token({"sub": "user1@example.com", "tenant_id": 1})
+    return lambda: decode_token(token)
+
+
+def bench_user_model_to_domain() -> Callable:
+    model = UserModel.from_domain(_user())
+    return model.to_domain
+
+
+def bench_user_model_from_domain() -> Callable:
+    user = _user()
+    return lambda: UserModel.from_domain(user)
+
+
+def bench_project_model_to_domain_large() -> Callable:
+    now = datetime(2024, 1, 1)
+    model = ProjectModel(id=1, name="project", description="", owner_id=1, tenant_id=1, created_at=now, updated_at=now)
+    model.members = [
+        ProjectMemberModel(id=i, project_id=1, user_id=i, role="VIEWER", invited_by=1, created_at=now, updated_at=now)
+        for i in range(1, LARGE_PROJECT_MEMBERS + 1)
+    ]
+    return model.to_domain
+
+
+def bench_role_actions_check() -> Callable:
+    checks = [(role, action) for role in (*ROLE_ACTIONS, "UNKNOWN") for action in Action]
+
+    def run():
+        for role, action in checks:
+            role in ROLE_ACTIONS and action in ROLE_ACTIONS[role]
+
+    return run
+
+
+def bench_generate_email_code() -> Callable:
+    user = _user()
+    return user.generate_email_code
+
+
+def bench_user_response_serialize() -> Callable:
+    user = _user()
+    return lambda: UserResponse.model_validate(user, from_attributes=True).model_dump_json()
+
+
+def bench_user_list_response_serialize() -> Callable:
+    users = [_user(i) for i in range(1, USER_LIST_SIZE + 1)]
+    return lambda: [UserResponse.model_validate(user, from_attributes=True).model_dump(mode="json") for user in users]
+
+
+def bench_user_list_fast_serialize() -> Callable:
+    users = [_user(i) for i in range(1, USER_LIST_SIZE + 1)]
+    return lambda: dumps([user_to_dict(user) for user in users])
+
+
+BENCHMARKS: Dict[str, Callable[[], Callable]] = {
+    "jwt.create_access_token": bench_create_access_token,
+    "jwt.decode_token": bench_decode_token,
+    "mapping.user_to_domain": bench_user_model_to_domain,
+    "mapping.user_from_domain": bench_user_model_from_domain,
+    f"mapping.project_to_domain_{LARGE_PROJECT_MEMBERS}_members": bench_project_model_to_domain_large,
+    "domain.role_actions_check": bench_role_actions_check,
+    "domain.generate_email_code": bench_generate_email_code,
+    "schema.user_response": bench_user_response_serialize,
+    f"schema.user_response_list_{USER_LIST_SIZE}": bench_user_list_response_serialize,
+    f"schema.user_fast_list_{USER_LIST_SIZE}": bench_user_list_fast_serialize,
+}
+
+
+def measure(fn: Callable, rounds: int = 7, min_round_time: float = 0.1) -> Dict:
+    """
+    한 라운드가 min_round_time 이상 걸리도록 반복 횟수를 정한 뒤 rounds번 측정합니다.
+
+    라운드별 호출당 시간의 중앙값(median_us)을 비교 기준으로 사용합니다.
+    """
+    fn()  # 워밍업
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_round_time:
+            break
+        number *= 2 if elapsed == 0 else max(2, min(10, int(min_round_time / elapsed) + 1))
+
+    per_call = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        per_call.append((time.perf_counter() - started) / number)
+    return {
+        "number": number,
+        "rounds": rounds,
+        "min_us": round(min(per_call) * 1e6, 3),
+        "median_us": round(statistics.median(per_call) * 1e6, 3),
+    }
+
+
+def run(names: List[str], rounds: int, min_round_time: float) -> Dict[str, Dict]:
+    results = {}
+    with jwt_config():
+        for name in names:
+            results[name] = measure(BENCHMARKS[name](), rounds, min_round_time)
+            print(f"{name:<45} {results[name]['median_us']:>12.2f}us {results[name]['min_us']:>12.2f}us")
+    return results
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float) -> List[Dict]:
+    """기준값 대비 중앙값 변화율을 계산하고, threshold를 넘은 항목에 regression을 표시합니다."""
+    rows = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None or not base.get("median_us"):
+            continue
+        change = result["median_us"] / base["median_us"] - 1
+        rows.append({
+            "name": name,
+            "baseline_us": base["median_us"],
+            "current_us": result["median_us"],
+            "change": round(change, 4),
+            "regression": change > threshold,
+        })
+    return rows
+
+
+def load_baseline(path: str) -> Dict[str, Dict]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["benchmarks"]
+
+
+def save_baseline(path: str, results: Dict[str, Dict]) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "benchmarks": results,
+        }, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+
+def main(args) -> int:
+    names = [name for name in BENCHMARKS if not args.filter or args.filter in name]
+    if not names:
+        print(f"'{args.filter}'와 일치하는 벤치마크가 없습니다.")
+        return 1
+
+    print(f"{'benchmark':<45} {'median':>14} {'min':>14}")
+    results = run(names, args.rounds, args.min_round_time)
+
+    if args.save_baseline:
+        saved = load_baseline(args.baseline) if args.filter and os.path.exists(args.baseline) else {}
+        saved.update(results)
+        save_baseline(args.baseline, saved)
+        print(f"\n기준값을 {args.baseline}에 저장했습니다.")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\n기준값 파일({args.baseline})이 없어 비교하지 않습니다. --save-baseline으로 저장하세요.")
+        return 0
+
+    rows = compare(results, load_baseline(args.baseline), args.threshold)
+    print(f"\n기준값 대비 (허용 {args.threshold:+.0%})")
+    for row in rows:
+        mark = "  REGRESSION" if row["regression"] else ""
+        print(f"  {row['name']:<45} {row['baseline_us']:>10.2f}us -> {row['current_us']:>10.2f}us {row['change']:>+8.1%}{mark}")
+    regressions = [row["name"] for row in rows if row["regression"]]
+    if regressions:
+        print(f"\n성능 저하: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="도메인/인증/매핑 경로 마이크로벤치마크")
+    parser.add_argument("--filter", help="이름에 이 문자열이 포함된 벤치마크만 실행")
+    parser.add_argument("--rounds", type=int, default=7, help="벤치마크별 측정 라운드 수")
+    parser.add_argument("--min-round-time", type=float, default=0.1, help="라운드 하나의 최소 측정 시간(초)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="기준값 JSON 경로")
+    parser.add_argument("--save-baseline", action="store_true", help="측정 결과를 기준값으로 저장")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="허용하는 중앙값 증가 비율 (0.25 = 25%%)")
+    sys.exit(main(parser.parse_args()))
@@ -0,0 +1,77 @@
+"""
+사용자 목록 응답 직렬화 벤치마크
+
+기본 경로(response_model 검증 + 표준 JSON)와 빠른 직렬화 경로(FAST_SERIALIZATION)의
+단일 코어 처리량(requests/s)을 100개, 1000개 목록에 대해 비교합니다.
+DB를 거치지 않도록 서비스 의존성을 고정 목록을 반환하는 서비스로 대체합니다.
+
+    cd src && python -m benchmarks.bench_user_list --seconds 3
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime
+
+import httpx
+from fastapi import FastAPI
+
+from api.dependency import get_read_user_service
+from api.user_api import router
+from config import APIConfig
+from domain import User
+
+
+class StaticUserService:
+    def __init__(self, users):
+        self.users = users
+
+    async def get_all_user(self, skip: int = 0, limit: int = 100):
+        return self.users[:limit]
+
+
+def build_app(size: int) -> FastAPI:
+    now = datetime.now()
+    users = [
+        User(id=i, email=f"user{i}@example.com", name=f"User {i}", password_hash=None, tenant_id=1, created_at=now, updated_at=now)
+        for i in range(1, size + 1)
+    ]
+    service = StaticUserService(users)
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_read_user_service] = lambda: service
+    return app
+
+
+async def measure(app: FastAPI, size: int, seconds: float) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # 워밍업
+        for _ in range(10):
+            (await client.get("/users", params={"limit": size})).raise_for_status()
+
+        count = 0
+        started = time.perf_counter()
+        while time.perf_counter() - started < seconds:
+            (await client.get("/users", params={"limit": size})).raise_for_status()
+            count += 1
+        return count / (time.perf_counter() - started)
+
+
+async def main(seconds: float) -> None:
+    print(f"{'items':>6} {'mode':>8} {'req/s':>10}")
+    for size in (100, 1000):
+        app = build_app(size)
+        results = {}
+        for mode, fast in (("default", False), ("fast", True)):
+            APIConfig.FAST_SERIALIZATION = fast
+            results[mode] = await measure(app, size, seconds)
+            print(f"{size:>6} {mode:>8} {results[mode]:>10.1f}")
+        print(f"{size:>6} {'speedup':>8} {results['fast'] / results['default']:>9.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="사용자 목록 직렬화 벤치마크 (단일 코어)")
+    parser.add_argument("--seconds", type=float, default=3.0, help="모드별 측정 시간(초)")
+    args = parser.parse_args()
+    asyncio.run(main(args.seconds))
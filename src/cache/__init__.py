@@ -0,0 +1,4 @@
+from cache.tenant_cache import TenantCache, get_tenant_cache
+from cache.user_cache import UserCache, get_user_cache, strip_credentials
+from cache.single_flight import SingleFlight, coalesce, single_flight
+from cache.email_filter import CountingBloomFilter, EmailExistenceFilter, get_email_filter
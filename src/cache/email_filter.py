@@ -0,0 +1,193 @@
+import asyncio
+import hashlib
+import logging
+import math
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Iterable, List, Optional, Set
+
+from config import CacheConfig
+
+logger = logging.getLogger("notaai.email_filter")
+
+
+class CountingBloomFilter:
+    """
+    삭제를 지원하는 counting Bloom filter입니다.
+
+    `might_contain`이 False이면 확실히 없는 값이고, True이면 있을 수도 있는 값입니다.
+    각 칸은 1바이트 카운터이며, 255에 도달한 칸은 더 이상 감소시키지 않습니다.
+    """
+
+    MAX_COUNT = 255
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        capacity = max(1, capacity)
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.counters = bytearray(self.size)
+        self.count = 0
+
+    def _positions(self, value: str) -> List[int]:
+        # 하나의 해시를 두 값으로 나눠 k개의 위치를 만드는 double hashing
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, value: str) -> None:
+        for position in self._positions(value):
+            if self.counters[position] < self.MAX_COUNT:
+                self.counters[position] += 1
+        self.count += 1
+
+    def remove(self, value: str) -> None:
+        positions = self._positions(value)
+        if not all(self.counters[position] for position in positions):
+            return
+        for position in positions:
+            if 0 < self.counters[position] < self.MAX_COUNT:
+                self.counters[position] -= 1
+        self.count -= 1
+
+    def might_contain(self, value: str) -> bool:
+        return all(self.counters[position] for position in self._positions(value))
+
+
+class EmailExistenceFilter:
+    """
+    가입된 이메일의 존재 여부를 빠르게 추정하는 필터입니다.
+
+    시작 시 전체 이메일로 구성하고 이 프로세스의 가입/삭제 시 갱신합니다. 다른 프로세스에서
+    가입하거나 변경한 이메일은 sync_seconds마다 `sync`로 수정 시각(updated_at 인덱스) 이후의
+    이메일만 읽어 추가하므로, 없다는 답(False)이 틀릴 수 있는 시간은 동기화 간격으로 제한됩니다.
+    커밋이 sync_overlap_seconds보다 늦게 끝난 행은 rebuild_seconds마다의 전체 재구성에서 반영됩니다.
+    다른 프로세스의 삭제는 반영되지 않지만, 남은 이메일은 있다고 판별되어 DB 조회로 이어질 뿐입니다.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1000000,
+        error_rate: float = 0.01,
+        rebuild_seconds: float = 300,
+        sync_seconds: float = 2,
+        sync_overlap_seconds: float = 5,
+    ):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.rebuild_seconds = rebuild_seconds
+        self.sync_seconds = sync_seconds
+        self.sync_overlap_seconds = sync_overlap_seconds
+        self._filter: Optional[CountingBloomFilter] = None
+        self._added_during_rebuild: Optional[List[str]] = None
+        self._synced_at: Optional[datetime] = None
+        self._last_synced: Set[str] = set()
+
+        self.negatives = 0
+        self.positives = 0
+        self.synced = 0
+
+    def is_ready(self) -> bool:
+        return self._filter is not None
+
+    def build(self, emails: Iterable[str]) -> None:
+        """이메일 목록으로 필터를 새로 구성합니다."""
+        emails = list(emails)
+        bloom = CountingBloomFilter(max(self.capacity, len(emails) * 2), self.error_rate)
+        for email in emails:
+            bloom.add(email)
+        self._filter = bloom
+
+    async def rebuild(self, load_emails: Callable[[], Awaitable[List[str]]]) -> None:
+        """전체 이메일을 다시 읽어 필터를 재구성합니다. 재구성 중에 추가된 이메일도 반영합니다."""
+        self._added_during_rebuild = []
+        started = datetime.now()
+        try:
+            emails = await load_emails()
+            self.build([*emails, *self._added_during_rebuild])
+            self._synced_at = started
+            self._last_synced = set()
+        finally:
+            self._added_during_rebuild = None
+
+    async def sync(self, load_emails_since: Callable[[datetime], Awaitable[List[str]]]) -> int:
+        """
+        마지막 동기화 이후 수정된 사용자의 이메일을 필터에 추가하고 새로 추가한 수를 반환합니다.
+
+        늦게 커밋된 행을 놓치지 않도록 sync_overlap_seconds만큼 겹쳐 읽고,
+        직전 동기화에서 이미 추가한 이메일은 다시 추가하지 않습니다.
+        """
+        if self._filter is None or self._synced_at is None:
+            return 0
+        started = datetime.now()
+        emails = set(await load_emails_since(self._synced_at - timedelta(seconds=self.sync_overlap_seconds)))
+        added = emails - self._last_synced
+        for email in added:
+            self.add(email)
+        self._synced_at = started
+        self._last_synced = emails
+        self.synced += len(added)
+        return len(added)
+
+    async def run_rebuild_loop(self, load_emails: Callable[[], Awaitable[List[str]]]) -> None:
+        """주기적으로 필터를 재구성하는 백그라운드 루프"""
+        while True:
+            await asyncio.sleep(self.rebuild_seconds)
+            try:
+                await self.rebuild(load_emails)
+            except Exception as e:
+                logger.warning("이메일 필터 재구성 실패: %s", e)
+
+    async def run_sync_loop(self, load_emails_since: Callable[[datetime], Awaitable[List[str]]]) -> None:
+        """다른 프로세스에서 가입한 이메일을 주기적으로 반영하는 백그라운드 루프"""
+        while True:
+            await asyncio.sleep(self.sync_seconds)
+            try:
+                await self.sync(load_emails_since)
+            except Exception as e:
+                logger.warning("이메일 필터 동기화 실패: %s", e)
+
+    def might_exist(self, email: str) -> bool:
+        """False이면 가입되지 않은 이메일입니다. (다른 프로세스의 가입은 동기화 간격만큼 늦게 반영)"""
+        if self._filter is None:
+            return True
+        if self._filter.might_contain(email):
+            self.positives += 1
+            return True
+        self.negatives += 1
+        return False
+
+    def add(self, email: str) -> None:
+        if self._added_during_rebuild is not None:
+            self._added_during_rebuild.append(email)
+        if self._filter is not None:
+            self._filter.add(email)
+
+    def remove(self, email: str) -> None:
+        if self._filter is not None:
+            self._filter.remove(email)
+
+    def stats(self) -> dict:
+        return {
+            "ready": self.is_ready(),
+            "emails": self._filter.count if self._filter else 0,
+            "size": self._filter.size if self._filter else 0,
+            "negatives": self.negatives,
+            "positives": self.positives,
+            "synced": self.synced,
+        }
+
+
+email_filter: Optional[EmailExistenceFilter] = None
+
+
+def get_email_filter() -> EmailExistenceFilter:
+    """애플리케이션 전역 이메일 필터를 반환합니다 (최초 호출 시 생성)"""
+    global email_filter
+    if email_filter is None:
+        email_filter = EmailExistenceFilter(
+            CacheConfig.EMAIL_FILTER_CAPACITY,
+            CacheConfig.EMAIL_FILTER_ERROR_RATE,
+            CacheConfig.EMAIL_FILTER_REBUILD_SECONDS,
+            CacheConfig.EMAIL_FILTER_SYNC_SECONDS,
+        )
+    return email_filter
@@ -0,0 +1,90 @@
+import asyncio
+import copy
+import functools
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """
+    같은 키로 동시에 들어온 조회를 하나의 실행으로 합치는 그룹입니다.
+
+    먼저 들어온 호출(leader)만 실제로 실행하고, 실행 중에 같은 키로 들어온 호출(follower)은
+    그 결과를 함께 받습니다. follower는 결과의 깊은 복사본을 받으므로 서로의 객체를
+    수정해도 영향을 주지 않습니다. leader가 취소되면 대기 중인 follower가 직접 다시 실행합니다.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.executed = 0
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        while True:
+            call = self._calls.get(key)
+            if call is None:
+                break
+            try:
+                result = await asyncio.shield(call)
+            except asyncio.CancelledError:
+                if call.cancelled():
+                    # leader가 취소된 경우 다시 시도
+                    continue
+                raise
+            self.shared += 1
+            return copy.deepcopy(result)
+
+        call = asyncio.get_running_loop().create_future()
+        self._calls[key] = call
+        self.executed += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            call.cancel()
+            raise
+        except BaseException as e:
+            call.set_exception(e)
+            # follower가 없으면 "exception was never retrieved" 경고가 나지 않도록 소비
+            call.exception()
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+
+single_flight = SingleFlight()
+
+
+def coalesce(method: Callable) -> Callable:
+    """
+    저장소 조회 메서드에 single-flight를 적용하는 데코레이터
+
+    같은 데이터베이스(세션이 바인딩된 엔진 URL)에 대한 같은 메서드, 같은 인자의 조회를 합칩니다.
+    세션의 조회가 primary/replica 중 어디로 가는지는 문장마다 정해지므로, 라우팅을 결정하는
+    세션 정보(읽기 전용 여부, 사용 중인 replica)가 같은 호출끼리만 합칩니다.
+    세션에서 이미 쓰기가 발생했거나 read-your-writes를 위해 primary로 고정된 경우에는
+    먼저 시작된 (쓰기 이전의) 조회 결과를 받으면 안 되므로 합치지 않습니다.
+    replica로 갈 읽기 전용 세션이 아직 replica를 고르지 않았다면 실제로 조회할 replica를
+    알 수 없으므로, 첫 조회로 replica가 정해질 때까지 합치지 않습니다.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        session = self.session
+        info = session.info
+        if info.get("has_writes") or info.get("force_primary") or session.bind is None:
+            return await method(self, *args, **kwargs)
+
+        router = info.get("replica_router")
+        if info.get("read_only") and info.get("replica_index") is None and router is not None and router.has_replicas():
+            return await method(self, *args, **kwargs)
+
+        route = (bool(info.get("read_only")), info.get("replica_index"))
+        key = (str(session.bind.url), route, method.__qualname__, args, tuple(sorted(kwargs.items())))
+        return await single_flight.do(key, lambda: method(self, *args, **kwargs))
+
+    return wrapper
@@ -0,0 +1,95 @@
+import asyncio
+import copy
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+
+from config import CacheConfig
+from domain import Tenant
+
+logger = logging.getLogger("notaai.tenant_cache")
+
+
+class TenantCache:
+    """
+    모든 테넌트를 메모리에 올려두는 read-through 캐시입니다.
+
+    시작 시 전체를 적재(load)하고 TTL마다 다시 적재하므로 대부분의 조회는 DB 쿼리가 필요하지 않습니다.
+    다른 프로세스가 만든 테넌트는 다음 적재 전까지 캐시에 없으므로, 캐시에 없는 테넌트는
+    DB에서 확인한 뒤 put으로 넣어야 합니다. 같은 프로세스의 저장/삭제는 즉시 반영됩니다.
+    """
+
+    def __init__(self, ttl_seconds: float = 300):
+        self.ttl_seconds = ttl_seconds
+        self._by_id: Dict[int, Tenant] = {}
+        self._by_name: Dict[str, Tenant] = {}
+        self.loaded_at: Optional[float] = None
+
+    def is_loaded(self) -> bool:
+        """전체 테넌트가 적재되었는지 확인합니다."""
+        return self.loaded_at is not None
+
+    def is_stale(self) -> bool:
+        """TTL이 지나 다시 적재해야 하는지 확인합니다."""
+        return self.loaded_at is None or time.monotonic() - self.loaded_at >= self.ttl_seconds
+
+    def load(self, tenants: Iterable[Tenant]) -> None:
+        """테넌트 전체를 캐시에 적재합니다."""
+        by_id = {tenant.id: tenant for tenant in tenants}
+        self._by_id = by_id
+        self._by_name = {tenant.name: tenant for tenant in by_id.values()}
+        self.loaded_at = time.monotonic()
+
+    def get_by_id(self, id: int) -> Optional[Tenant]:
+        """ID로 테넌트를 조회합니다."""
+        tenant = self._by_id.get(id)
+        return copy.copy(tenant) if tenant else None
+
+    def get_by_name(self, name: str) -> Optional[Tenant]:
+        """이름으로 테넌트를 조회합니다."""
+        tenant = self._by_name.get(name)
+        return copy.copy(tenant) if tenant else None
+
+    def exists(self, id: int) -> bool:
+        return id in self._by_id
+
+    def exists_by_name(self, name: str) -> bool:
+        return name in self._by_name
+
+    def put(self, tenant: Tenant) -> None:
+        """저장된 테넌트를 캐시에 반영합니다."""
+        self.remove(tenant.id)
+        tenant = copy.copy(tenant)
+        self._by_id[tenant.id] = tenant
+        self._by_name[tenant.name] = tenant
+
+    def remove(self, id: int) -> None:
+        """삭제된 테넌트를 캐시에서 제거합니다."""
+        tenant = self._by_id.pop(id, None)
+        if tenant is not None and self._by_name.get(tenant.name) is tenant:
+            del self._by_name[tenant.name]
+
+    async def refresh(self, load_all: Callable[[], Awaitable[List[Tenant]]]) -> None:
+        """load_all로 전체 테넌트를 다시 읽어 적재합니다."""
+        self.load(await load_all())
+
+    async def run_refresh_loop(self, load_all: Callable[[], Awaitable[List[Tenant]]]) -> None:
+        """TTL마다 전체 테넌트를 다시 적재하는 백그라운드 루프"""
+        while True:
+            await asyncio.sleep(self.ttl_seconds)
+            try:
+                await self.refresh(load_all)
+            except Exception as e:
+                # 갱신에 실패해도 기존 캐시로 계속 응답
+                logger.warning("테넌트 캐시 갱신 실패: %s", e)
+
+
+tenant_cache: Optional[TenantCache] = None
+
+
+def get_tenant_cache() -> TenantCache:
+    """애플리케이션 전역 테넌트 캐시를 반환합니다 (최초 호출 시 생성)"""
+    global tenant_cache
+    if tenant_cache is None:
+        tenant_cache = TenantCache(CacheConfig.TENANT_CACHE_TTL_SECONDS)
+    return tenant_cache
@@ -0,0 +1,200 @@
+import copy
+import json
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from config import CacheConfig
+from domain import User
+
+
+def strip_credentials(user: User) -> User:
+    """비밀번호 해시와 이메일 인증 코드를 제거한 사용자 사본을 반환합니다."""
+    user = copy.copy(user)
+    user.password_hash = None
+    user.email_code = None
+    user.email_code_expires_at = None
+    return user
+
+
+def _dump_user(user: User) -> str:
+    return json.dumps({
+        "id": user.id,
+        "email": user.email,
+        "name": user.name,
+        "tenant_id": user.tenant_id,
+        "is_admin": user.is_admin,
+        "email_verified": user.email_verified,
+        "created_at": user.created_at.isoformat() if user.created_at else None,
+        "updated_at": user.updated_at.isoformat() if user.updated_at else None,
+    })
+
+
+def _load_user(raw) -> User:
+    data = json.loads(raw)
+    user = User(
+        id=data["id"],
+        email=data["email"],
+        name=data["name"],
+        password_hash=None,
+        tenant_id=data["tenant_id"],
+        is_admin=data["is_admin"],
+        created_at=datetime.fromisoformat(data["created_at"]) if data["created_at"] else None,
+        updated_at=datetime.fromisoformat(data["updated_at"]) if data["updated_at"] else None,
+    )
+    user.email_verified = data["email_verified"]
+    return user
+
+
+class UserCache:
+    """
+    ID와 이메일로 조회하는 사용자 캐시입니다.
+
+    1차 캐시는 최대 `max_size`개를 보관하는 프로세스 내 LRU이고, `remote`에 Redis 프로토콜
+    클라이언트(get/set/delete를 지원하는 비동기 클라이언트)를 주면 2차 캐시로 함께 사용합니다.
+    캐시에는 비밀번호 해시와 인증 코드를 제거한 사용자만 저장합니다.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl_seconds: float = 60, remote: Any = None, key_prefix: str = "user"):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.remote = remote
+        self.key_prefix = key_prefix
+
+        self._entries: "OrderedDict[int, Tuple[float, User]]" = OrderedDict()
+        self._email_index: Dict[str, int] = {}
+
+        self.hits = 0
+        self.remote_hits = 0
+        self.misses = 0
+
+    def _id_key(self, user_id: int) -> str:
+        return f"{self.key_prefix}:id:{user_id}"
+
+    def _email_key(self, email: str) -> str:
+        return f"{self.key_prefix}:email:{email}"
+
+    def _get_local(self, user_id: int) -> Optional[User]:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        expires_at, user = entry
+        if time.monotonic() >= expires_at:
+            self._remove_local(user_id)
+            return None
+        self._entries.move_to_end(user_id)
+        return user
+
+    def _put_local(self, user: User) -> None:
+        self._remove_local(user.id)
+        self._entries[user.id] = (time.monotonic() + self.ttl_seconds, user)
+        self._email_index[user.email] = user.id
+        while len(self._entries) > self.max_size:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._drop_email(evicted)
+
+    def _remove_local(self, user_id: int) -> None:
+        entry = self._entries.pop(user_id, None)
+        if entry is not None:
+            self._drop_email(entry[1])
+
+    def _drop_email(self, user: User) -> None:
+        if self._email_index.get(user.email) == user.id:
+            del self._email_index[user.email]
+
+    async def _lookup(self, user_id: int) -> Optional[User]:
+        """1차 캐시, 2차 캐시 순서로 사용자를 찾습니다."""
+        user = self._get_local(user_id)
+        if user is not None or self.remote is None:
+            return user
+
+        raw = await self.remote.get(self._id_key(user_id))
+        if raw is None:
+            return None
+        user = _load_user(raw)
+        self._put_local(user)
+        self.remote_hits += 1
+        return user
+
+    def _result(self, user: Optional[User]) -> Optional[User]:
+        if user is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return copy.copy(user)
+
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        """ID로 캐시된 사용자를 조회합니다."""
+        return self._result(await self._lookup(user_id))
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """이메일로 캐시된 사용자를 조회합니다."""
+        user_id = self._email_index.get(email)
+        if user_id is None and self.remote is not None:
+            raw_id = await self.remote.get(self._email_key(email))
+            user_id = int(raw_id) if raw_id is not None else None
+
+        user = await self._lookup(user_id) if user_id is not None else None
+        if user is not None and user.email != email:
+            # 이메일이 바뀐 사용자의 오래된 인덱스
+            user = None
+        return self._result(user)
+
+    async def put(self, user: User) -> None:
+        """사용자를 자격 증명을 제거한 상태로 캐시에 저장합니다."""
+        user = strip_credentials(user)
+        self._put_local(user)
+        if self.remote is not None:
+            ttl = max(1, int(self.ttl_seconds))
+            await self.remote.set(self._id_key(user.id), _dump_user(user), ex=ttl)
+            await self.remote.set(self._email_key(user.email), str(user.id), ex=ttl)
+
+    async def invalidate(self, user_id: int = None, email: str = None) -> None:
+        """사용자를 캐시에서 제거합니다."""
+        keys = []
+        if user_id is not None:
+            cached = self._get_local(user_id)
+            if cached is not None:
+                keys.append(self._email_key(cached.email))
+            self._remove_local(user_id)
+            keys.append(self._id_key(user_id))
+        if email is not None:
+            self._email_index.pop(email, None)
+            keys.append(self._email_key(email))
+
+        if self.remote is not None and keys:
+            await self.remote.delete(*keys)
+
+    def clear(self) -> None:
+        """1차 캐시를 비웁니다."""
+        self._entries.clear()
+        self._email_index.clear()
+
+    def stats(self) -> Dict:
+        """캐시 적중률 지표를 반환합니다."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "remote_hits": self.remote_hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+user_cache: Optional[UserCache] = None
+
+
+def get_user_cache() -> UserCache:
+    """애플리케이션 전역 사용자 캐시를 반환합니다 (최초 호출 시 생성)"""
+    global user_cache
+    if user_cache is None:
+        remote = None
+        if CacheConfig.USER_CACHE_REDIS_URL:
+            # 2차 캐시를 설정한 경우에만 redis 패키지가 필요
+            import redis.asyncio as redis
+            remote = redis.from_url(CacheConfig.USER_CACHE_REDIS_URL)
+        user_cache = UserCache(CacheConfig.USER_CACHE_MAX_SIZE, CacheConfig.USER_CACHE_TTL_SECONDS, remote)
+    return user_cache
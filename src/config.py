@@ -6,8 +6,83 @@ class DatabaseConfig:
     DB_NAME = os.getenv("DB_NAME")
     DB_USER = os.getenv("DB_USER")
     DB_PASSWORD = os.getenv("DB_PASSWORD")
+    # 전체 접속 URL (설정 시 위의 개별 설정보다 우선, 로컬 개발/CI에서는 "sqlite+aiosqlite:///./local.db" 등)
+    DB_URL = os.getenv("DB_URL")
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    # 인증 필수 경로(토큰 검증, 로그인) 전용 풀: 작지만 짧은 대기 시간 안에 커넥션을 보장
+    DB_AUTH_POOL_SIZE = int(os.getenv("DB_AUTH_POOL_SIZE", "5"))
+    DB_AUTH_POOL_TIMEOUT = float(os.getenv("DB_AUTH_POOL_TIMEOUT", "0.5"))
+    # 대량 목록 조회 전용 풀: 다른 경로의 커넥션을 잠식하지 않도록 분리
+    DB_BULK_POOL_SIZE = int(os.getenv("DB_BULK_POOL_SIZE", "5"))
+    DB_BULK_POOL_TIMEOUT = float(os.getenv("DB_BULK_POOL_TIMEOUT", "30"))
+    # 콤마로 구분된 읽기 전용 replica URL 목록
+    DB_REPLICA_URLS = [url.strip() for url in os.getenv("DB_REPLICA_URLS", "").split(",") if url.strip()]
+    DB_REPLICA_STRATEGY = os.getenv("DB_REPLICA_STRATEGY", "round_robin")
+    DB_PRIMARY_PIN_SECONDS = float(os.getenv("DB_PRIMARY_PIN_SECONDS", "5"))
+    # "샤드이름=URL" 형식을 콤마로 구분한 추가 샤드 목록 (기본 샤드는 위의 DB 설정)
+    DB_DEFAULT_SHARD = os.getenv("DB_DEFAULT_SHARD", "default")
+    DB_SHARD_URLS = dict(item.strip().split("=", 1) for item in os.getenv("DB_SHARD_URLS", "").split(",") if item.strip())
+    # "tenant_id:샤드이름" 형식의 정적 샤드 배치 (tenant_shard 테이블의 값이 우선)
+    DB_SHARD_DIRECTORY = {
+        int(tenant_id): shard
+        for tenant_id, shard in (item.strip().split(":", 1) for item in os.getenv("DB_SHARD_DIRECTORY", "").split(",") if item.strip())
+    }
+    DB_SHARD_DIRECTORY_REFRESH_SECONDS = float(os.getenv("DB_SHARD_DIRECTORY_REFRESH_SECONDS", "30"))
+    # 테넌트 하나가 동시에 사용할 수 있는 DB 세션 수와 "tenant_id:가중치" 형식의 공정 큐 가중치
+    DB_TENANT_QUOTA = int(os.getenv("DB_TENANT_QUOTA", "10"))
+    DB_TENANT_WEIGHTS = {
+        int(tenant_id): float(weight)
+        for tenant_id, weight in (item.strip().split(":", 1) for item in os.getenv("DB_TENANT_WEIGHTS", "").split(",") if item.strip())
+    }
+    DB_TENANT_WAIT_TIMEOUT = float(os.getenv("DB_TENANT_WAIT_TIMEOUT", "10"))
+    # 저장소 구현: "pg"(기본) 또는 "memory" (부하 테스트/벤치마크/로컬 개발용, 프로세스 재시작 시 데이터 소멸)
+    REPOSITORY_BACKEND = os.getenv("REPOSITORY_BACKEND", "pg")
 
 class AuthConfig:
     SECRET_KEY = os.getenv("SECRET_KEY")
     ALGORITHM = os.getenv("ALGORITHM")
-    ACCESS_TOKEN_EXPIRE_MINUTES = os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES")
\ No newline at end of file
+    ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+
+class CacheConfig:
+    TENANT_CACHE_TTL_SECONDS = float(os.getenv("TENANT_CACHE_TTL_SECONDS", "300"))
+    # 사용자 캐시: 프로세스 내 LRU 최대 항목 수와 TTL, 선택적인 2차 캐시(Redis 프로토콜) URL
+    USER_CACHE_MAX_SIZE = int(os.getenv("USER_CACHE_MAX_SIZE", "10000"))
+    USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", "60"))
+    USER_CACHE_REDIS_URL = os.getenv("USER_CACHE_REDIS_URL")
+    # 이메일 존재 여부 필터: 예상 이메일 수, 허용 오탐률, 전체 재구성 주기
+    EMAIL_FILTER_CAPACITY = int(os.getenv("EMAIL_FILTER_CAPACITY", "1000000"))
+    EMAIL_FILTER_ERROR_RATE = float(os.getenv("EMAIL_FILTER_ERROR_RATE", "0.01"))
+    EMAIL_FILTER_REBUILD_SECONDS = float(os.getenv("EMAIL_FILTER_REBUILD_SECONDS", "300"))
+    # 다른 프로세스에서 가입한 이메일을 반영하는 주기 (없다는 답이 틀릴 수 있는 최대 시간)
+    EMAIL_FILTER_SYNC_SECONDS = float(os.getenv("EMAIL_FILTER_SYNC_SECONDS", "2"))
+
+class APIConfig:
+    # 목록 응답에서 pydantic 재검증을 건너뛰고 orjson으로 직렬화 (orjson이 없으면 표준 json 사용)
+    FAST_SERIALIZATION = os.getenv("FAST_SERIALIZATION", "false").lower() == "true"
+    # 변경 피드: 아직 커밋되지 않았을 수 있는 최근 변경을 제외하는 시간과 한 번에 반환하는 최대 변경 수
+    CHANGE_FEED_SETTLE_SECONDS = float(os.getenv("CHANGE_FEED_SETTLE_SECONDS", "5"))
+    CHANGE_FEED_MAX_LIMIT = int(os.getenv("CHANGE_FEED_MAX_LIMIT", "1000"))
+
+class MonitoringConfig:
+    # 이벤트 루프 지연 측정 주기와, 스택을 기록할 지연 임계값 (초)
+    LOOP_LAG_ENABLED = os.getenv("LOOP_LAG_ENABLED", "true").lower() == "true"
+    LOOP_LAG_INTERVAL_SECONDS = float(os.getenv("LOOP_LAG_INTERVAL_SECONDS", "0.1"))
+    LOOP_LAG_THRESHOLD_SECONDS = float(os.getenv("LOOP_LAG_THRESHOLD_SECONDS", "0.1"))
+    # 요청 단위 프로파일링: 디버그용으로만 켜고, 서명 토큰(X-Profile-Token 헤더 또는 profile 쿼리)이 있는 요청만 측정
+    PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() == "true"
+    PROFILING_SECRET = os.getenv("PROFILING_SECRET", "")
+    PROFILING_TOKEN_MAX_AGE_SECONDS = float(os.getenv("PROFILING_TOKEN_MAX_AGE_SECONDS", "600"))
+    PROFILING_SAMPLE_INTERVAL_SECONDS = float(os.getenv("PROFILING_SAMPLE_INTERVAL_SECONDS", "0.001"))
+    PROFILING_MAX_STORED = int(os.getenv("PROFILING_MAX_STORED", "100"))
+    # 라우트별 hot stack 집계용 저빈도 백그라운드 샘플링
+    ROUTE_SAMPLING_ENABLED = os.getenv("ROUTE_SAMPLING_ENABLED", "false").lower() == "true"
+    ROUTE_SAMPLING_INTERVAL_SECONDS = float(os.getenv("ROUTE_SAMPLING_INTERVAL_SECONDS", "0.05"))
+    # 개발 모드: 요청별 SQL 문장 수 기록과 N+1 감지, 쿼리 예산 초과 시 예외 발생
+    QUERY_COUNTER_ENABLED = os.getenv("QUERY_COUNTER_ENABLED", "false").lower() == "true"
+    QUERY_BUDGET_ENFORCE = os.getenv("QUERY_BUDGET_ENFORCE", "false").lower() == "true"
+    N_PLUS_ONE_THRESHOLD = int(os.getenv("N_PLUS_ONE_THRESHOLD", "3"))
+    # 느린 쿼리 로그: 임계값(밀리초) 이상 걸린 쿼리를 기록하고 처음 관측된 SELECT의 실행 계획을 조회
+    SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "200"))
+    SLOW_QUERY_EXPLAIN = os.getenv("SLOW_QUERY_EXPLAIN", "true").lower() == "true"
@@ -0,0 +1,207 @@
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, Hashable, List, Optional
+
+
+class TenantQuotaTimeoutException(Exception):
+    """테넌트가 제한 시간 안에 DB 세션 슬롯을 얻지 못한 경우 발생하는 예외"""
+    def __init__(self, tenant_key: Hashable, timeout: float):
+        self.tenant_key = tenant_key
+        self.timeout = timeout
+        super().__init__(f"테넌트 {tenant_key}가 {timeout}초 안에 DB 세션을 얻지 못했습니다.")
+
+
+class TenantWaitStats:
+    """테넌트별 DB 세션 대기 지표"""
+
+    def __init__(self):
+        self.acquired = 0
+        self.throttled = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.active = 0
+        self.queued = 0
+
+    def record_wait(self, waited: float) -> None:
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+
+    def merge(self, other: "TenantWaitStats") -> None:
+        """다른 테넌트의 누적 지표를 더합니다. (진행 중인 active/queued는 제외)"""
+        self.acquired += other.acquired
+        self.throttled += other.throttled
+        self.timeouts += other.timeouts
+        self.total_wait += other.total_wait
+        self.max_wait = max(self.max_wait, other.max_wait)
+
+    def to_dict(self) -> Dict:
+        return {
+            "acquired": self.acquired,
+            "throttled": self.throttled,
+            "timeouts": self.timeouts,
+            "active": self.active,
+            "queued": self.queued,
+            "total_wait_seconds": round(self.total_wait, 6),
+            "avg_wait_seconds": round(self.total_wait / self.throttled, 6) if self.throttled else 0.0,
+            "max_wait_seconds": round(self.max_wait, 6),
+        }
+
+
+class TenantFairLimiter:
+    """
+    테넌트별 DB 세션 동시 사용 수를 제한하는 리미터입니다.
+
+    전체 슬롯(capacity)은 커넥션 풀 크기와 같게 두고, 테넌트 하나가 동시에 잡을 수 있는
+    슬롯 수를 tenant_quota로 제한합니다. 슬롯이 모두 사용 중이면 테넌트 가중치에 따른
+    가중 공정 큐(WFQ) 순서로 대기 중인 요청에 슬롯을 나눠줍니다.
+    테넌트를 알 수 없는 요청(로그인 등)은 tenant_quota 제한을 받지 않습니다.
+
+    사용/대기 중인 요청이 없고 가상 종료 시각이 지난 테넌트는 상태를 정리하며,
+    정리된 테넌트들의 누적 지표는 snapshot의 "retired"에 합산됩니다.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        tenant_quota: int,
+        weights: Dict[Hashable, float] = None,
+        timeout: Optional[float] = None,
+    ):
+        self.capacity = capacity
+        self.tenant_quota = tenant_quota
+        self.weights = dict(weights or {})
+        self.timeout = timeout
+
+        self._in_use = 0
+        self._virtual_time = 0.0
+        self._last_finish: Dict[Hashable, float] = {}
+        self._waiters: List = []
+        self._sequence = itertools.count()
+        self.stats: Dict[Hashable, TenantWaitStats] = {}
+        self.retired = TenantWaitStats()
+
+    def _stats(self, key: Hashable) -> TenantWaitStats:
+        if key not in self.stats:
+            self.stats[key] = TenantWaitStats()
+        return self.stats[key]
+
+    def _eligible(self, key: Hashable) -> bool:
+        """풀에 여유가 있고 테넌트가 할당량을 넘지 않았는지 확인합니다."""
+        if self._in_use >= self.capacity:
+            return False
+        return key is None or self._stats(key).active < self.tenant_quota
+
+    def _grant(self, key: Hashable) -> None:
+        self._in_use += 1
+        stats = self._stats(key)
+        stats.active += 1
+        stats.acquired += 1
+
+    def _dispatch(self) -> None:
+        """가상 종료 시각이 빠른 순서로, 할당량에 여유가 있는 대기 요청에 슬롯을 부여합니다."""
+        deferred = []
+        while self._waiters and self._in_use < self.capacity:
+            entry = heapq.heappop(self._waiters)
+            finish, _, key, future = entry
+            if future.done():
+                continue
+            if not self._eligible(key):
+                deferred.append(entry)
+                continue
+
+            self._virtual_time = max(self._virtual_time, finish)
+            self._stats(key).queued -= 1
+            self._grant(key)
+            future.set_result(None)
+
+        for entry in deferred:
+            heapq.heappush(self._waiters, entry)
+
+    def _evict_idle(self) -> None:
+        """
+        사용/대기 중인 요청이 없는 테넌트 중 더 이상 스케줄링에 영향이 없는 테넌트의 상태를 정리합니다.
+
+        가상 종료 시각이 가상 시계 이하면 다음 요청의 종료 시각은 가상 시계에서 시작하므로
+        _last_finish를 지워도 순서가 같습니다. 대기 중인 요청이 하나도 없으면 새 경쟁 구간이
+        시작되므로 모든 유휴 테넌트를 정리합니다.
+        """
+        queue_idle = all(future.done() for *_, future in self._waiters)
+        if queue_idle:
+            self._waiters.clear()
+        for key in [key for key, stats in self.stats.items() if stats.active == 0 and stats.queued == 0]:
+            if queue_idle or self._last_finish.get(key, 0.0) <= self._virtual_time:
+                self.retired.merge(self.stats.pop(key))
+                self._last_finish.pop(key, None)
+
+    async def acquire(self, key: Hashable) -> None:
+        """테넌트의 DB 세션 슬롯을 얻을 때까지 대기합니다."""
+        if not self._waiters and self._eligible(key):
+            self._grant(key)
+            return
+
+        weight = self.weights.get(key, 1.0)
+        finish = max(self._virtual_time, self._last_finish.get(key, 0.0)) + 1.0 / weight
+        self._last_finish[key] = finish
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (finish, next(self._sequence), key, future))
+        stats = self._stats(key)
+        stats.queued += 1
+
+        self._dispatch()
+        if future.done():
+            return
+
+        stats.throttled += 1
+        started = time.monotonic()
+        granted_late = False
+        try:
+            await asyncio.wait_for(asyncio.shield(future), self.timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if future.done() and not future.cancelled():
+                # 취소되는 순간 이미 슬롯을 받은 경우 (지표를 기록한 뒤 반납)
+                granted_late = True
+            else:
+                future.cancel()
+                stats.queued -= 1
+            if isinstance(e, asyncio.TimeoutError):
+                stats.timeouts += 1
+                raise TenantQuotaTimeoutException(key, self.timeout)
+            raise
+        finally:
+            stats.record_wait(time.monotonic() - started)
+            if granted_late:
+                self.release(key)
+            elif future.cancelled():
+                self._evict_idle()
+
+    def release(self, key: Hashable) -> None:
+        """사용이 끝난 슬롯을 반납하고 대기 중인 요청에 넘겨줍니다."""
+        self._in_use -= 1
+        self._stats(key).active -= 1
+        self._dispatch()
+        self._evict_idle()
+
+    @asynccontextmanager
+    async def slot(self, key: Hashable):
+        """슬롯을 얻고 블록이 끝나면 반납하는 컨텍스트 매니저"""
+        await self.acquire(key)
+        try:
+            yield
+        finally:
+            self.release(key)
+
+    def snapshot(self) -> Dict:
+        """테넌트별 대기 지표를 반환합니다."""
+        return {
+            "capacity": self.capacity,
+            "tenant_quota": self.tenant_quota,
+            "in_use": self._in_use,
+            "queued": sum(1 for *_, future in self._waiters if not future.done()),
+            "tenants": {str(key): stats.to_dict() for key, stats in self.stats.items()},
+            "retired": self.retired.to_dict(),
+        }
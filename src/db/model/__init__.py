@@ -2,11 +2,17 @@ from db.model.base import BaseDBModel
 from db.model.user import UserModel
 from db.model.tenant import TenantModel
 from db.model.project import ProjectModel, ProjectMemberModel
+from db.model.tenant_shard import TenantShardModel, UserEmailDirectoryModel
+from db.model.deleted_entity import DeletedEntityModel, CHANGE_FEED_ENTITIES
 
 __all__ = [
     'BaseDBModel',
     'UserModel',
     'TenantModel',
     'ProjectModel',
-    'ProjectMemberModel'
+    'ProjectMemberModel',
+    'TenantShardModel',
+    'UserEmailDirectoryModel',
+    'DeletedEntityModel',
+    'CHANGE_FEED_ENTITIES'
 ]
\ No newline at end of file
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, String, Integer, Index
+
+from db.model.base import BaseDBModel
+from db.model.user import UserModel
+from db.model.project import ProjectModel, ProjectMemberModel
+
+# 변경 피드로 제공하는 엔티티 종류
+CHANGE_FEED_ENTITIES = {
+    "user": UserModel,
+    "project": ProjectModel,
+    "project_member": ProjectMemberModel,
+}
+
+
+class DeletedEntityModel(BaseDBModel):
+    """삭제된 엔티티를 기록하는 tombstone 테이블 (변경 피드에서 삭제를 전달하는 데 사용)"""
+    
+    __tablename__ = "deleted_entity"
+    __table_args__ = (Index("ix_deleted_entity_feed", "entity_type", "updated_at", "id"),)
+    
+    entity_type = Column(String(50), nullable=False)
+    entity_id = Column(Integer, nullable=False)
+    tenant_id = Column(Integer, nullable=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, ForeignKey, Text
+from sqlalchemy import Column, String, Integer, ForeignKey, Text, Index, inspect
 from sqlalchemy.orm import relationship
 
 from db.model.base import BaseDBModel
@@ -8,6 +8,7 @@ from domain import Project, ProjectMember
 class ProjectModel(BaseDBModel):
     
     __tablename__ = "project"
+    __table_args__ = (Index("ix_project_updated_at_id", "updated_at", "id"),)
     
     name = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
@@ -30,8 +31,8 @@ class ProjectModel(BaseDBModel):
             updated_at=self.updated_at
         )
         
-        # 프로젝트 멤버 변환
-        if self.members:
+        # 프로젝트 멤버 변환 (조회 시 함께 로드된 경우에만, 지연 로딩으로 쿼리가 추가되지 않도록)
+        if "members" not in inspect(self).unloaded and self.members:
             project.members = [member.to_domain() for member in self.members]
         
         return project
@@ -52,6 +53,7 @@ class ProjectModel(BaseDBModel):
 class ProjectMemberModel(BaseDBModel):
     
     __tablename__ = "project_member"
+    __table_args__ = (Index("ix_project_member_updated_at_id", "updated_at", "id"),)
     
     project_id = Column(Integer, ForeignKey("project.id"), nullable=False)
     user_id = Column(Integer, ForeignKey("user.id"), nullable=False)
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, String, Integer
+
+from db.model.base import BaseDBModel
+
+
+class TenantShardModel(BaseDBModel):
+    """테넌트가 저장된 샤드를 기록하는 샤드 디렉터리 테이블"""
+    
+    __tablename__ = "tenant_shard"
+    
+    tenant_id = Column(Integer, unique=True, nullable=False, index=True)
+    shard = Column(String(100), nullable=False)
+    status = Column(String(20), nullable=False, default="active")
+
+
+class UserEmailDirectoryModel(BaseDBModel):
+    """이메일로 사용자의 테넌트를 찾는 전역 디렉터리 테이블 (기본 샤드에만 저장)"""
+
+    __tablename__ = "user_email_directory"
+
+    email = Column(String(255), unique=True, nullable=False, index=True)
+    tenant_id = Column(Integer, nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from db.model.base import BaseDBModel
@@ -8,6 +8,8 @@ from domain import User
 class UserModel(BaseDBModel):
     
     __tablename__ = "user"
+    # 변경 피드의 (updated_at, id) 커서 조회용
+    __table_args__ = (Index("ix_user_updated_at_id", "updated_at", "id"),)
     
     email = Column(String(255), unique=True, nullable=False, index=True)
     name = Column(String(255), nullable=True)
@@ -19,11 +21,11 @@ class UserModel(BaseDBModel):
     email_code_expires_at = Column(DateTime, nullable=True)
     
     tenant = relationship("TenantModel", back_populates="users")
-    project_members = relationship("ProjectMemberModel", back_populates="user", cascade="all, delete-orphan")
+    project_members = relationship("ProjectMemberModel", foreign_keys="ProjectMemberModel.user_id", back_populates="user", cascade="all, delete-orphan")
     
     def to_domain(self) -> User:
         """DB 모델을 도메인 모델로 변환"""
-        return User(
+        user = User(
             id=self.id,
             email=self.email,
             name=self.name,
@@ -33,6 +35,10 @@ class UserModel(BaseDBModel):
             created_at=self.created_at,
             updated_at=self.updated_at
         )
+        user.email_verified = self.email_verified
+        user.email_code = self.email_code
+        user.email_code_expires_at = self.email_code_expires_at
+        return user
     
     @classmethod
     def from_domain(cls, domain: User) -> "UserModel":
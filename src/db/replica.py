@@ -0,0 +1,70 @@
+import itertools
+import time
+from typing import Any, Dict, Hashable, List
+
+ROUND_ROBIN = "round_robin"
+LEAST_CONNECTIONS = "least_connections"
+
+
+class ReplicaRouter:
+    """
+    읽기 전용 조회를 복제본(replica) 엔진에 분배하고, 쓰기 직후의 primary 고정(pin)을 관리합니다.
+    """
+
+    def __init__(self, replicas: List[Any], strategy: str = ROUND_ROBIN, pin_seconds: float = 5.0):
+        if strategy not in (ROUND_ROBIN, LEAST_CONNECTIONS):
+            raise ValueError(f"지원하지 않는 replica 선택 방식입니다: {strategy}")
+
+        self.replicas = list(replicas)
+        self.strategy = strategy
+        self.pin_seconds = pin_seconds
+        self._cycle = itertools.cycle(range(len(self.replicas)))
+        self._active = [0] * len(self.replicas)
+        self._pins: Dict[Hashable, float] = {}
+
+    def has_replicas(self) -> bool:
+        """사용 가능한 replica가 있는지 확인합니다."""
+        return bool(self.replicas)
+
+    def select(self) -> int:
+        """다음에 사용할 replica의 인덱스를 선택합니다."""
+        if not self.replicas:
+            raise LookupError("등록된 replica가 없습니다.")
+
+        if self.strategy == LEAST_CONNECTIONS:
+            return min(range(len(self.replicas)), key=lambda index: self._active[index])
+        return next(self._cycle)
+
+    def acquire(self) -> int:
+        """replica를 선택하고 사용 중인 세션 수를 증가시킵니다."""
+        index = self.select()
+        self._active[index] += 1
+        return index
+
+    def release(self, index: int) -> None:
+        """세션이 끝난 replica의 사용 중인 세션 수를 감소시킵니다."""
+        if self._active[index] > 0:
+            self._active[index] -= 1
+
+    def active_sessions(self) -> List[int]:
+        """replica별 사용 중인 세션 수를 반환합니다."""
+        return list(self._active)
+
+    def pin(self, key: Hashable) -> None:
+        """쓰기 이후 일정 시간 동안 해당 키의 조회를 primary로 고정합니다."""
+        now = time.monotonic()
+        self._pins[key] = now + self.pin_seconds
+
+        # 만료된 pin이 쌓이지 않도록 주기적으로 정리
+        if len(self._pins) > 1024:
+            self._pins = {k: until for k, until in self._pins.items() if until > now}
+
+    def is_pinned(self, key: Hashable) -> bool:
+        """해당 키의 조회가 아직 primary에 고정되어 있는지 확인합니다."""
+        until = self._pins.get(key)
+        if until is None:
+            return False
+        if until <= time.monotonic():
+            self._pins.pop(key, None)
+            return False
+        return True
@@ -1,62 +1,300 @@
+import time
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
 from db.model.base import Base
+from db.model.deleted_entity import DeletedEntityModel, CHANGE_FEED_ENTITIES
+from db.replica import ReplicaRouter
+from db.fairness import TenantFairLimiter
 from config import DatabaseConfig
+from monitoring.timing import instrument_engine, record
+from monitoring.slow_query import get_slow_query_log
+
+
+class RoutingSession(Session):
+    """
+    쓰기와 일반 조회는 primary로, 읽기 전용으로 표시된 조회는 replica로 보내는 세션입니다.
+
+    조회 문장에 `execution_options(read_replica=True)`가 지정되어 있거나 세션 자체가
+    읽기 전용(`info["read_only"]`)이면 replica를 사용합니다. 같은 세션에서 한 번이라도
+    쓰기가 발생하면 이후 조회는 모두 primary에서 수행됩니다.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        # 세션은 bind를 고른 직후 커넥션을 꺼내므로, 여기부터 after_begin까지가 풀 checkout 대기 시간
+        self.info["checkout_started"] = time.perf_counter()
+        if self._use_replica(clause):
+            return self._replica_bind()
+        return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+    def _use_replica(self, clause) -> bool:
+        router: Optional[ReplicaRouter] = self.info.get("replica_router")
+        if router is None or not router.has_replicas():
+            return False
+        if self._flushing or self.info.get("has_writes") or self.info.get("force_primary"):
+            return False
+        if clause is None or not getattr(clause, "is_select", False):
+            return False
+        return bool(self.info.get("read_only") or clause.get_execution_options().get("read_replica"))
+
+    def _replica_bind(self):
+        router: ReplicaRouter = self.info["replica_router"]
+        if "replica_index" not in self.info:
+            self.info["replica_index"] = router.acquire()
+        return router.replicas[self.info["replica_index"]].sync_engine
+
+
+@event.listens_for(RoutingSession, "after_begin")
+def _record_checkout(session, transaction, connection) -> None:
+    """세션이 새 커넥션을 얻는 데 걸린 시간(풀 checkout 대기 포함)을 db_wait 구간에 더합니다."""
+    started = session.info.pop("checkout_started", None)
+    if started is not None:
+        record("db_wait", time.perf_counter() - started)
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _mark_writes(session, flush_context) -> None:
+    """flush가 발생한 세션은 이후 조회를 primary에서 수행하도록 표시합니다."""
+    session.info["has_writes"] = True
+
+
+_FEED_ENTITY_TYPES = {model: entity_type for entity_type, model in CHANGE_FEED_ENTITIES.items()}
+
+
+def _tombstone_tenant_id(obj):
+    """tombstone에 기록할 테넌트 ID (멤버는 이미 로드된 프로젝트에서만 구함)"""
+    if hasattr(obj, "tenant_id"):
+        return obj.tenant_id
+    project = inspect(obj).attrs.project.loaded_value if hasattr(obj, "project_id") else None
+    return getattr(project, "tenant_id", None)
+
+
+def tombstone_rows(entity_type: str, entity_ids, tenant_id: Optional[int]) -> List[dict]:
+    """
+    삭제된 엔티티의 tombstone 행 목록
+
+    ORM을 거치지 않는 삭제(core DELETE)는 _record_deletes가 보지 못하므로,
+    삭제하는 쪽에서 같은 트랜잭션에 이 행들을 직접 넣어야 변경 피드에 전달됩니다.
+    """
+    # 엔티티의 updated_at과 같은 애플리케이션 시계를 사용해야 변경 피드의 settle 구간이 맞음
+    now = datetime.now()
+    return [
+        {"entity_type": entity_type, "entity_id": entity_id, "tenant_id": tenant_id, "created_at": now, "updated_at": now}
+        for entity_id in entity_ids
+    ]
+
+
+@event.listens_for(RoutingSession, "before_flush")
+def _record_deletes(session, flush_context, instances) -> None:
+    """
+    ORM으로 삭제되는 엔티티(cascade 포함)의 tombstone을 같은 트랜잭션에 기록합니다.
+
+    session.delete()로 삭제된 객체만 추적합니다. 벌크/core DELETE나 DB 외부의 삭제는
+    tombstone_rows로 직접 기록해야 합니다. (예: 샤드 이동의 TenantShardMover._delete_ids)
+    """
+    for obj in list(session.deleted):
+        entity_type = _FEED_ENTITY_TYPES.get(type(obj))
+        if entity_type is not None:
+            session.add(DeletedEntityModel(**tombstone_rows(entity_type, [obj.id], _tombstone_tenant_id(obj))[0]))
+
+
+DEFAULT_LANE = "default"
+AUTH_LANE = "auth"
+BULK_LANE = "bulk"
+
+
+class PoolLane:
+    """용도별로 분리된 커넥션 풀 설정"""
+
+    def __init__(self, name: str, pool_size: int, max_overflow: int = 0, pool_timeout: float = 30.0):
+        self.name = name
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_timeout = pool_timeout
+
+
+def default_lanes() -> List[PoolLane]:
+    """DatabaseConfig에 설정된 기본/인증/대량 조회 lane 목록"""
+    return [
+        PoolLane(DEFAULT_LANE, DatabaseConfig.DB_POOL_SIZE, DatabaseConfig.DB_MAX_OVERFLOW, DatabaseConfig.DB_POOL_TIMEOUT),
+        PoolLane(AUTH_LANE, DatabaseConfig.DB_AUTH_POOL_SIZE, 0, DatabaseConfig.DB_AUTH_POOL_TIMEOUT),
+        PoolLane(BULK_LANE, DatabaseConfig.DB_BULK_POOL_SIZE, 0, DatabaseConfig.DB_BULK_POOL_TIMEOUT),
+    ]
 
 
 class PgSessionManager:
-    
-    def __init__(self, database_url: str = None):
+    """
+    primary/replica 엔진과 용도별 커넥션 풀(lane)을 관리하는 세션 매니저
+
+    lane마다 독립된 primary 커넥션 풀을 두어, 대량 조회가 풀을 모두 점유해도
+    인증 경로(auth lane)는 짧은 대기 시간 안에 커넥션을 얻을 수 있습니다.
+
+    Postgres 없이 실행할 때는 `sqlite+aiosqlite` URL을 사용할 수 있습니다. 파일 DB는 lane별 풀을
+    그대로 사용하고, 메모리 DB(`sqlite+aiosqlite://`)는 모든 lane이 커넥션 하나를 공유합니다.
+    SQLite는 외래 키를 검사하지 않으므로 제약 조건 위반은 Postgres에서만 드러납니다.
+    """
+
+    def __init__(
+        self,
+        database_url: str = None,
+        replica_urls: List[str] = None,
+        replica_strategy: str = None,
+        primary_pin_seconds: float = None,
+        lanes: List[PoolLane] = None,
+    ):
         self.database_url = database_url or self._get_database_url()
-        self.engine = self._create_engine()
-        self.async_session_maker = async_sessionmaker(
-            self.engine, 
-            class_=AsyncSession, 
-            expire_on_commit=False,
-            autoflush=False
+        self._memory_engine = None
+        self.lanes = {lane.name: lane for lane in (lanes or default_lanes())}
+        if DEFAULT_LANE not in self.lanes:
+            raise ValueError(f"'{DEFAULT_LANE}' lane이 필요합니다.")
+
+        self.engines = {name: self._create_engine(self.database_url, lane=lane) for name, lane in self.lanes.items()}
+        self.session_makers = {
+            name: async_sessionmaker(
+                engine,
+                class_=AsyncSession,
+                sync_session_class=RoutingSession,
+                expire_on_commit=False,
+                autoflush=False
+            )
+            for name, engine in self.engines.items()
+        }
+        self.engine = self.engines[DEFAULT_LANE]
+        self.async_session_maker = self.session_makers[DEFAULT_LANE]
+
+        self.replica_urls = DatabaseConfig.DB_REPLICA_URLS if replica_urls is None else replica_urls
+        self.replica_engines = [self._create_engine(url, read_only=True) for url in self.replica_urls]
+        self.replica_router = ReplicaRouter(
+            self.replica_engines,
+            strategy=replica_strategy or DatabaseConfig.DB_REPLICA_STRATEGY,
+            pin_seconds=DatabaseConfig.DB_PRIMARY_PIN_SECONDS if primary_pin_seconds is None else primary_pin_seconds,
         )
-    
+
+        # 한 테넌트가 커넥션 풀을 독점하지 못하도록 lane별로 세션 수를 테넌트별로 제한
+        self.fair_limiters = {
+            name: TenantFairLimiter(
+                capacity=lane.pool_size + lane.max_overflow,
+                tenant_quota=DatabaseConfig.DB_TENANT_QUOTA,
+                weights=DatabaseConfig.DB_TENANT_WEIGHTS,
+                timeout=min(lane.pool_timeout, DatabaseConfig.DB_TENANT_WAIT_TIMEOUT),
+            )
+            for name, lane in self.lanes.items()
+        }
+        self.fair_limiter = self.fair_limiters[DEFAULT_LANE]
+
     def _get_database_url(self) -> str:
-        """DatabaseConfig에서 데이터베이스 URL을 가져옵니다"""
+        """DatabaseConfig에서 데이터베이스 URL을 가져옵니다 (DB_URL이 설정되어 있으면 그대로 사용)"""
+        if DatabaseConfig.DB_URL:
+            return DatabaseConfig.DB_URL
         db_host = DatabaseConfig.DB_HOST
         db_port = DatabaseConfig.DB_PORT
         db_name = DatabaseConfig.DB_NAME
         db_user = DatabaseConfig.DB_USER
         db_password = DatabaseConfig.DB_PASSWORD
-        
+
         # 비동기 URL은 'postgresql+asyncpg://' 형태로 시작해야 합니다.
         return f"postgresql+asyncpg://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
-    
-    def _create_engine(self):
+
+    def _create_engine(self, database_url: str, read_only: bool = False, lane: PoolLane = None):
         """SQLAlchemy 비동기 엔진 생성"""
-        return create_async_engine(
-            self.database_url,
+        lane = lane or self.lanes[DEFAULT_LANE]
+        url = make_url(database_url)
+        if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+            # 메모리 DB는 커넥션마다 별도 DB가 되므로 모든 lane이 커넥션 하나를 공유
+            if self._memory_engine is None:
+                self._memory_engine = create_async_engine(
+                    database_url,
+                    poolclass=StaticPool,
+                    connect_args={"check_same_thread": False},
+                )
+                self._instrument(self._memory_engine)
+            return self._memory_engine
+
+        engine = create_async_engine(
+            database_url,
             pool_pre_ping=True,
-            pool_size=10,
-            max_overflow=20,
+            pool_size=lane.pool_size,
+            max_overflow=lane.max_overflow,
+            pool_timeout=lane.pool_timeout,
             pool_recycle=3600,
         )
-    
-    async def get_db(self) -> AsyncSession:
-        """비동기 데이터베이스 세션을 제공하는 의존성 함수"""
-        async with self.async_session_maker() as session:
-            try:
-                yield session
-            finally:
-                await session.close()
-    
+        self._instrument(engine)
+
+        if read_only and engine.dialect.name == "postgresql":
+            # replica에서 시작되는 모든 트랜잭션을 READ ONLY로 실행
+            @event.listens_for(engine.sync_engine, "begin")
+            def _set_read_only(conn):
+                conn.exec_driver_sql("SET TRANSACTION READ ONLY")
+
+        return engine
+
+    def _instrument(self, engine) -> None:
+        """쿼리 시간 측정과 느린 쿼리 로그를 엔진에 연결합니다."""
+        instrument_engine(engine.sync_engine)
+        get_slow_query_log().instrument(engine)
+
+    def _create_session(self, read_only: bool = False, pin_key: str = None, lane: str = DEFAULT_LANE) -> AsyncSession:
+        """replica 라우팅 정보가 설정된 세션을 생성합니다"""
+        session = self.session_makers[lane]()
+        session.info["replica_router"] = self.replica_router
+        session.info["read_only"] = read_only
+        session.info["force_primary"] = pin_key is not None and self.replica_router.is_pinned(pin_key)
+        return session
+
+    async def get_db(
+        self,
+        read_only: bool = False,
+        pin_key: str = None,
+        tenant_id: int = None,
+        lane: str = DEFAULT_LANE,
+    ) -> AsyncSession:
+        """
+        비동기 데이터베이스 세션을 제공하는 의존성 함수
+
+        `pin_key`가 주어지면 세션에서 쓰기가 발생한 경우 해당 키의 이후 조회를
+        일정 시간 primary로 고정하여 read-your-writes를 보장합니다.
+        세션은 `lane` 풀에서 `tenant_id`의 동시 사용 슬롯을 얻은 뒤에 생성됩니다.
+        슬롯 대기 시간과 세션이 커넥션 풀에서 커넥션을 꺼내는 시간은 모두 db_wait 구간에 기록됩니다.
+        """
+        limiter = self.fair_limiters[lane]
+        started = time.perf_counter()
+        await limiter.acquire(tenant_id)
+        record("db_wait", time.perf_counter() - started)
+        try:
+            async with self._create_session(read_only, pin_key, lane) as session:
+                try:
+                    yield session
+                finally:
+                    if pin_key is not None and session.info.get("has_writes"):
+                        self.replica_router.pin(pin_key)
+                    if "replica_index" in session.info:
+                        self.replica_router.release(session.info.pop("replica_index"))
+                    await session.close()
+        finally:
+            limiter.release(tenant_id)
+
     async def init_db(self) -> None:
         """데이터베이스 초기화 함수"""
         async with self.engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
-    
+
     async def close_db(self) -> None:
         """데이터베이스 연결 종료 함수"""
-        await self.engine.dispose()
+        for engine in {*self.engines.values(), *self.replica_engines}:
+            await engine.dispose()
+
 
+session_manager: Optional[PgSessionManager] = None
 
-session_manager = PgSessionManager()
 
-async def get_db() -> AsyncSession:
-    """비동기 데이터베이스 세션을 제공하는 의존성 함수"""
-    async for session in session_manager.get_db():
-        yield session
\ No newline at end of file
+def get_session_manager() -> PgSessionManager:
+    """애플리케이션 전역 세션 매니저를 반환합니다 (최초 호출 시 생성)"""
+    global session_manager
+    if session_manager is None:
+        session_manager = PgSessionManager()
+    return session_manager
@@ -0,0 +1,206 @@
+import time
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import DatabaseConfig
+from db.model.tenant_shard import TenantShardModel, UserEmailDirectoryModel
+from db.session import PgSessionManager, get_session_manager
+from exception.domain import TenantMovingException
+
+SHARD_ACTIVE = "active"
+SHARD_MOVING = "moving"
+
+
+class ShardDirectory:
+    """
+    tenant_id를 샤드 이름으로 매핑하는 디렉터리입니다.
+
+    설정(DB_SHARD_DIRECTORY)의 정적 배치 위에 기본 샤드의 tenant_shard 테이블 값을
+    덮어써서 사용합니다. 디렉터리에 없는 테넌트는 기본 샤드에 저장된 것으로 봅니다.
+    """
+
+    def __init__(self, shard_names, default_shard: str, assignments: Dict[int, str] = None):
+        self.shard_names = set(shard_names)
+        self.default_shard = default_shard
+        self.static_assignments = dict(assignments or {})
+        self.assignments: Dict[int, str] = dict(self.static_assignments)
+        self.moving: Set[int] = set()
+        self.loaded_at: Optional[float] = None
+
+        for shard in [default_shard, *self.assignments.values()]:
+            self._validate(shard)
+
+    def _validate(self, shard: str) -> None:
+        if shard not in self.shard_names:
+            raise ValueError(f"등록되지 않은 샤드입니다: {shard}")
+
+    def shard_for(self, tenant_id: Optional[int]) -> str:
+        """테넌트가 저장된 샤드 이름을 반환합니다."""
+        if tenant_id is None:
+            return self.default_shard
+        return self.assignments.get(tenant_id, self.default_shard)
+
+    def is_moving(self, tenant_id: Optional[int]) -> bool:
+        """테넌트가 샤드 이동 중인지 확인합니다."""
+        return tenant_id is not None and tenant_id in self.moving
+
+    def is_stale(self, max_age: float) -> bool:
+        """디렉터리를 다시 읽어야 하는지 확인합니다."""
+        return self.loaded_at is None or time.monotonic() - self.loaded_at >= max_age
+
+    async def load(self, session: AsyncSession) -> None:
+        """tenant_shard 테이블에서 샤드 배치를 다시 읽어옵니다."""
+        result = await session.execute(select(TenantShardModel))
+        assignments = dict(self.static_assignments)
+        moving = set()
+        for row in result.scalars().all():
+            if row.shard in self.shard_names:
+                assignments[row.tenant_id] = row.shard
+            if row.status == SHARD_MOVING:
+                moving.add(row.tenant_id)
+
+        self.assignments = assignments
+        self.moving = moving
+        self.loaded_at = time.monotonic()
+
+    async def save(self, session: AsyncSession, tenant_id: int, shard: str, status: str = SHARD_ACTIVE) -> None:
+        """테넌트의 샤드 배치와 상태를 tenant_shard 테이블에 기록합니다."""
+        self._validate(shard)
+
+        result = await session.execute(select(TenantShardModel).where(TenantShardModel.tenant_id == tenant_id))
+        row = result.scalars().first()
+        if row is None:
+            row = TenantShardModel(tenant_id=tenant_id, shard=shard, status=status)
+            session.add(row)
+        else:
+            row.shard = shard
+            row.status = status
+        await session.commit()
+
+        self.assignments[tenant_id] = shard
+        if status == SHARD_MOVING:
+            self.moving.add(tenant_id)
+        else:
+            self.moving.discard(tenant_id)
+
+
+class EmailDirectory:
+    """
+    이메일을 테넌트 ID로 매핑하는 전역 디렉터리입니다. (기본 샤드의 user_email_directory 테이블)
+
+    로그인처럼 이메일만 있는 요청이 사용자가 저장된 샤드를 찾는 데 사용합니다.
+    사용자 저장 전에 기록하므로 남은 항목이 있을 수 있지만, 그 경우 해당 샤드에서
+    사용자를 찾지 못할 뿐 다른 사용자에게 영향을 주지 않습니다.
+    """
+
+    def __init__(self, session_manager: PgSessionManager):
+        self.session_manager = session_manager
+
+    async def tenant_for(self, email: str) -> Optional[int]:
+        """이메일이 속한 테넌트 ID (디렉터리에 없으면 None)"""
+        async with self.session_manager.async_session_maker() as session:
+            result = await session.execute(
+                select(UserEmailDirectoryModel.tenant_id).where(UserEmailDirectoryModel.email == email)
+            )
+            return result.scalar_one_or_none()
+
+    async def register(self, email: str, tenant_id: int) -> None:
+        """이메일의 테넌트를 기록합니다."""
+        await self.register_many([(email, tenant_id)])
+
+    async def register_many(self, entries: Iterable[Tuple[str, int]]) -> None:
+        """(이메일, 테넌트 ID) 목록을 한 트랜잭션으로 기록합니다."""
+        entries = dict(entries)
+        if not entries:
+            return
+        async with self.session_manager.async_session_maker() as session:
+            result = await session.execute(
+                select(UserEmailDirectoryModel).where(UserEmailDirectoryModel.email.in_(entries))
+            )
+            for row in result.scalars().all():
+                row.tenant_id = entries.pop(row.email)
+            session.add_all(UserEmailDirectoryModel(email=email, tenant_id=tenant_id) for email, tenant_id in entries.items())
+            await session.commit()
+
+    async def remove(self, email: str) -> None:
+        """이메일을 디렉터리에서 제거합니다."""
+        async with self.session_manager.async_session_maker() as session:
+            await session.execute(delete(UserEmailDirectoryModel).where(UserEmailDirectoryModel.email == email))
+            await session.commit()
+
+
+class ShardRouter:
+    """
+    테넌트별로 알맞은 샤드의 세션 매니저를 골라주는 라우터입니다.
+    """
+
+    def __init__(self, managers: Dict[str, PgSessionManager], directory: ShardDirectory, refresh_seconds: float = 30.0):
+        self.managers = managers
+        self.directory = directory
+        self.refresh_seconds = refresh_seconds
+        self.email_directory = EmailDirectory(self.directory_manager)
+
+    @property
+    def directory_manager(self) -> PgSessionManager:
+        """샤드 디렉터리 테이블이 저장된 기본 샤드의 세션 매니저"""
+        return self.managers[self.directory.default_shard]
+
+    def session_manager_for(self, tenant_id: Optional[int]) -> PgSessionManager:
+        """테넌트가 저장된 샤드의 세션 매니저를 반환합니다."""
+        if self.directory.is_moving(tenant_id):
+            raise TenantMovingException(str(tenant_id))
+        return self.managers[self.directory.shard_for(tenant_id)]
+
+    async def tenant_for_email(self, email: str) -> Optional[int]:
+        """이메일 사용자의 테넌트 ID (샤드가 하나뿐이면 조회하지 않고 None)"""
+        if len(self.managers) == 1:
+            return None
+        return await self.email_directory.tenant_for(email)
+
+    async def refresh_directory(self, force: bool = False) -> None:
+        """일정 주기마다 샤드 디렉터리를 다시 읽어옵니다."""
+        if len(self.managers) == 1 and not force:
+            return
+        if force or self.directory.is_stale(self.refresh_seconds):
+            async with self.directory_manager.async_session_maker() as session:
+                await self.directory.load(session)
+
+    async def init_db(self) -> None:
+        """모든 샤드의 스키마를 초기화합니다."""
+        for manager in self.managers.values():
+            await manager.init_db()
+
+    async def close_db(self) -> None:
+        """모든 샤드의 연결을 종료합니다."""
+        for manager in self.managers.values():
+            await manager.close_db()
+
+
+shard_router: Optional[ShardRouter] = None
+
+
+def get_shard_router() -> ShardRouter:
+    """애플리케이션 전역 샤드 라우터를 반환합니다 (최초 호출 시 생성)"""
+    global shard_router
+    if shard_router is None:
+        managers = {DatabaseConfig.DB_DEFAULT_SHARD: get_session_manager()}
+        for name, url in DatabaseConfig.DB_SHARD_URLS.items():
+            managers[name] = PgSessionManager(database_url=url, replica_urls=[])
+
+        directory = ShardDirectory(managers.keys(), DatabaseConfig.DB_DEFAULT_SHARD, DatabaseConfig.DB_SHARD_DIRECTORY)
+        shard_router = ShardRouter(managers, directory, DatabaseConfig.DB_SHARD_DIRECTORY_REFRESH_SECONDS)
+    return shard_router
+
+
+def get_email_directory() -> Optional[EmailDirectory]:
+    """
+    샤드가 여러 개일 때 전역 이메일 디렉터리를 반환합니다.
+
+    샤드가 하나뿐이면 모든 사용자가 기본 샤드에 있으므로 디렉터리를 쓰지 않습니다(None).
+    """
+    if shard_router is None and not DatabaseConfig.DB_SHARD_URLS:
+        return None
+    router = get_shard_router()
+    return router.email_directory if len(router.managers) > 1 else None
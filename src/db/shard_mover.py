@@ -0,0 +1,184 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import Table, select, delete, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.model import TenantModel, UserModel, ProjectModel, ProjectMemberModel, DeletedEntityModel, CHANGE_FEED_ENTITIES
+from db.session import tombstone_rows
+from db.shard import ShardRouter, SHARD_ACTIVE, SHARD_MOVING
+
+# 부모 → 자식 순서 (삽입은 정방향, 삭제는 역방향)
+TENANT_TABLES: List[Table] = [
+    TenantModel.__table__,
+    UserModel.__table__,
+    ProjectModel.__table__,
+    ProjectMemberModel.__table__,
+]
+
+_FEED_ENTITY_TYPES = {model.__table__: entity_type for entity_type, model in CHANGE_FEED_ENTITIES.items()}
+
+
+class ShardMoveConflictException(Exception):
+    """대상 샤드에 다른 테넌트가 같은 ID를 사용하고 있는 경우 발생하는 예외"""
+    def __init__(self, table: str, ids: List[int]):
+        self.table = table
+        self.ids = ids
+        super().__init__(f"대상 샤드의 '{table}' 테이블에 이미 다른 테넌트의 ID가 존재합니다: {ids[:10]}")
+
+
+class TenantShardMover:
+    """
+    테넌트 하나의 데이터를 다른 샤드로 온라인 이동합니다.
+
+    1. 잠금 없이 테넌트의 모든 행을 대상 샤드로 복사(upsert)합니다.
+    2. 디렉터리에 이동 중(moving)으로 기록하고, 다른 프로세스가 디렉터리를 다시 읽을 때까지 기다립니다.
+       이 동안 해당 테넌트의 요청만 503으로 거절되고 다른 테넌트는 영향을 받지 않습니다.
+    3. 1단계 이후 변경된 행(updated_at 기준)과 삭제된 행을 다시 맞추고, 로그인 요청이 새 샤드를
+       찾을 수 있도록 테넌트 사용자의 이메일을 전역 이메일 디렉터리에 기록합니다.
+    4. 디렉터리를 대상 샤드로 전환한 뒤 원본 샤드의 행을 삭제합니다.
+
+    샤드 간 ID는 겹치지 않아야 합니다 (예: 샤드별 시퀀스 시작값 분리).
+    겹치는 경우 ShardMoveConflictException으로 중단되며, 같은 명령으로 다시 실행할 수 있습니다.
+    """
+
+    def __init__(self, router: ShardRouter, batch_size: int = 1000, drain_seconds: Optional[float] = None):
+        self.router = router
+        self.batch_size = batch_size
+        self.drain_seconds = router.refresh_seconds + 1 if drain_seconds is None else drain_seconds
+
+    def _tenant_filter(self, table: Table, tenant_id: int):
+        """테이블별로 테넌트에 속한 행을 고르는 조건"""
+        if table is TenantModel.__table__:
+            return table.c.id == tenant_id
+        if table is ProjectMemberModel.__table__:
+            project = ProjectModel.__table__
+            return table.c.project_id.in_(select(project.c.id).where(project.c.tenant_id == tenant_id))
+        return table.c.tenant_id == tenant_id
+
+    def _upsert(self, session: AsyncSession, table: Table, rows: List[Dict]):
+        dialect = session.bind.dialect.name
+        if dialect == "postgresql":
+            stmt = postgresql.insert(table).values(rows)
+        elif dialect == "sqlite":
+            stmt = sqlite.insert(table).values(rows)
+        else:
+            raise NotImplementedError(f"지원하지 않는 데이터베이스입니다: {dialect}")
+        return stmt.on_conflict_do_update(
+            index_elements=[table.c.id],
+            set_={column.name: stmt.excluded[column.name] for column in table.columns if column.name != "id"}
+        )
+
+    async def _copy_table(self, source: AsyncSession, target: AsyncSession, table: Table, tenant_id: int, since: Optional[datetime] = None) -> int:
+        """테넌트의 행을 ID 순서대로 배치 복사합니다."""
+        condition = self._tenant_filter(table, tenant_id)
+        if since is not None:
+            condition = condition & (table.c.updated_at >= since)
+
+        copied = 0
+        last_id = 0
+        while True:
+            stmt = select(table).where(condition, table.c.id > last_id).order_by(table.c.id).limit(self.batch_size)
+            rows = [dict(row._mapping) for row in (await source.execute(stmt)).all()]
+            if not rows:
+                break
+
+            ids = [row["id"] for row in rows]
+            existing = set((await target.execute(select(table.c.id).where(table.c.id.in_(ids)))).scalars().all())
+            owned = set((await target.execute(select(table.c.id).where(table.c.id.in_(ids), self._tenant_filter(table, tenant_id)))).scalars().all())
+            if existing - owned:
+                raise ShardMoveConflictException(table.name, sorted(existing - owned))
+
+            await target.execute(self._upsert(target, table, rows))
+            await target.commit()
+
+            copied += len(rows)
+            last_id = ids[-1]
+        return copied
+
+    async def _tenant_ids(self, session: AsyncSession, table: Table, tenant_id: int) -> set:
+        result = await session.execute(select(table.c.id).where(self._tenant_filter(table, tenant_id)))
+        return set(result.scalars().all())
+
+    async def _delete_ids(self, session: AsyncSession, table: Table, ids, tombstone_tenant_id: Optional[int] = None) -> None:
+        """
+        ID 목록의 행을 배치로 삭제합니다.
+
+        core DELETE는 ORM 삭제 hook을 거치지 않으므로, tombstone_tenant_id가 주어지면
+        변경 피드 엔티티의 tombstone을 같은 트랜잭션에 직접 기록합니다.
+        """
+        ids = sorted(ids)
+        entity_type = _FEED_ENTITY_TYPES.get(table) if tombstone_tenant_id is not None else None
+        for start in range(0, len(ids), self.batch_size):
+            batch = ids[start:start + self.batch_size]
+            if entity_type is not None:
+                await session.execute(DeletedEntityModel.__table__.insert(), tombstone_rows(entity_type, batch, tombstone_tenant_id))
+            await session.execute(delete(table).where(table.c.id.in_(batch)))
+        await session.commit()
+
+    async def _register_emails(self, session: AsyncSession, tenant_id: int) -> None:
+        """이메일로 로그인하는 요청이 새 샤드를 찾을 수 있도록 테넌트 사용자의 이메일을 디렉터리에 기록합니다."""
+        users = UserModel.__table__
+        result = await session.execute(select(users.c.email).where(users.c.tenant_id == tenant_id))
+        await self.router.email_directory.register_many((email, tenant_id) for email in result.scalars().all())
+
+    async def _sync_sequences(self, session: AsyncSession) -> None:
+        """ID를 직접 넣었으므로 Postgres 시퀀스를 최대 ID 이상으로 맞춥니다."""
+        if session.bind.dialect.name != "postgresql":
+            return
+        for table in TENANT_TABLES:
+            sequence = (await session.execute(text("SELECT pg_get_serial_sequence(:table, 'id')"), {"table": f'"{table.name}"'})).scalar()
+            if sequence:
+                await session.execute(text(
+                    f'SELECT setval(\'{sequence}\', GREATEST((SELECT COALESCE(MAX(id), 1) FROM "{table.name}"), (SELECT last_value FROM {sequence})))'
+                ))
+        await session.commit()
+
+    async def move(self, tenant_id: int, target_shard: str) -> Dict[str, int]:
+        """테넌트를 대상 샤드로 이동하고 테이블별 복사 행 수를 반환합니다."""
+        router = self.router
+        directory = router.directory
+        await router.refresh_directory(force=True)
+
+        source_shard = directory.shard_for(tenant_id)
+        if source_shard == target_shard:
+            return {}
+
+        source_manager = router.managers[source_shard]
+        target_manager = router.managers[target_shard]
+        stats = {table.name: 0 for table in TENANT_TABLES}
+
+        async with source_manager.async_session_maker() as source, \
+                target_manager.async_session_maker() as target, \
+                router.directory_manager.async_session_maker() as directory_session:
+            # 1. 잠금 없이 전체 복사
+            started_at = datetime.now() - timedelta(seconds=1)
+            for table in TENANT_TABLES:
+                stats[table.name] += await self._copy_table(source, target, table, tenant_id)
+
+            # 2. 쓰기 중지 후 다른 프로세스가 디렉터리를 갱신할 때까지 대기
+            await directory.save(directory_session, tenant_id, source_shard, SHARD_MOVING)
+            try:
+                await asyncio.sleep(self.drain_seconds)
+
+                # 3. 1단계 이후 변경/삭제된 행 반영
+                for table in TENANT_TABLES:
+                    stats[table.name] += await self._copy_table(source, target, table, tenant_id, since=started_at)
+                for table in reversed(TENANT_TABLES):
+                    removed = await self._tenant_ids(target, table, tenant_id) - await self._tenant_ids(source, table, tenant_id)
+                    # 이동 중 원본에서 삭제된 행이므로 대상 샤드의 변경 피드에도 삭제로 전달
+                    await self._delete_ids(target, table, removed, tombstone_tenant_id=tenant_id)
+                await self._sync_sequences(target)
+                await self._register_emails(target, tenant_id)
+            except Exception:
+                await directory.save(directory_session, tenant_id, source_shard, SHARD_ACTIVE)
+                raise
+
+            # 4. 디렉터리 전환 후 원본 정리 (삭제가 아니라 이동이므로 tombstone을 남기지 않음)
+            await directory.save(directory_session, tenant_id, target_shard, SHARD_ACTIVE)
+            for table in reversed(TENANT_TABLES):
+                await self._delete_ids(source, table, await self._tenant_ids(source, table, tenant_id))
+
+        return stats
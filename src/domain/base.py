@@ -2,10 +2,15 @@ from datetime import datetime
 from typing import Any
 
 class BaseDomain:
+    # 목록 조회/캐시/대량 처리에서 엔티티가 많이 생성되므로 인스턴스 __dict__ 없이 slot에 저장
+    # (하위 클래스도 자신의 속성을 __slots__에 선언해야 함)
+    __slots__ = ("id", "created_at", "updated_at")
+
     def __init__(self, id: int = None, created_at: datetime = None, updated_at: datetime = None):
         self.id = id
         self.created_at = created_at or datetime.now()
-        self.updated_at = updated_at or self.created_at
+        # 생성 후 수정되지 않은 엔티티는 created_at과 같은 datetime 객체를 공유
+        self.updated_at = self.created_at if updated_at is None or updated_at == self.created_at else updated_at
 
     def update_timestamp(self) -> None:
         """엔티티의 업데이트 시간을 현재 시간으로 설정합니다."""
@@ -7,6 +7,8 @@ from domain.permission import ROLE_ACTIONS
 from exception.domain import InvalidRoleException
 
 class Project(BaseDomain):
+    __slots__ = ("name", "description", "owner_id", "tenant_id", "members")
+
     def __init__(self, id : int = None, name: str = None, description: str = None, owner_id: int = None, tenant_id: int = None, created_at: datetime = None, updated_at: datetime = None):
         super().__init__(id, created_at, updated_at)
         self.name = name
@@ -35,6 +37,8 @@ class Project(BaseDomain):
         self.update_timestamp()
 
 class ProjectMember(BaseDomain):
+    __slots__ = ("project_id", "user_id", "role", "invited_by")
+
     def __init__(self, id : int = None, project_id: int = None, user_id: int = None, 
                  role: str = None, invited_by: int = None, created_at: datetime = None, updated_at: datetime = None):
         super().__init__(id, created_at, updated_at)
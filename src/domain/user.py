@@ -13,6 +13,11 @@ from exception.domain import (
 )
 
 class User(BaseDomain):
+    __slots__ = (
+        "email", "name", "password_hash", "tenant_id", "is_admin",
+        "email_verified", "email_code", "email_code_expires_at",
+    )
+
     def __init__(self, email: str, name: str, password_hash: str, tenant_id: str, is_admin: bool = False, created_at: datetime = None, updated_at: datetime = None, id: int = None):
         super().__init__(id, created_at, updated_at)
         self.email = email
@@ -1,3 +1,5 @@
 from .role_exception import *
 from .user_exception import *
-from .project_exception import *
\ No newline at end of file
+from .project_exception import *
+from .tenant_exception import *
+from .change_feed_exception import *
\ No newline at end of file
@@ -0,0 +1,20 @@
+from exception.base import DomainException
+
+
+class ChangeFeedException(DomainException):
+    """변경 피드 관련 기본 예외 클래스"""
+    pass
+
+
+class InvalidChangeCursorException(ChangeFeedException):
+    """변경 피드 커서를 해석할 수 없는 경우 발생하는 예외"""
+    
+    def __init__(self, cursor: str = None):
+        super().__init__(f"유효하지 않은 변경 피드 커서입니다: {cursor}")
+
+
+class UnknownChangeFeedEntityException(ChangeFeedException):
+    """변경 피드를 제공하지 않는 엔티티를 요청한 경우 발생하는 예외"""
+    
+    def __init__(self, entity_type: str = None):
+        super().__init__(f"변경 피드를 제공하지 않는 엔티티입니다: {entity_type}")
@@ -0,0 +1,30 @@
+from exception.base import DomainException
+
+
+class TenantException(DomainException):
+    """테넌트 관련 기본 예외 클래스"""
+    pass
+
+
+class TenantNotFoundException(TenantException):
+    """테넌트를 찾을 수 없는 경우 발생하는 예외"""
+    
+    def __init__(self, tenant_id: str = None, name: str = None):
+        if tenant_id:
+            message = f"ID가 '{tenant_id}'인 테넌트를 찾을 수 없습니다."
+        elif name:
+            message = f"이름이 '{name}'인 테넌트를 찾을 수 없습니다."
+        else:
+            message = "테넌트를 찾을 수 없습니다."
+        super().__init__(message)
+
+
+class TenantMovingException(TenantException):
+    """테넌트가 다른 샤드로 이동 중이어서 요청을 처리할 수 없는 경우 발생하는 예외"""
+    
+    def __init__(self, tenant_id: str = None):
+        if tenant_id:
+            message = f"ID가 '{tenant_id}'인 테넌트가 샤드 이동 중입니다."
+        else:
+            message = "테넌트가 샤드 이동 중입니다."
+        super().__init__(message)
@@ -1,13 +1,27 @@
 import os
+import asyncio
 from fastapi import FastAPI, Request, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 
+from middleware import ServerTimingMiddleware, ProfilerMiddleware, QueryCounterMiddleware
 from api.user_api import router as user_router
 from api.auth_api import router as auth_router
-# from api import project_router, tenent_router
+from api.metrics_api import router as metrics_router
+from api.change_feed_api import router as change_feed_router
+from api.project_api import router as project_router
+# from api.tenent_api import router as tenent_router
 
 # 데이터베이스 초기화
-from db.session import PgSessionManager
+from db.shard import get_shard_router
+from cache import get_tenant_cache, get_email_filter
+from repository.pg import TenantPgRepository, UserPgRepository
+from monitoring import get_loop_lag_monitor
+from monitoring.profiler import get_route_sampler
+from config import DatabaseConfig, MonitoringConfig
+from api.dependency import memory_repository_overrides
+from repository.memory import get_memory_store, TenantMemoryRepository, UserMemoryRepository
 
 # 애플리케이션 생성
 app = FastAPI(
@@ -25,25 +39,111 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
 
+# 요청별 DB/해시/JWT/직렬화 시간을 Server-Timing 헤더와 로그로 기록
+app.add_middleware(ServerTimingMiddleware)
+
+# 서명된 토큰이 있는 요청의 프로파일링과 라우트별 hot stack 샘플링 (디버그용)
+if MonitoringConfig.PROFILING_ENABLED:
+    app.add_middleware(ProfilerMiddleware)
+
+# 개발 모드에서 요청별 SQL 문장 수와 N+1 의심 쿼리를 기록
+if MonitoringConfig.QUERY_COUNTER_ENABLED:
+    app.add_middleware(QueryCounterMiddleware)
+
+# lane 풀에서 제한 시간 안에 커넥션을 얻지 못한 경우
+@app.exception_handler(PoolTimeoutError)
+async def pool_timeout_handler(request: Request, exc: PoolTimeoutError):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "데이터베이스 커넥션을 얻지 못했습니다"},
+        headers={"Retry-After": "1"}
+    )
+
+# 메모리 저장소 모드에서는 DB 없이 프로세스 내 저장소를 사용
+USE_MEMORY_REPOSITORY = DatabaseConfig.REPOSITORY_BACKEND == "memory"
+if USE_MEMORY_REPOSITORY:
+    app.dependency_overrides.update(memory_repository_overrides())
+
+async def load_all_tenants():
+    """모든 샤드의 테넌트를 조회합니다 (테넌트 행은 테넌트가 배치된 샤드에 있음)"""
+    if USE_MEMORY_REPOSITORY:
+        return await TenantMemoryRepository(get_memory_store()).get_all()
+    tenants = []
+    for manager in app.state.shard_router.managers.values():
+        async with manager.async_session_maker() as session:
+            tenants.extend(await TenantPgRepository(session).get_all())
+    return tenants
+
+async def load_all_emails():
+    """모든 샤드의 사용자 이메일을 조회합니다"""
+    if USE_MEMORY_REPOSITORY:
+        return await UserMemoryRepository(get_memory_store()).get_all_emails()
+    emails = []
+    for manager in app.state.shard_router.managers.values():
+        async with manager.async_session_maker() as session:
+            emails.extend(await UserPgRepository(session).get_all_emails())
+    return emails
+
+async def load_emails_since(since):
+    """모든 샤드에서 since 이후 생성/수정된 사용자의 이메일을 조회합니다"""
+    if USE_MEMORY_REPOSITORY:
+        return await UserMemoryRepository(get_memory_store()).get_emails_updated_since(since)
+    emails = []
+    for manager in app.state.shard_router.managers.values():
+        async with manager.async_session_maker() as session:
+            emails.extend(await UserPgRepository(session).get_emails_updated_since(since))
+    return emails
+
 # 데이터베이스 초기화 이벤트 핸들러
 @app.on_event("startup")
 async def startup_db_client():
     # 데이터베이스 연결 초기화
-    session_manager = PgSessionManager()
-    await session_manager.init_db()
-    app.state.session_manager = session_manager
-    print("데이터베이스 연결 초기화 완료")
+    app.state.shard_router = None
+    if not USE_MEMORY_REPOSITORY:
+        shard_router = get_shard_router()
+        await shard_router.init_db()
+        await shard_router.refresh_directory(force=True)
+        app.state.shard_router = shard_router
+        print("데이터베이스 연결 초기화 완료")
+
+    # 테넌트 캐시 적재 및 TTL 갱신
+    tenant_cache = get_tenant_cache()
+    await tenant_cache.refresh(load_all_tenants)
+    app.state.tenant_cache_refresher = asyncio.create_task(tenant_cache.run_refresh_loop(load_all_tenants))
+    print("테넌트 캐시 적재 완료")
+
+    # 이메일 존재 여부 필터 구성, 다른 프로세스의 가입 동기화 및 주기적 재구성
+    email_filter = get_email_filter()
+    await email_filter.rebuild(load_all_emails)
+    app.state.email_filter_rebuilder = asyncio.create_task(email_filter.run_rebuild_loop(load_all_emails))
+    app.state.email_filter_syncer = asyncio.create_task(email_filter.run_sync_loop(load_emails_since))
+    print("이메일 필터 구성 완료")
+
+    # 이벤트 루프 지연 측정
+    if MonitoringConfig.LOOP_LAG_ENABLED:
+        get_loop_lag_monitor().start()
+    if MonitoringConfig.PROFILING_ENABLED and MonitoringConfig.ROUTE_SAMPLING_ENABLED:
+        get_route_sampler().start()
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    app.state.tenant_cache_refresher.cancel()
+    app.state.email_filter_rebuilder.cancel()
+    app.state.email_filter_syncer.cancel()
+    await get_loop_lag_monitor().stop()
+    get_route_sampler().stop()
     # 데이터베이스 연결 종료
-    await app.state.session_manager.close()
-    print("데이터베이스 연결 종료")
+    if app.state.shard_router is not None:
+        await app.state.shard_router.close_db()
+        print("데이터베이스 연결 종료")
 
 # 라우터 등록
 app.include_router(user_router, prefix="/api")
 app.include_router(auth_router, prefix="/api")
-# app.include_router(project_router, prefix="/api")
+app.include_router(metrics_router, prefix="/api")
+app.include_router(change_feed_router, prefix="/api")
+app.include_router(project_router, prefix="/api")
 # app.include_router(tenent_router, prefix="/api")
\ No newline at end of file
@@ -0,0 +1,3 @@
+from middleware.server_timing import ServerTimingMiddleware
+from middleware.profiler import ProfilerMiddleware
+from middleware.query_counter import QueryCounterMiddleware
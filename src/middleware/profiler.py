@@ -0,0 +1,91 @@
+import sys
+import uuid
+from typing import Optional
+from urllib.parse import parse_qs
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from config import MonitoringConfig
+from monitoring.profiler import (
+    ProfileStore,
+    RequestProfiler,
+    RouteStackSampler,
+    get_profile_store,
+    get_route_sampler,
+    verify_profile_token,
+)
+
+PROFILE_TOKEN_HEADER = "x-profile-token"
+PROFILE_QUERY_PARAM = "profile"
+PROFILE_MODE_PARAM = "profile_mode"
+
+
+class ProfilerMiddleware:
+    """
+    서명된 토큰이 있는 요청 하나를 처음부터 끝까지 프로파일링하는 디버그용 미들웨어
+
+    토큰은 `X-Profile-Token` 헤더나 `profile` 쿼리로 전달하며, 요청 경로에 대해
+    PROFILING_SECRET으로 서명되어 있어야 합니다 (monitoring.profiler.sign_profile_token).
+    프로파일은 요청 ID(X-Request-ID 또는 새로 만든 ID)로 저장되고, 응답의 `X-Profile-Id`
+    헤더로 알려줍니다. 라우트별 샘플러가 실행 중이면 모든 요청의 프레임을 등록해
+    샘플을 라우트별로 분류할 수 있게 합니다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        enabled: bool = None,
+        secret: str = None,
+        store: ProfileStore = None,
+        route_sampler: RouteStackSampler = None,
+    ):
+        self.app = app
+        self.enabled = MonitoringConfig.PROFILING_ENABLED if enabled is None else enabled
+        self.secret = MonitoringConfig.PROFILING_SECRET if secret is None else secret
+        self.store = store or get_profile_store()
+        self.route_sampler = route_sampler or get_route_sampler()
+
+    def _profile_request(self, scope: Scope) -> Optional[str]:
+        """프로파일링할 요청이면 프로파일 모드를, 아니면 None을 반환합니다."""
+        if not self.enabled:
+            return None
+        headers = Headers(scope=scope)
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        token = headers.get(PROFILE_TOKEN_HEADER) or query.get(PROFILE_QUERY_PARAM, [None])[0]
+        if not verify_profile_token(self.secret, token, scope["path"], MonitoringConfig.PROFILING_TOKEN_MAX_AGE_SECONDS):
+            return None
+        return query.get(PROFILE_MODE_PARAM, ["sampling"])[0]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # 샘플러가 스택에서 이 요청을 찾을 때 기준이 되는 프레임
+        frame = sys._getframe()
+        self.route_sampler.active[frame] = scope
+        try:
+            mode = self._profile_request(scope)
+            if mode is None:
+                await self.app(scope, receive, send)
+                return
+
+            request_id = Headers(scope=scope).get("x-request-id") or uuid.uuid4().hex
+            profiler = RequestProfiler(request_id, frame, mode, MonitoringConfig.PROFILING_SAMPLE_INTERVAL_SECONDS)
+
+            async def send_with_profile_id(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = list(message.get("headers", []))
+                    headers.append((b"x-profile-id", request_id.encode("latin-1")))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            profiler.start()
+            try:
+                await self.app(scope, receive, send_with_profile_id)
+            finally:
+                profiler.stop()
+                self.store.put(profiler)
+        finally:
+            self.route_sampler.active.pop(frame, None)
@@ -0,0 +1,45 @@
+import json
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from monitoring.query_counter import count_statements, logger
+
+
+class QueryCounterMiddleware:
+    """
+    요청마다 실행된 SQL 문장 수를 X-Query-Count 헤더와 로그로 내보내는 개발용 미들웨어
+
+    같은 문장이 반복 실행된 경우(N+1 의심)는 경고 로그로 남깁니다.
+    스트리밍 응답은 헤더를 보낸 뒤의 쿼리가 헤더 값에 포함되지 않습니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with count_statements() as log:
+            async def send_with_count(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = list(message.get("headers", []))
+                    headers.append((b"x-query-count", str(log.count).encode("latin-1")))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_count)
+            finally:
+                route = scope.get("route")
+                entry = json.dumps({
+                    "event": "request_queries",
+                    "method": scope["method"],
+                    "route": getattr(route, "path", None) or scope["path"],
+                    **log.to_dict(),
+                }, ensure_ascii=False)
+                if log.n_plus_one():
+                    logger.warning(entry)
+                else:
+                    logger.info(entry)
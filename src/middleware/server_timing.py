@@ -0,0 +1,69 @@
+import json
+import logging
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from monitoring import start_request
+
+logger = logging.getLogger("notaai.timing")
+
+# Server-Timing 헤더에 내보내는 구간 순서와 설명
+TIMING_METRICS = [
+    ("db_wait", "DB 세션 슬롯/커넥션 풀 대기"),
+    ("db", "DB 쿼리"),
+    ("hash", "비밀번호 해시"),
+    ("jwt", "JWT 인코딩/디코딩"),
+    ("serialize", "응답 직렬화"),
+]
+
+
+def format_server_timing(timings) -> str:
+    """측정값을 Server-Timing 헤더 값으로 변환합니다. (dur는 밀리초)"""
+    parts = [
+        f"{name};dur={timings.totals[name] * 1000:.2f}"
+        for name, _ in TIMING_METRICS if name in timings.totals
+    ]
+    parts.append(f"total;dur={timings.elapsed() * 1000:.2f}")
+    return ", ".join(parts)
+
+
+class ServerTimingMiddleware:
+    """
+    요청마다 DB/해시/JWT/직렬화 시간을 측정해 Server-Timing 헤더와 구조화된 로그로 내보내는 미들웨어
+
+    ASGI 미들웨어로 구현해 엔드포인트와 같은 컨텍스트에서 측정값을 공유합니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = start_request()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", format_server_timing(timings).encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            logger.info(json.dumps({
+                "event": "request_timing",
+                "method": scope["method"],
+                "route": timings.route or scope["path"],
+                "status": status_code,
+                "total_ms": round(timings.elapsed() * 1000, 2),
+                **{f"{name}_ms": round(seconds * 1000, 2) for name, seconds in timings.totals.items()},
+                **{f"{name}_count": count for name, count in timings.counts.items()},
+            }, ensure_ascii=False))
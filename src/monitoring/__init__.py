@@ -0,0 +1,17 @@
+from monitoring.timing import (
+    RequestTimings,
+    start_request,
+    current_timings,
+    record,
+    timed,
+    timed_function,
+    instrument_engine,
+)
+from monitoring.loop_lag import LoopLagMonitor, get_loop_lag_monitor
+from monitoring.query_counter import (
+    StatementLog,
+    QueryBudgetExceededException,
+    count_statements,
+    query_budget,
+)
+from monitoring.slow_query import SlowQueryLog, get_slow_query_log, normalize_sql
@@ -0,0 +1,126 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+from config import MonitoringConfig
+
+logger = logging.getLogger("notaai.loop_lag")
+
+
+def _percentile(sorted_values: List[float], ratio: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(ratio * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class LoopLagMonitor:
+    """
+    이벤트 루프 스케줄링 지연을 측정하고, 루프를 막고 있는 코드의 스택을 기록하는 모니터입니다.
+
+    루프 안의 샘플러가 interval마다 깨어나 예정 시각보다 늦은 만큼을 지연으로 기록합니다.
+    별도의 감시 스레드는 샘플러의 마지막 실행 시각을 확인하다가 threshold 이상 멈춰 있으면
+    그 순간 루프 스레드의 스택을 캡처합니다. 루프가 막혀 있는 동안 캡처하므로
+    스택에는 실제로 루프를 막고 있는 동기 호출이 나타납니다.
+
+    total_lag는 측정을 시작한 뒤 누적된 지연(초)으로, 두 시점의 차이로 그 사이에
+    루프가 막혀 있던 시간을 추정할 수 있습니다. (샘플 간격 단위로만 반영됨)
+    """
+
+    def __init__(self, interval: float = 0.1, threshold: float = 0.1, window: int = 1000, max_stalls: int = 50):
+        self.interval = interval
+        self.threshold = threshold
+        self.samples: Deque[float] = deque(maxlen=window)
+        self.stalls: Deque[Dict] = deque(maxlen=max_stalls)
+        self.stall_count = 0
+        self.total_lag = 0.0
+
+        self._heartbeat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._stall_captured = False
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    async def _sample(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            scheduled = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - scheduled)
+            self.samples.append(lag)
+            self.total_lag += lag
+            self._heartbeat = time.monotonic()
+            if self._stall_captured:
+                self._stall_captured = False
+                self.stalls[-1]["lag_seconds"] = round(lag, 6)
+                logger.warning("이벤트 루프가 %.3f초 동안 막혔습니다:\n%s", lag, "".join(self.stalls[-1]["stack"]))
+
+    def _watch(self) -> None:
+        while not self._stopped.wait(self.threshold / 2):
+            blocked = time.monotonic() - self._heartbeat - self.interval
+            if blocked < self.threshold or self._stall_captured:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            self._stall_captured = True
+            self.stall_count += 1
+            self.stalls.append({
+                "detected_at": time.time(),
+                "blocked_seconds": round(blocked, 6),
+                "lag_seconds": None,
+                "stack": traceback.format_stack(frame),
+            })
+
+    def start(self) -> None:
+        """현재 이벤트 루프에서 측정을 시작합니다."""
+        if self._task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.get_running_loop().create_task(self._sample())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-lag-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        """측정을 중단합니다."""
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict:
+        """지연 백분위수(초)와 최근 스택 기록을 반환합니다."""
+        values = sorted(self.samples)
+        return {
+            "samples": len(values),
+            "p50_seconds": round(_percentile(values, 0.50), 6),
+            "p95_seconds": round(_percentile(values, 0.95), 6),
+            "p99_seconds": round(_percentile(values, 0.99), 6),
+            "max_seconds": round(values[-1], 6) if values else 0.0,
+            "threshold_seconds": self.threshold,
+            "stall_count": self.stall_count,
+            "recent_stalls": list(self.stalls),
+        }
+
+
+loop_lag_monitor: Optional[LoopLagMonitor] = None
+
+
+def get_loop_lag_monitor() -> LoopLagMonitor:
+    """애플리케이션 전역 루프 지연 모니터를 반환합니다 (최초 호출 시 생성)"""
+    global loop_lag_monitor
+    if loop_lag_monitor is None:
+        loop_lag_monitor = LoopLagMonitor(MonitoringConfig.LOOP_LAG_INTERVAL_SECONDS, MonitoringConfig.LOOP_LAG_THRESHOLD_SECONDS)
+    return loop_lag_monitor
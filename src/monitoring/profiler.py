@@ -0,0 +1,249 @@
+import cProfile
+import hashlib
+import hmac
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Dict, List, Optional
+
+from config import MonitoringConfig
+
+# 샘플링 프로파일러는 CPython의 sys._current_frames가 필요하며, 없으면 cProfile을 사용
+SAMPLING_AVAILABLE = hasattr(sys, "_current_frames")
+
+WAITING = "(waiting)"
+OTHER = "(other)"
+
+
+def sign_profile_token(secret: str, path: str, expires_at: int) -> str:
+    """path 요청을 expires_at(유닉스 시각)까지 프로파일링할 수 있는 서명 토큰을 만듭니다."""
+    signature = hmac.new(secret.encode(), f"{expires_at}:{path}".encode(), hashlib.sha256).hexdigest()
+    return f"{expires_at}.{signature}"
+
+
+def verify_profile_token(secret: str, token: str, path: str, max_age: float, now: float = None) -> bool:
+    """서명이 맞고 만료되지 않았으며 유효 기간이 max_age를 넘지 않는 토큰인지 확인합니다."""
+    if not secret or not token:
+        return False
+    expires_at, _, signature = token.partition(".")
+    if not expires_at.isdigit():
+        return False
+    now = time.time() if now is None else now
+    if not now <= int(expires_at) <= now + max_age:
+        return False
+    expected = sign_profile_token(secret, path, int(expires_at)).partition(".")[2]
+    return hmac.compare_digest(signature, expected)
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def folded_stack(frame, stop=None) -> str:
+    """frame부터 호출자 방향으로 stop 직전까지의 스택을 flamegraph용 folded 형식(root;...;leaf)으로 변환합니다."""
+    labels = []
+    while frame is not None and frame is not stop:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+def _is_waiting(frame) -> bool:
+    """이벤트 루프가 I/O를 기다리는 중인지 (가장 안쪽 프레임이 selector인지) 확인합니다."""
+    return frame.f_code.co_name in ("select", "poll", "epoll", "control") and "selectors" in frame.f_code.co_filename
+
+
+class StackSampler:
+    """
+    대상 스레드의 스택을 interval마다 샘플링하는 스레드입니다.
+
+    샘플마다 on_sample(frame)을 호출하며, 대상 스레드의 실행을 멈추지 않습니다.
+    """
+
+    def __init__(self, thread_id: int, interval: float, on_sample):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.on_sample = on_sample
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.on_sample(frame)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+
+class RequestProfiler:
+    """
+    요청 하나를 처음부터 끝까지 프로파일링합니다.
+
+    샘플링 모드에서는 루프 스레드의 스택 중 요청 프레임(root_frame) 아래 부분만 요청의 샘플로 세고,
+    루프가 I/O를 기다리는 중이면 (waiting), 다른 요청을 처리 중이면 (other)로 셉니다.
+    cProfile 모드는 같은 스레드의 다른 요청도 함께 측정되므로 동시 요청이 적을 때 사용합니다.
+    """
+
+    def __init__(self, request_id: str, root_frame, mode: str = "sampling", interval: float = 0.001):
+        self.request_id = request_id
+        self.root_frame = root_frame
+        self.mode = mode if SAMPLING_AVAILABLE else "cprofile"
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.started = time.time()
+        self.duration = 0.0
+        self._profile: Optional[cProfile.Profile] = None
+        self._sampler: Optional[StackSampler] = None
+
+    def _on_sample(self, frame) -> None:
+        top = frame
+        while frame is not None:
+            if frame is self.root_frame:
+                self.stacks[folded_stack(top, stop=self.root_frame)] += 1
+                return
+            frame = frame.f_back
+        self.stacks[WAITING if _is_waiting(top) else OTHER] += 1
+
+    def start(self) -> None:
+        if self.mode == "cprofile":
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        else:
+            self._sampler = StackSampler(threading.get_ident(), self.interval, self._on_sample)
+            self._sampler.start()
+
+    def stop(self) -> None:
+        self.duration = time.time() - self.started
+        if self._profile is not None:
+            self._profile.disable()
+        if self._sampler is not None:
+            self._sampler.stop()
+
+    def folded(self) -> str:
+        """flamegraph.pl / speedscope에서 읽을 수 있는 folded 스택 (한 줄에 '스택 샘플수')"""
+        return "\n".join(f"{stack} {count}" for stack, count in self.stacks.most_common())
+
+    def pstats_text(self) -> str:
+        output = io.StringIO()
+        pstats.Stats(self._profile, stream=output).sort_stats("cumulative").print_stats(50)
+        return output.getvalue()
+
+    def to_dict(self) -> Dict:
+        return {
+            "request_id": self.request_id,
+            "mode": self.mode,
+            "started_at": self.started,
+            "duration_seconds": round(self.duration, 6),
+            "samples": sum(self.stacks.values()),
+            "format": "pstats" if self.mode == "cprofile" else "folded",
+        }
+
+    def render(self) -> str:
+        return self.pstats_text() if self.mode == "cprofile" else self.folded()
+
+
+class ProfileStore:
+    """요청 ID별 프로파일을 최근 max_size개까지 보관합니다."""
+
+    def __init__(self, max_size: int = 100):
+        self.max_size = max_size
+        self._profiles: "OrderedDict[str, RequestProfiler]" = OrderedDict()
+
+    def put(self, profile: RequestProfiler) -> None:
+        self._profiles[profile.request_id] = profile
+        self._profiles.move_to_end(profile.request_id)
+        while len(self._profiles) > self.max_size:
+            self._profiles.popitem(last=False)
+
+    def get(self, request_id: str) -> Optional[RequestProfiler]:
+        return self._profiles.get(request_id)
+
+    def list(self) -> List[Dict]:
+        return [profile.to_dict() for profile in reversed(self._profiles.values())]
+
+
+class RouteStackSampler:
+    """
+    낮은 빈도로 루프 스레드를 샘플링해 라우트별로 자주 실행되는 스택을 집계합니다.
+
+    미들웨어가 요청 프레임과 ASGI scope를 active에 등록해 두면, 샘플의 스택에서
+    등록된 프레임을 찾아 해당 요청의 라우트 템플릿으로 샘플을 분류합니다.
+    """
+
+    def __init__(self, interval: float = 0.05, max_stacks_per_route: int = 200):
+        self.interval = interval
+        self.max_stacks_per_route = max_stacks_per_route
+        self.active: Dict = {}
+        self.routes: Dict[str, Counter] = {}
+        self.samples = 0
+        self._sampler: Optional[StackSampler] = None
+
+    def _route_of(self, scope) -> str:
+        route = scope.get("route")
+        return getattr(route, "path", None) or scope.get("path", "")
+
+    def _on_sample(self, frame) -> None:
+        self.samples += 1
+        top = frame
+        while frame is not None:
+            scope = self.active.get(frame)
+            if scope is not None:
+                stacks = self.routes.setdefault(f"{scope['method']} {self._route_of(scope)}", Counter())
+                stack = folded_stack(top, stop=frame)
+                if stack in stacks or len(stacks) < self.max_stacks_per_route:
+                    stacks[stack] += 1
+                return
+            frame = frame.f_back
+
+    def start(self, thread_id: int = None) -> None:
+        """thread_id(기본값은 현재 스레드)의 샘플링을 시작합니다."""
+        if self._sampler is not None:
+            return
+        self._sampler = StackSampler(thread_id or threading.get_ident(), self.interval, self._on_sample)
+        self._sampler.start()
+
+    def stop(self) -> None:
+        if self._sampler is not None:
+            self._sampler.stop()
+            self._sampler = None
+
+    def hot_stacks(self, top: int = 10) -> Dict:
+        """라우트별 샘플 수와 가장 많이 샘플링된 스택"""
+        return {
+            route: {
+                "samples": sum(stacks.values()),
+                "stacks": [{"stack": stack, "samples": count} for stack, count in stacks.most_common(top)],
+            }
+            for route, stacks in sorted(self.routes.items(), key=lambda item: -sum(item[1].values()))
+        }
+
+
+profile_store: Optional[ProfileStore] = None
+route_sampler: Optional[RouteStackSampler] = None
+
+
+def get_profile_store() -> ProfileStore:
+    """애플리케이션 전역 프로파일 저장소를 반환합니다 (최초 호출 시 생성)"""
+    global profile_store
+    if profile_store is None:
+        profile_store = ProfileStore(MonitoringConfig.PROFILING_MAX_STORED)
+    return profile_store
+
+
+def get_route_sampler() -> RouteStackSampler:
+    """애플리케이션 전역 라우트별 스택 샘플러를 반환합니다 (최초 호출 시 생성)"""
+    global route_sampler
+    if route_sampler is None:
+        route_sampler = RouteStackSampler(MonitoringConfig.ROUTE_SAMPLING_INTERVAL_SECONDS)
+    return route_sampler
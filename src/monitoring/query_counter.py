@@ -0,0 +1,111 @@
+import functools
+import logging
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from config import MonitoringConfig
+
+logger = logging.getLogger("notaai.queries")
+
+
+class QueryBudgetExceededException(Exception):
+    """엔드포인트가 선언한 쿼리 수 예산을 초과한 경우 발생하는 예외"""
+    def __init__(self, name: str, budget: int, log: "StatementLog"):
+        self.name = name
+        self.budget = budget
+        self.log = log
+        super().__init__(f"{name}이(가) 쿼리 예산 {budget}개를 넘어 {log.count}개의 쿼리를 실행했습니다.")
+
+
+def _param_key(parameters) -> str:
+    return repr(parameters)
+
+
+class StatementLog:
+    """
+    블록 안에서 실행된 SQL 문장 기록
+
+    문장과 파라미터가 모두 같은 쿼리는 중복(duplicates)으로, 파라미터만 다르고 같은 문장이
+    n_plus_one_threshold번 이상 실행된 경우는 N+1 의심(n_plus_one)으로 보고합니다.
+    """
+
+    def __init__(self, n_plus_one_threshold: int = None):
+        self.n_plus_one_threshold = n_plus_one_threshold or MonitoringConfig.N_PLUS_ONE_THRESHOLD
+        self.statements: List[Tuple[str, str]] = []
+
+    def add(self, statement: str, parameters) -> None:
+        self.statements.append((statement, _param_key(parameters)))
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def duplicates(self) -> Dict[str, int]:
+        """문장과 파라미터가 모두 같은 쿼리와 실행 횟수"""
+        counts = Counter(self.statements)
+        return {statement: count for (statement, _), count in counts.items() if count > 1}
+
+    def n_plus_one(self) -> Dict[str, int]:
+        """같은 문장이 임계값 이상 반복 실행된 쿼리와 실행 횟수"""
+        counts = Counter(statement for statement, _ in self.statements)
+        return {statement: count for statement, count in counts.items() if count >= self.n_plus_one_threshold}
+
+    def to_dict(self) -> Dict:
+        return {
+            "count": self.count,
+            "duplicates": self.duplicates(),
+            "n_plus_one": self.n_plus_one(),
+        }
+
+
+# 중첩된 측정 블록(요청 미들웨어 안의 엔드포인트 예산 등)이 모두 같은 문장을 기록하도록 튜플로 유지
+_active_logs: ContextVar[Tuple[StatementLog, ...]] = ContextVar("statement_logs", default=())
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _record_statement(conn, cursor, statement, parameters, context, executemany):
+    for log in _active_logs.get():
+        log.add(statement, parameters)
+
+
+@contextmanager
+def count_statements(n_plus_one_threshold: int = None):
+    """블록 안에서 모든 엔진이 실행한 SQL 문장을 StatementLog에 기록합니다."""
+    log = StatementLog(n_plus_one_threshold)
+    token = _active_logs.set(_active_logs.get() + (log,))
+    try:
+        yield log
+    finally:
+        _active_logs.reset(token)
+
+
+def query_budget(max_queries: int, enforce: bool = None) -> Callable:
+    """
+    비동기 엔드포인트(또는 함수)가 실행할 수 있는 쿼리 수를 선언하는 데코레이터
+
+    예산을 넘으면 QUERY_BUDGET_ENFORCE가 켜진 경우(테스트/개발) 예외를 발생시키고,
+    아니면 경고 로그만 남깁니다.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        name = fn.__qualname__
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            with count_statements() as log:
+                result = await fn(*args, **kwargs)
+            if log.count > max_queries:
+                if MonitoringConfig.QUERY_BUDGET_ENFORCE if enforce is None else enforce:
+                    raise QueryBudgetExceededException(name, max_queries, log)
+                logger.warning("%s이(가) 쿼리 예산 %d개를 넘었습니다: %s", name, max_queries, log.to_dict())
+            return result
+
+        wrapper.query_budget = max_queries
+        return wrapper
+
+    return decorator
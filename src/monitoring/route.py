@@ -0,0 +1,54 @@
+import asyncio
+import functools
+import time
+from typing import Callable
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+from monitoring.timing import current_timings
+
+
+def _mark_endpoint_done(endpoint: Callable) -> Callable:
+    """엔드포인트가 반환한 시각을 기록하도록 감쌉니다. (이후는 응답 직렬화 구간)"""
+
+    def mark() -> None:
+        timings = current_timings()
+        if timings is not None:
+            timings.endpoint_done = time.perf_counter()
+
+    if asyncio.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def async_wrapper(*args, **kwargs):
+            result = await endpoint(*args, **kwargs)
+            mark()
+            return result
+        return async_wrapper
+
+    @functools.wraps(endpoint)
+    def sync_wrapper(*args, **kwargs):
+        result = endpoint(*args, **kwargs)
+        mark()
+        return result
+    return sync_wrapper
+
+
+class TimedRoute(APIRoute):
+    """라우트 템플릿과 응답 직렬화(response_model 검증 + JSON 인코딩) 시간을 기록하는 라우트"""
+
+    def __init__(self, path: str, endpoint: Callable, **kwargs):
+        super().__init__(path, _mark_endpoint_done(endpoint), **kwargs)
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def timed_handler(request: Request) -> Response:
+            timings = current_timings()
+            if timings is not None:
+                timings.route = self.path
+            response = await handler(request)
+            if timings is not None and timings.endpoint_done is not None:
+                timings.add("serialize", time.perf_counter() - timings.endpoint_done)
+            return response
+
+        return timed_handler
@@ -0,0 +1,272 @@
+import asyncio
+import contextvars
+import json
+import logging
+import re
+import sys
+import time
+from typing import Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from config import MonitoringConfig
+from monitoring.loop_lag import LoopLagMonitor, get_loop_lag_monitor
+
+logger = logging.getLogger("notaai.slow_query")
+
+try:
+    import greenlet
+except ImportError:  # pragma: no cover - SQLAlchemy asyncio 사용 시 항상 설치됨
+    greenlet = None
+
+# dialect별 실행 계획 조회 구문 (ANALYZE 없이 계획만 조회하므로 쿼리를 다시 실행하지 않음)
+EXPLAIN_PREFIXES = {
+    "postgresql": "EXPLAIN (FORMAT JSON) ",
+    "sqlite": "EXPLAIN QUERY PLAN ",
+}
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<!:):[A-Za-z_]\w*|\?")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(statement: str) -> str:
+    """리터럴과 바인드 파라미터를 ?로 바꾸고 IN 목록 길이를 없애 같은 형태의 쿼리를 하나로 묶습니다."""
+    sql = _STRING_LITERAL.sub("?", statement)
+    sql = _PLACEHOLDER.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _PLACEHOLDER_LIST.sub("(?, ...)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+def param_shape(parameters) -> object:
+    """바인드 파라미터의 값 대신 타입 구조를 반환합니다. (값은 로그에 남기지 않음)"""
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, list):
+        return {"executemany": len(parameters), "row": param_shape(parameters[0]) if parameters else None}
+    if isinstance(parameters, tuple):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+def _iter_frames(frame):
+    while frame is not None:
+        yield frame
+        frame = frame.f_back
+
+
+def find_repository_caller() -> Optional[str]:
+    """
+    쿼리를 실행한 repository 메서드를 찾습니다.
+
+    비동기 엔진은 동기 코드를 별도 greenlet에서 실행하므로, 현재 스택에 없으면
+    쿼리를 기다리고 있는 부모 greenlet(코루틴 쪽)의 스택에서 찾습니다.
+    """
+    stacks = [sys._getframe()]
+    if greenlet is not None:
+        parent = greenlet.getcurrent().parent
+        if parent is not None and parent.gr_frame is not None:
+            stacks.append(parent.gr_frame)
+    for top in stacks:
+        for frame in _iter_frames(top):
+            module = frame.f_globals.get("__name__", "")
+            if module.startswith("repository."):
+                code = frame.f_code
+                return f"{module}.{getattr(code, 'co_qualname', code.co_name)}"
+    return None
+
+
+class SlowQueryStats:
+    """정규화된 쿼리 하나의 느린 실행 누적 지표"""
+
+    def __init__(self, sql: str):
+        self.sql = sql
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.callers: Dict[str, int] = {}
+        self.param_shape = None
+        self.plan = None
+        self.last_seen = None
+
+    def add(self, seconds: float, caller: Optional[str], shape) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.callers[caller or "unknown"] = self.callers.get(caller or "unknown", 0) + 1
+        self.param_shape = shape
+        self.last_seen = time.time()
+
+    def to_dict(self) -> Dict:
+        return {
+            "sql": self.sql,
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 2),
+            "avg_ms": round(self.total / self.count * 1000, 2) if self.count else 0.0,
+            "max_ms": round(self.max * 1000, 2),
+            "callers": self.callers,
+            "param_shape": self.param_shape,
+            "plan": self.plan,
+            "last_seen": self.last_seen,
+        }
+
+
+class SlowQueryLog:
+    """
+    임계값보다 오래 걸린 SQL 문장을 로그로 남기고 정규화된 쿼리별로 집계합니다.
+
+    처음 느리게 실행된 SELECT 쿼리는 이벤트 루프의 별도 태스크에서 같은 엔진으로
+    실행 계획을 조회해 함께 저장합니다. (쿼리 응답을 지연시키지 않음)
+    실행 계획 조회는 빈 컨텍스트에서 실행하므로 요청의 쿼리 수, Server-Timing, 쿼리 예산에 포함되지 않습니다.
+
+    실행 시간은 before/after_cursor_execute 사이의 벽시계 시간이라, 그 사이 다른 코드가
+    이벤트 루프를 막은 시간(bcrypt 등)도 포함됩니다. lag_monitor(LoopLagMonitor)가 주어지면
+    쿼리 중에 누적된 루프 지연을 빼서 임계값과 비교하고 loop_lag_ms로 함께 기록합니다.
+    루프 지연은 샘플 간격 단위로 반영되므로 쿼리 직후에 끝난 막힘은 차감되지 않을 수 있습니다.
+    """
+
+    def __init__(
+        self, threshold: float = 0.2, explain: bool = True, max_entries: int = 500,
+        lag_monitor: Optional[LoopLagMonitor] = None,
+    ):
+        self.threshold = threshold
+        self.lag_monitor = lag_monitor
+        self.explain = explain
+        self.max_entries = max_entries
+        self.entries: Dict[str, SlowQueryStats] = {}
+        self._explaining = set()
+        self._tasks = set()
+
+    def instrument(self, engine: AsyncEngine) -> None:
+        """엔진의 쿼리 실행 시간을 측정해 느린 쿼리를 기록합니다."""
+        sync_engine = engine.sync_engine
+
+        @event.listens_for(sync_engine, "before_cursor_execute")
+        def _before(conn, cursor, statement, parameters, context, executemany):
+            conn.info.setdefault("slow_query_started", []).append((time.perf_counter(), self._loop_lag_total()))
+
+        @event.listens_for(sync_engine, "after_cursor_execute")
+        def _after(conn, cursor, statement, parameters, context, executemany):
+            stack = conn.info.get("slow_query_started")
+            if not stack:
+                return
+            started, lag_started = stack.pop()
+            loop_lag = self._loop_lag_total() - lag_started
+            elapsed = max(0.0, time.perf_counter() - started - loop_lag)
+            if elapsed >= self.threshold and not conn.info.get("explaining"):
+                self.record(engine, statement, parameters, elapsed, loop_lag)
+
+        @event.listens_for(sync_engine, "handle_error")
+        def _error(context):
+            stack = context.connection.info.get("slow_query_started") if context.connection is not None else None
+            if stack:
+                stack.pop()
+
+    def _loop_lag_total(self) -> float:
+        return self.lag_monitor.total_lag if self.lag_monitor is not None else 0.0
+
+    def record(
+        self, engine: Optional[AsyncEngine], statement: str, parameters, elapsed: float, loop_lag: float = 0.0,
+    ) -> SlowQueryStats:
+        sql = normalize_sql(statement)
+        caller = find_repository_caller()
+        shape = param_shape(parameters)
+
+        stats = self.entries.get(sql)
+        if stats is None:
+            if len(self.entries) >= self.max_entries:
+                # 가장 오래 전에 관측된 쿼리를 버림
+                del self.entries[min(self.entries, key=lambda key: self.entries[key].last_seen)]
+            stats = self.entries[sql] = SlowQueryStats(sql)
+        stats.add(elapsed, caller, shape)
+
+        logger.warning(json.dumps({
+            "event": "slow_query",
+            "duration_ms": round(elapsed * 1000, 2),
+            "loop_lag_ms": round(loop_lag * 1000, 2),
+            "sql": sql,
+            "param_shape": shape,
+            "caller": caller,
+        }, ensure_ascii=False, default=str))
+
+        if engine is not None and self.explain and stats.plan is None:
+            self._schedule_explain(engine, sql, statement, parameters)
+        return stats
+
+    def _schedule_explain(self, engine: AsyncEngine, sql: str, statement: str, parameters) -> None:
+        prefix = EXPLAIN_PREFIXES.get(engine.dialect.name)
+        if prefix is None or sql in self._explaining or not statement.lstrip().upper().startswith("SELECT"):
+            return
+        if isinstance(parameters, list):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._explaining.add(sql)
+        # 요청 컨텍스트(count_statements, Server-Timing, 쿼리 예산)를 물려받지 않도록 빈 컨텍스트에서 실행
+        task = loop.create_task(self._explain(engine, sql, prefix + statement, parameters), context=contextvars.Context())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _explain(self, engine: AsyncEngine, sql: str, explain_statement: str, parameters) -> None:
+        try:
+            async with engine.connect() as conn:
+                conn.sync_connection.info["explaining"] = True
+                try:
+                    rows = (await conn.exec_driver_sql(explain_statement, parameters)).all()
+                finally:
+                    # info는 풀에 반납된 커넥션에도 남으므로 표시를 지움
+                    conn.sync_connection.info.pop("explaining", None)
+            if sql in self.entries:
+                self.entries[sql].plan = self._plan_from_rows(engine.dialect.name, rows)
+        except Exception as e:
+            logger.info("실행 계획을 조회하지 못했습니다: %s (%s)", sql, e)
+        finally:
+            self._explaining.discard(sql)
+
+    def _plan_from_rows(self, dialect: str, rows) -> object:
+        if dialect == "postgresql":
+            plan = rows[0][0]
+            return json.loads(plan) if isinstance(plan, str) else plan
+        return [list(row) for row in rows]
+
+    async def wait_for_explains(self) -> None:
+        """진행 중인 실행 계획 조회가 끝날 때까지 기다립니다."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def top(self, n: int = 20, order_by: str = "total") -> List[Dict]:
+        """total/max/count/avg 기준 상위 n개의 느린 쿼리"""
+        keys = {
+            "total": lambda stats: stats.total,
+            "max": lambda stats: stats.max,
+            "count": lambda stats: stats.count,
+            "avg": lambda stats: stats.total / stats.count,
+        }
+        if order_by not in keys:
+            raise ValueError(f"정렬 기준은 {', '.join(keys)} 중 하나여야 합니다.")
+        ranked = sorted(self.entries.values(), key=keys[order_by], reverse=True)
+        return [stats.to_dict() for stats in ranked[:n]]
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+
+slow_query_log: Optional[SlowQueryLog] = None
+
+
+def get_slow_query_log() -> SlowQueryLog:
+    """애플리케이션 전역 느린 쿼리 로그를 반환합니다 (최초 호출 시 생성)"""
+    global slow_query_log
+    if slow_query_log is None:
+        slow_query_log = SlowQueryLog(
+            MonitoringConfig.SLOW_QUERY_THRESHOLD_MS / 1000,
+            MonitoringConfig.SLOW_QUERY_EXPLAIN,
+            lag_monitor=get_loop_lag_monitor(),
+        )
+    return slow_query_log
@@ -1,3 +1,4 @@
 from repository.interface.user_repository import IUserRepository
 from repository.interface.project_repository import IProjectRepository, IProjectMemberRepository
-from repository.interface.tenant_repository import ITenantRepository
\ No newline at end of file
+from repository.interface.tenant_repository import ITenantRepository
+from repository.interface.change_feed_repository import IChangeFeedRepository
@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+# (updated_at, id) 워터마크
+Watermark = Tuple[datetime, int]
+
+
+class IChangeFeedRepository(ABC):
+
+    @abstractmethod
+    async def get_changes(
+        self,
+        entity_type: str,
+        since: Optional[Watermark],
+        until: datetime,
+        limit: int,
+        tenant_id: int = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        워터마크 이후 until까지 생성/수정된 엔티티를 (updated_at, id) 순서로 조회합니다.
+        """
+        pass
+
+    @abstractmethod
+    async def get_deletes(
+        self,
+        entity_type: str,
+        since: Optional[Watermark],
+        until: datetime,
+        limit: int,
+        tenant_id: int = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        워터마크 이후 until까지 삭제된 엔티티의 tombstone을 (updated_at, id) 순서로 조회합니다.
+        """
+        pass
@@ -7,6 +7,13 @@ from domain.project import Project, ProjectMember
 
 class IProjectRepository(BaseRepository):
 
+    @abstractmethod
+    async def get_by_ids(self, ids: List[int]) -> List[Project]:
+        """
+        여러 ID의 프로젝트를 한 번에 조회합니다. 존재하지 않는 ID는 결과에서 빠집니다.
+        """
+        pass
+
     @abstractmethod
     def get_by_name(self, name: str) -> Optional[Project]:
         """
@@ -38,6 +45,13 @@ class IProjectRepository(BaseRepository):
 
 class IProjectMemberRepository(BaseRepository):
     
+    @abstractmethod
+    async def get_by_ids(self, ids: List[int]) -> List[ProjectMember]:
+        """
+        여러 ID의 프로젝트 멤버를 한 번에 조회합니다. 존재하지 않는 ID는 결과에서 빠집니다.
+        """
+        pass
+
     @abstractmethod
     def get_by_project_id(self, project_id: int) -> List[ProjectMember]:
         """
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 from abc import abstractmethod
 
 from repository.interface.base_repository import BaseRepository
@@ -7,6 +7,13 @@ from domain.tenant import Tenant
 
 class ITenantRepository(BaseRepository):
     
+    @abstractmethod
+    async def get_by_ids(self, ids: List[int]) -> List[Tenant]:
+        """
+        여러 ID의 테넌트를 한 번에 조회합니다. 존재하지 않는 ID는 결과에서 빠집니다.
+        """
+        pass
+
     @abstractmethod
     def get_by_name(self, name: str) -> Optional[Tenant]:
         """
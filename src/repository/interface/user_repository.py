@@ -1,4 +1,5 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
 from abc import abstractmethod
 
 from repository.interface.base_repository import BaseRepository
@@ -14,6 +15,13 @@ class IUserRepository(BaseRepository):
         """
         pass
 
+    @abstractmethod
+    async def get_by_ids(self, ids: List[int]) -> List[User]:
+        """
+        여러 ID의 사용자를 한 번에 조회합니다. 존재하지 않는 ID는 결과에서 빠집니다.
+        """
+        pass
+
     @abstractmethod
     def get_by_email(self, email: str) -> Optional[User]:
         """
@@ -28,6 +36,13 @@ class IUserRepository(BaseRepository):
         """
         pass
     
+    @abstractmethod
+    def stream_by_tenant_id(self, tenant_id: int, batch_size: int = 1000) -> AsyncIterator[User]:
+        """
+        테넌트의 모든 사용자를 메모리에 모으지 않고 순서대로 반환합니다.
+        """
+        pass
+    
     @abstractmethod
     def get_admin_users(self, skip: int = 0, limit: int = 100) -> List[User]:
         """
@@ -40,4 +55,18 @@ class IUserRepository(BaseRepository):
         """
         해당 이메일의 사용자가 존재하는지 확인합니다.
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def get_version(self, id: int) -> Optional[datetime]:
+        """
+        ID로 사용자의 수정 시각만 조회합니다.
+        """
+        pass
+
+    @abstractmethod
+    async def get_versions(self, skip: int = 0, limit: int = 100, tenant_id: int = None, admin_only: bool = False) -> List[Tuple[int, datetime]]:
+        """
+        목록 조회와 같은 조건으로 사용자의 (ID, 수정 시각)만 조회합니다.
+        """
+        pass
@@ -0,0 +1,108 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cache import TenantCache
+from repository.interface import IUserRepository, IProjectRepository, IProjectMemberRepository, ITenantRepository
+from repository.pg import UserPgRepository, ProjectPgRepository, ProjectMemberPgRepository, TenantPgRepository
+
+
+class BatchLoader:
+    """
+    같은 이벤트 루프 tick 안에서 요청된 ID 조회를 모아 한 번의 일괄 조회로 처리하는 로더입니다.
+
+    `load(id)`는 바로 조회하지 않고 키를 모아두었다가, 현재 tick이 끝난 뒤 `batch_fn(ids)`를
+    한 번 호출해 결과를 나눠줍니다. 요청 단위로 생성되며, 한 번 조회한 키는 요청이 끝날 때까지
+    다시 조회하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[Hashable]], Awaitable[List[Any]]],
+        key_fn: Callable[[Any], Hashable] = lambda entity: entity.id,
+        max_batch_size: int = 1000,
+        lock: Optional[asyncio.Lock] = None,
+    ):
+        self.batch_fn = batch_fn
+        self.key_fn = key_fn
+        self.max_batch_size = max_batch_size
+        # 같은 세션을 공유하는 로더끼리 동시에 쿼리하지 않도록 잠금을 공유
+        self.lock = lock or asyncio.Lock()
+
+        self._results: Dict[Hashable, asyncio.Future] = {}
+        self._pending: List[Hashable] = []
+        # 실행 중인 일괄 조회 태스크가 가비지 컬렉션되지 않도록 참조를 유지
+        self._tasks = set()
+        self.batches = 0
+
+    async def load(self, key: Hashable) -> Optional[Any]:
+        """키에 해당하는 엔티티를 조회합니다. 없으면 None을 반환합니다."""
+        future = self._results.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._results[key] = future
+            if not self._pending:
+                loop.call_soon(self._dispatch)
+            self._pending.append(key)
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: List[Hashable]) -> List[Optional[Any]]:
+        """여러 키를 한 번에 조회합니다. 결과는 keys 순서를 따릅니다."""
+        return list(await asyncio.gather(*[self.load(key) for key in keys]))
+
+    def _dispatch(self) -> None:
+        keys, self._pending = self._pending, []
+        for start in range(0, len(keys), self.max_batch_size):
+            task = asyncio.ensure_future(self._run_batch(keys[start:start + self.max_batch_size]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, keys: List[Hashable]) -> None:
+        try:
+            async with self.lock:
+                entities = await self.batch_fn(keys)
+                self.batches += 1
+            found = {self.key_fn(entity): entity for entity in entities}
+        except Exception as e:
+            for key in keys:
+                # 실패한 키는 다음 요청에서 다시 조회할 수 있도록 제거
+                future = self._results.pop(key)
+                if not future.done():
+                    future.set_exception(e)
+                    future.exception()
+            return
+
+        for key in keys:
+            future = self._results[key]
+            if not future.done():
+                future.set_result(found.get(key))
+
+
+class Loaders:
+    """요청 하나에서 사용하는 엔티티별 BatchLoader 모음"""
+
+    def __init__(
+        self,
+        user_repository: IUserRepository,
+        project_repository: IProjectRepository,
+        project_member_repository: IProjectMemberRepository,
+        tenant_repository: ITenantRepository,
+    ):
+        # 같은 세션을 공유하는 저장소들이므로 잠금도 공유
+        lock = asyncio.Lock()
+        self.users = BatchLoader(user_repository.get_by_ids, lock=lock)
+        self.projects = BatchLoader(project_repository.get_by_ids, lock=lock)
+        self.project_members = BatchLoader(project_member_repository.get_by_ids, lock=lock)
+        self.tenants = BatchLoader(tenant_repository.get_by_ids, lock=lock)
+
+    @classmethod
+    def for_session(cls, session: AsyncSession, tenant_cache: Optional[TenantCache] = None) -> "Loaders":
+        """하나의 DB 세션을 공유하는 Pg 저장소로 로더를 만듭니다."""
+        return cls(
+            UserPgRepository(session),
+            ProjectPgRepository(session),
+            ProjectMemberPgRepository(session),
+            TenantPgRepository(session, tenant_cache),
+        )
@@ -0,0 +1,4 @@
+from repository.memory.store import MemoryStore, MemoryTable, UniqueViolationException, get_memory_store
+from repository.memory.user_memory_repository import UserMemoryRepository
+from repository.memory.project_memory_repository import ProjectMemoryRepository, ProjectMemberMemoryRepository
+from repository.memory.tenant_memory_repository import TenantMemoryRepository
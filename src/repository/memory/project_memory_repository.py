@@ -0,0 +1,167 @@
+import copy
+from typing import List, Optional
+
+from domain import Project, ProjectMember
+from repository.interface.project_repository import IProjectRepository, IProjectMemberRepository
+from repository.memory.store import MemoryStore
+
+
+class ProjectMemoryRepository(IProjectRepository):
+    """
+    메모리 프로젝트 저장소 (name/tenant_id/owner_id 보조 인덱스)
+
+    Postgres 저장소의 selectinload와 같이 조회한 프로젝트에는 멤버 목록이 채워지며,
+    프로젝트를 삭제하면 멤버도 함께 삭제됩니다.
+    """
+
+    def __init__(self, store: MemoryStore):
+        self.store = store
+        self.table = store.projects
+
+    def _with_members(self, project: Optional[Project]) -> Optional[Project]:
+        if project is not None:
+            project.members = self.store.project_members.find_by("project_id", project.id)
+        return project
+
+    async def save(self, entity: Project) -> Project:
+        """
+        프로젝트 엔티티를 저장하거나 업데이트합니다. (멤버는 멤버 저장소로 저장)
+        """
+        entity = copy.copy(entity)
+        entity.members = []
+        return self.table.save(entity)
+
+    async def delete(self, id: int) -> bool:
+        """
+        ID로 프로젝트와 프로젝트의 멤버를 삭제합니다.
+        """
+        if not self.table.delete(id):
+            return False
+        for member_id in self.store.project_members.ids_by("project_id", id):
+            self.store.project_members.delete(member_id)
+        return True
+
+    async def get_by_id(self, id: int) -> Optional[Project]:
+        """
+        ID로 프로젝트를 조회합니다.
+        """
+        return self._with_members(self.table.get(id))
+
+    async def get_by_ids(self, ids: List[int]) -> List[Project]:
+        """
+        여러 ID의 프로젝트를 조회합니다. 존재하지 않는 ID는 결과에서 빠집니다.
+        """
+        return [self._with_members(project) for project in (self.table.get(id) for id in sorted(set(ids))) if project]
+
+    async def get_all(self) -> List[Project]:
+        """
+        모든 프로젝트를 조회합니다.
+        """
+        return [self._with_members(project) for project in self.table.all()]
+
+    async def count(self) -> int:
+        """
+        전체 프로젝트 수를 반환합니다.
+        """
+        return len(self.table.rows)
+
+    async def exists(self, id: int) -> bool:
+        """
+        해당 ID의 프로젝트가 존재하는지 확인합니다.
+        """
+        return id in self.table.rows
+
+    async def get_by_name(self, name: str) -> Optional[Project]:
+        """
+        프로젝트 이름으로 프로젝트를 조회합니다.
+        """
+        return self._with_members(self.table.first_by("name", name))
+
+    async def get_by_tenant_id(self, tenant_id: int) -> List[Project]:
+        """
+        테넌트 ID로 프로젝트 목록을 조회합니다.
+        """
+        return [self._with_members(project) for project in self.table.find_by("tenant_id", tenant_id)]
+
+    async def get_by_owner_id(self, owner_id: int) -> List[Project]:
+        """
+        소유자 ID로 프로젝트 목록을 조회합니다.
+        """
+        return [self._with_members(project) for project in self.table.find_by("owner_id", owner_id)]
+
+    async def get_by_user_id(self, user_id: int) -> List[Project]:
+        """
+        사용자 ID로 사용자가 소유하거나 멤버로 속한 프로젝트 목록을 조회합니다.
+        """
+        members = self.store.project_members
+        ids = set(self.table.ids_by("owner_id", user_id))
+        ids.update(members.rows[member_id].project_id for member_id in members.ids_by("user_id", user_id))
+        return [self._with_members(self.table.get(id)) for id in sorted(ids) if id in self.table.rows]
+
+
+class ProjectMemberMemoryRepository(IProjectMemberRepository):
+    """메모리 프로젝트 멤버 저장소 (project_id/user_id/role 보조 인덱스)"""
+
+    def __init__(self, store: MemoryStore):
+        self.store = store
+        self.table = store.project_members
+
+    async def save(self, entity: ProjectMember) -> ProjectMember:
+        """
+        프로젝트 멤버 엔티티를 저장하거나 업데이트합니다.
+        """
+        return self.table.save(entity)
+
+    async def delete(self, id: int) -> bool:
+        """
+        ID로 프로젝트 멤버를 삭제합니다.
+        """
+        return self.table.delete(id)
+
+    async def get_by_id(self, id: int) -> Optional[ProjectMember]:
+        """
+        ID로 프로젝트 멤버를 조회합니다.
+        """
+        return self.table.get(id)
+
+    async def get_by_ids(self, ids: List[int]) -> List[ProjectMember]:
+        """
+        여러 ID의 프로젝트 멤버를 조회합니다. 존재하지 않는 ID는 결과에서 빠집니다.
+        """
+        return [member for member in (self.table.get(id) for id in sorted(set(ids))) if member]
+
+    async def get_all(self) -> List[ProjectMember]:
+        """
+        모든 프로젝트 멤버를 조회합니다.
+        """
+        return self.table.all()
+
+    async def count(self) -> int:
+        """
+        전체 프로젝트 멤버 수를 반환합니다.
+        """
+        return len(self.table.rows)
+
+    async def exists(self, id: int) -> bool:
+        """
+        해당 ID의 프로젝트 멤버가 존재하는지 확인합니다.
+        """
+        return id in self.table.rows
+
+    async def get_by_project_id(self, project_id: int) -> List[ProjectMember]:
+        """
+        프로젝트 ID로 프로젝트 멤버 목록을 조회합니다.
+        """
+        return self.table.find_by("project_id", project_id)
+
+    async def get_by_user_id(self, user_id: int) -> List[ProjectMember]:
+        """
+        사용자 ID로 프로젝트 멤버 목록을 조회합니다.
+        """
+        return self.table.find_by("user_id", user_id)
+
+    async def get_by_role(self, role: str) -> List[ProjectMember]:
+        """
+        역할로 프로젝트 멤버 목록을 조회합니다.
+        """
+        return self.table.find_by("role", role)
@@ -0,0 +1,116 @@
+import copy
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+
+class UniqueViolationException(Exception):
+    """유일 인덱스 필드에 이미 다른 엔티티가 가진 값을 저장하려는 경우 발생하는 예외"""
+    def __init__(self, field: str, value: Any):
+        self.field = field
+        self.value = value
+        super().__init__(f"'{field}' 값 '{value}'이(가) 이미 존재합니다.")
+
+
+class MemoryTable:
+    """
+    ID로 엔티티를 저장하고 지정한 필드의 보조 인덱스(값 -> ID 집합)를 유지하는 메모리 테이블
+
+    저장/조회 시 엔티티를 복사하므로, 호출자가 반환된 객체를 수정해도 저장된 값은 바뀌지 않습니다.
+    (Postgres 저장소가 조회할 때마다 새 도메인 객체를 만드는 것과 같은 동작)
+    unique_fields의 필드는 DB의 유일 제약처럼 다른 엔티티와 같은 값으로 저장할 수 없습니다.
+    """
+
+    def __init__(self, indexed_fields: Iterable[str] = (), unique_fields: Iterable[str] = ()):
+        self.rows: Dict[int, Any] = {}
+        self.unique_fields = tuple(unique_fields)
+        self.indexes: Dict[str, Dict[Any, Set[int]]] = {field: {} for field in (*indexed_fields, *self.unique_fields)}
+        self._next_id = 1
+
+    def _index(self, entity: Any) -> None:
+        for field, index in self.indexes.items():
+            index.setdefault(getattr(entity, field), set()).add(entity.id)
+
+    def _unindex(self, entity: Any) -> None:
+        for field, index in self.indexes.items():
+            ids = index.get(getattr(entity, field))
+            if ids is not None:
+                ids.discard(entity.id)
+                if not ids:
+                    del index[getattr(entity, field)]
+
+    def save(self, entity: Any) -> Any:
+        """ID가 없으면 새 ID를 부여해 추가하고, 있으면 덮어씁니다."""
+        for field in self.unique_fields:
+            value = getattr(entity, field)
+            if self.indexes[field].get(value, set()) - {entity.id}:
+                raise UniqueViolationException(field, value)
+        stored = copy.copy(entity)
+        if stored.id is None:
+            stored.id = self._next_id
+        self._next_id = max(self._next_id, stored.id + 1)
+        stored.created_at = stored.created_at or datetime.now()
+        stored.updated_at = stored.updated_at or stored.created_at
+
+        previous = self.rows.get(stored.id)
+        if previous is not None:
+            self._unindex(previous)
+        self.rows[stored.id] = stored
+        self._index(stored)
+        return copy.copy(stored)
+
+    def delete(self, id: int) -> bool:
+        entity = self.rows.pop(id, None)
+        if entity is None:
+            return False
+        self._unindex(entity)
+        return True
+
+    def get(self, id: int) -> Optional[Any]:
+        entity = self.rows.get(id)
+        return copy.copy(entity) if entity is not None else None
+
+    def ids_by(self, field: str, value: Any) -> List[int]:
+        """보조 인덱스에서 field == value인 ID를 오름차순으로 반환합니다."""
+        return sorted(self.indexes[field].get(value, ()))
+
+    def find_by(self, field: str, value: Any) -> List[Any]:
+        return [copy.copy(self.rows[id]) for id in self.ids_by(field, value)]
+
+    def first_by(self, field: str, value: Any) -> Optional[Any]:
+        ids = self.ids_by(field, value)
+        return copy.copy(self.rows[ids[0]]) if ids else None
+
+    def all(self) -> List[Any]:
+        return [copy.copy(self.rows[id]) for id in sorted(self.rows)]
+
+    def clear(self) -> None:
+        self.rows.clear()
+        for index in self.indexes.values():
+            index.clear()
+        self._next_id = 1
+
+
+class MemoryStore:
+    """in-memory 저장소들이 공유하는 테이블 모음 (프로세스 하나의 DB 역할)"""
+
+    def __init__(self):
+        # UserModel.email처럼 email은 유일 인덱스
+        self.users = MemoryTable(["tenant_id", "is_admin"], unique_fields=["email"])
+        self.tenants = MemoryTable(["name"])
+        self.projects = MemoryTable(["name", "tenant_id", "owner_id"])
+        self.project_members = MemoryTable(["project_id", "user_id", "role"])
+
+    def clear(self) -> None:
+        for table in (self.users, self.tenants, self.projects, self.project_members):
+            table.clear()
+
+
+memory_store: Optional[MemoryStore] = None
+
+
+def get_memory_store() -> MemoryStore:
+    """애플리케이션 전역 메모리 저장소를 반환합니다 (최초 호출 시 생성)"""
+    global memory_store
+    if memory_store is None:
+        memory_store = MemoryStore()
+    return memory_store
@@ -0,0 +1,67 @@
+from typing import List, Optional
+
+from domain import Tenant
+from repository.interface import ITenantRepository
+from repository.memory.store import MemoryStore
+
+
+class TenantMemoryRepository(ITenantRepository):
+    """메모리 테넌트 저장소 (name 보조 인덱스)"""
+
+    def __init__(self, store: MemoryStore):
+        self.store = store
+        self.table = store.tenants
+
+    async def save(self, entity: Tenant) -> Tenant:
+        """
+        테넌트 엔티티를 저장하거나 업데이트합니다.
+        """
+        return self.table.save(entity)
+
+    async def delete(self, id: int) -> bool:
+        """
+        ID로 테넌트를 삭제합니다.
+        """
+        return self.table.delete(id)
+
+    async def get_by_id(self, id: int) -> Optional[Tenant]:
+        """
+        ID로 테넌트를 조회합니다.
+        """
+        return self.table.get(id)
+
+    async def get_by_ids(self, ids: List[int]) -> List[Tenant]:
+        """
+        여러 ID의 테넌트를 조회합니다. 존재하지 않는 ID는 결과에서 빠집니다.
+        """
+        return [tenant for tenant in (self.table.get(id) for id in sorted(set(ids))) if tenant]
+
+    async def get_all(self) -> List[Tenant]:
+        """
+        모든 테넌트를 조회합니다.
+        """
+        return self.table.all()
+
+    async def count(self) -> int:
+        """
+        전체 테넌트 수를 반환합니다.
+        """
+        return len(self.table.rows)
+
+    async def exists(self, id: int) -> bool:
+        """
+        해당 ID의 테넌트가 존재하는지 확인합니다.
+        """
+        return id in self.table.rows
+
+    async def get_by_name(self, name: str) -> Optional[Tenant]:
+        """
+        테넌트 이름으로 테넌트를 조회합니다.
+        """
+        return self.table.first_by("name", name)
+
+    async def exists_by_name(self, name: str) -> bool:
+        """
+        해당 이름의 테넌트가 존재하는지 확인합니다.
+        """
+        return name in self.table.indexes["name"]
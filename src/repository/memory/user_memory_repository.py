@@ -0,0 +1,141 @@
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
+
+from domain import User
+from repository.interface import IUserRepository
+from repository.memory.store import MemoryStore, UniqueViolationException
+from exception.domain import UserAlreadyExistsException
+
+
+class UserMemoryRepository(IUserRepository):
+    """
+    메모리 사용자 저장소
+
+    email/tenant_id/is_admin 보조 인덱스로 조회하며, 목록은 Postgres 저장소와 같이 ID 순으로 반환합니다.
+    """
+
+    def __init__(self, store: MemoryStore):
+        self.store = store
+        self.table = store.users
+
+    async def save(self, entity: User) -> User:
+        """
+        사용자 엔티티를 저장하거나 업데이트합니다.
+        다른 사용자가 사용 중인 이메일이면 UserAlreadyExistsException이 발생합니다.
+        """
+        try:
+            return self.table.save(entity)
+        except UniqueViolationException:
+            raise UserAlreadyExistsException(entity.email)
+
+    async def delete(self, id: int) -> bool:
+        """
+        ID로 사용자를 삭제합니다.
+        """
+        return self.table.delete(id)
+
+    async def get_all_user(self, skip: int = 0, limit: int = 100) -> List[User]:
+        """
+        모든 사용자 조회
+        """
+        ids = sorted(self.table.rows)[skip:skip + limit]
+        return [self.table.get(id) for id in ids]
+
+    async def get_by_id(self, id: int) -> Optional[User]:
+        """
+        ID로 사용자를 조회합니다.
+        """
+        return self.table.get(id)
+
+    async def get_by_ids(self, ids: List[int]) -> List[User]:
+        """
+        여러 ID의 사용자를 조회합니다. 존재하지 않는 ID는 결과에서 빠집니다.
+        """
+        return [user for user in (self.table.get(id) for id in sorted(set(ids))) if user]
+
+    async def get_all(self) -> List[User]:
+        """
+        모든 사용자를 조회합니다.
+        """
+        return self.table.all()
+
+    async def count(self) -> int:
+        """
+        전체 사용자 수를 반환합니다.
+        """
+        return len(self.table.rows)
+
+    async def exists(self, id: int) -> bool:
+        """
+        해당 ID의 사용자가 존재하는지 확인합니다.
+        """
+        return id in self.table.rows
+
+    async def get_all_emails(self) -> List[str]:
+        """
+        모든 사용자의 이메일을 조회합니다.
+        """
+        return list(self.table.indexes["email"])
+
+    async def get_emails_updated_since(self, since: datetime) -> List[str]:
+        """
+        since 이후 생성/수정된 사용자의 이메일을 조회합니다.
+        """
+        return [user.email for user in self.table.rows.values() if user.updated_at >= since]
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """
+        이메일로 사용자를 조회합니다.
+        """
+        return self.table.first_by("email", email)
+
+    async def get_by_tenant_id(self, tenant_id: int, skip: int = 0, limit: int = 100) -> List[User]:
+        """
+        테넌트 ID로 사용자 목록을 조회합니다.
+        """
+        ids = self.table.ids_by("tenant_id", tenant_id)[skip:skip + limit]
+        return [self.table.get(id) for id in ids]
+
+    async def stream_by_tenant_id(self, tenant_id: int, batch_size: int = 1000) -> AsyncIterator[User]:
+        """
+        테넌트의 모든 사용자를 ID 순으로 하나씩 반환합니다.
+        """
+        for id in self.table.ids_by("tenant_id", tenant_id):
+            user = self.table.get(id)
+            if user is not None:
+                yield user
+
+    async def get_admin_users(self, skip: int = 0, limit: int = 100) -> List[User]:
+        """
+        관리자 사용자 목록을 조회합니다.
+        """
+        ids = self.table.ids_by("is_admin", True)[skip:skip + limit]
+        return [self.table.get(id) for id in ids]
+
+    async def exists_by_email(self, email: str) -> bool:
+        """
+        해당 이메일의 사용자가 존재하는지 확인합니다.
+        """
+        return email in self.table.indexes["email"]
+
+    async def get_version(self, id: int) -> Optional[datetime]:
+        """
+        ID로 사용자의 수정 시각만 조회합니다.
+        """
+        user = self.table.rows.get(id)
+        return user.updated_at if user else None
+
+    async def get_versions(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        tenant_id: int = None,
+        admin_only: bool = False,
+    ) -> List[Tuple[int, datetime]]:
+        """
+        목록 조회와 같은 조건으로 사용자의 (ID, 수정 시각)만 조회합니다.
+        """
+        ids = set(self.table.rows) if tenant_id is None else set(self.table.ids_by("tenant_id", tenant_id))
+        if admin_only:
+            ids &= set(self.table.ids_by("is_admin", True))
+        return [(id, self.table.rows[id].updated_at) for id in sorted(ids)[skip:skip + limit]]
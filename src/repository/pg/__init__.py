@@ -1,3 +1,4 @@
 from repository.pg.user_pg_repository import UserPgRepository
 from repository.pg.project_pg_repository import ProjectPgRepository, ProjectMemberPgRepository
-from repository.pg.tenant_pg_repository import TenantPgRepository
\ No newline at end of file
+from repository.pg.tenant_pg_repository import TenantPgRepository
+from repository.pg.change_feed_pg_repository import ChangeFeedPgRepository
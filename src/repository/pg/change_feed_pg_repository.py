@@ -0,0 +1,69 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import select, tuple_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.model import ProjectModel, DeletedEntityModel, CHANGE_FEED_ENTITIES
+from repository.interface.change_feed_repository import IChangeFeedRepository, Watermark
+
+# 변경 피드로 내보내지 않는 민감한 컬럼
+EXCLUDED_COLUMNS = {"password_hash", "email_code", "email_code_expires_at"}
+
+
+class ChangeFeedPgRepository(IChangeFeedRepository):
+    
+    def __init__(self, session: AsyncSession):
+        self.session = session
+    
+    async def get_changes(
+        self,
+        entity_type: str,
+        since: Optional[Watermark],
+        until: datetime,
+        limit: int,
+        tenant_id: int = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        워터마크 이후 until까지 생성/수정된 엔티티를 (updated_at, id) 순서로 조회합니다.
+        """
+        table = CHANGE_FEED_ENTITIES[entity_type].__table__
+        stmt = select(*[column for column in table.c if column.name not in EXCLUDED_COLUMNS])
+        stmt = stmt.where(table.c.updated_at <= until)
+        if since is not None:
+            # (updated_at, id) 복합 인덱스를 그대로 사용하는 row value 비교
+            stmt = stmt.where(tuple_(table.c.updated_at, table.c.id) > tuple_(*since))
+        if tenant_id is not None:
+            if "tenant_id" in table.c:
+                stmt = stmt.where(table.c.tenant_id == tenant_id)
+            else:
+                stmt = stmt.where(table.c.project_id.in_(select(ProjectModel.id).where(ProjectModel.tenant_id == tenant_id)))
+        stmt = stmt.order_by(table.c.updated_at, table.c.id).limit(limit).execution_options(read_replica=True)
+        
+        result = await self.session.execute(stmt)
+        return [dict(row) for row in result.mappings().all()]
+    
+    async def get_deletes(
+        self,
+        entity_type: str,
+        since: Optional[Watermark],
+        until: datetime,
+        limit: int,
+        tenant_id: int = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        워터마크 이후 until까지 삭제된 엔티티의 tombstone을 (updated_at, id) 순서로 조회합니다.
+        """
+        stmt = select(DeletedEntityModel.id, DeletedEntityModel.entity_id, DeletedEntityModel.updated_at).where(
+            DeletedEntityModel.entity_type == entity_type,
+            DeletedEntityModel.updated_at <= until,
+        )
+        if since is not None:
+            stmt = stmt.where(tuple_(DeletedEntityModel.updated_at, DeletedEntityModel.id) > tuple_(*since))
+        if tenant_id is not None:
+            # 테넌트를 알 수 없었던 tombstone도 함께 전달 (없는 ID 삭제는 소비자에게 무해)
+            stmt = stmt.where(or_(DeletedEntityModel.tenant_id == tenant_id, DeletedEntityModel.tenant_id.is_(None)))
+        stmt = stmt.order_by(DeletedEntityModel.updated_at, DeletedEntityModel.id).limit(limit).execution_options(read_replica=True)
+        
+        result = await self.session.execute(stmt)
+        return [dict(row) for row in result.mappings().all()]
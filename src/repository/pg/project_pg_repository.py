@@ -1,8 +1,10 @@
 from typing import List, Optional
-from sqlalchemy import select, exists
+from sqlalchemy import select, exists, or_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.util import identity_key
 
+from cache import coalesce
 from db.model.project import ProjectModel, ProjectMemberModel
 from domain import Project, ProjectMember
 from repository.interface.project_repository import IProjectRepository, IProjectMemberRepository
@@ -19,8 +21,8 @@ class ProjectPgRepository(IProjectRepository):
         """
         project_model = ProjectModel.from_domain(entity)
         
-        # upsert
-        self.session.add(project_model)
+        # upsert: ID가 있으면 기존 행을 갱신 (add는 항상 INSERT를 시도함)
+        project_model = await self.session.merge(project_model)
         await self.session.commit()
         await self.session.refresh(project_model)
         
@@ -38,20 +40,33 @@ class ProjectPgRepository(IProjectRepository):
         await self.session.commit()
         return True
     
+    @coalesce
     async def get_by_id(self, id: int) -> Optional[Project]:
         """
         ID로 프로젝트를 조회합니다.
         """
-        project = await self.session.get(ProjectModel, id)
+        # session.get은 세션에 이미 있는 프로젝트면 조회하지 않아 만료된 멤버 목록을 다시 로드하지 못함
+        stmt = select(ProjectModel).where(ProjectModel.id == id).options(selectinload(ProjectModel.members))
+        project = (await self.session.execute(stmt)).scalars().first()
         if not project:
             return None
         return project.to_domain()
     
+    async def get_by_ids(self, ids: List[int]) -> List[Project]:
+        """
+        여러 ID의 프로젝트를 한 번의 쿼리로 조회합니다. 존재하지 않는 ID는 결과에서 빠집니다.
+        """
+        if not ids:
+            return []
+        stmt = select(ProjectModel).where(ProjectModel.id.in_(set(ids))).options(selectinload(ProjectModel.members))
+        result = await self.session.execute(stmt)
+        return [project.to_domain() for project in result.scalars().all()]
+    
     async def get_all(self) -> List[Project]:
         """
         모든 프로젝트를 조회합니다.
         """
-        result = await self.session.execute(select(ProjectModel))
+        result = await self.session.execute(select(ProjectModel).options(selectinload(ProjectModel.members)))
         projects = result.scalars().all()
         return [project.to_domain() for project in projects]
     
@@ -74,7 +89,7 @@ class ProjectPgRepository(IProjectRepository):
         """
         프로젝트 이름으로 프로젝트를 조회합니다.
         """
-        stmt = select(ProjectModel).where(ProjectModel.name == name)
+        stmt = select(ProjectModel).where(ProjectModel.name == name).options(selectinload(ProjectModel.members))
         result = await self.session.execute(stmt)
         project = result.scalars().first()
         return project.to_domain() if project else None
@@ -83,7 +98,12 @@ class ProjectPgRepository(IProjectRepository):
         """
         테넌트 ID로 프로젝트 목록을 조회합니다.
         """
-        stmt = select(ProjectModel).where(ProjectModel.tenant_id == tenant_id)
+        stmt = (
+            select(ProjectModel)
+            .where(ProjectModel.tenant_id == tenant_id)
+            .options(selectinload(ProjectModel.members))
+            .execution_options(read_replica=True)
+        )
         result = await self.session.execute(stmt)
         projects = result.scalars().all()
         return [project.to_domain() for project in projects]
@@ -92,7 +112,7 @@ class ProjectPgRepository(IProjectRepository):
         """
         소유자 ID로 프로젝트 목록을 조회합니다.
         """
-        stmt = select(ProjectModel).where(ProjectModel.owner_id == owner_id)
+        stmt = select(ProjectModel).where(ProjectModel.owner_id == owner_id).options(selectinload(ProjectModel.members))
         result = await self.session.execute(stmt)
         projects = result.scalars().all()
         return [project.to_domain() for project in projects]
@@ -101,24 +121,16 @@ class ProjectPgRepository(IProjectRepository):
         """
         사용자 ID로 사용자가 속한 프로젝트 목록을 조회합니다.
         """
-        # TODO : Eager loading
-        owned_stmt = select(ProjectModel).where(ProjectModel.owner_id == user_id)
-        member_stmt = select(ProjectModel).join(
-            ProjectMemberModel, 
-            ProjectModel.id == ProjectMemberModel.project_id
-        ).where(ProjectMemberModel.user_id == user_id)
-        
-        owned_result = await self.session.execute(owned_stmt)
-        member_result = await self.session.execute(member_stmt)
-        
-        owned_projects = owned_result.scalars().all()
-        member_projects = member_result.scalars().all()
-        
-        all_projects = {}
-        for project in owned_projects + member_projects:
-            all_projects[project.id] = project
-        
-        return [project.to_domain() for project in all_projects.values()]
+        # 소유한 프로젝트와 멤버로 속한 프로젝트를 한 번에 조회하고, 멤버는 selectinload로 함께 로드
+        member_project_ids = select(ProjectMemberModel.project_id).where(ProjectMemberModel.user_id == user_id)
+        stmt = (
+            select(ProjectModel)
+            .where(or_(ProjectModel.owner_id == user_id, ProjectModel.id.in_(member_project_ids)))
+            .options(selectinload(ProjectModel.members))
+            .order_by(ProjectModel.id)
+        )
+        result = await self.session.execute(stmt)
+        return [project.to_domain() for project in result.scalars().all()]
 
 
 class ProjectMemberPgRepository(IProjectMemberRepository):
@@ -126,16 +138,26 @@ class ProjectMemberPgRepository(IProjectMemberRepository):
     def __init__(self, session: AsyncSession):
         self.session = session
     
+    def _expire_project_members(self, project_id: int) -> None:
+        """
+        세션에 로드된 프로젝트의 멤버 목록을 만료시킵니다.
+        (expire_on_commit=False라서 만료시키지 않으면 같은 세션의 프로젝트 조회가 변경 전 멤버를 반환함)
+        """
+        project = self.session.identity_map.get(identity_key(ProjectModel, project_id))
+        if project is not None:
+            self.session.expire(project, ["members"])
+    
     async def save(self, entity: ProjectMember) -> ProjectMember:
         """
         프로젝트 멤버 엔티티를 저장하거나 업데이트합니다.
         """
         member_model = ProjectMemberModel.from_domain(entity)
         
-        # upsert
-        self.session.add(member_model)
+        # upsert: ID가 있으면 기존 행을 갱신 (add는 항상 INSERT를 시도함)
+        member_model = await self.session.merge(member_model)
         await self.session.commit()
         await self.session.refresh(member_model)
+        self._expire_project_members(member_model.project_id)
         
         return member_model.to_domain()
     
@@ -149,6 +171,7 @@ class ProjectMemberPgRepository(IProjectMemberRepository):
         
         await self.session.delete(member)
         await self.session.commit()
+        self._expire_project_members(member.project_id)
         return True
     
     async def get_by_id(self, id: int) -> Optional[ProjectMember]:
@@ -160,6 +183,16 @@ class ProjectMemberPgRepository(IProjectMemberRepository):
             return None
         return member.to_domain()
     
+    async def get_by_ids(self, ids: List[int]) -> List[ProjectMember]:
+        """
+        여러 ID의 프로젝트 멤버를 한 번의 쿼리로 조회합니다. 존재하지 않는 ID는 결과에서 빠집니다.
+        """
+        if not ids:
+            return []
+        stmt = select(ProjectMemberModel).where(ProjectMemberModel.id.in_(set(ids)))
+        result = await self.session.execute(stmt)
+        return [member.to_domain() for member in result.scalars().all()]
+    
     async def get_all(self) -> List[ProjectMember]:
         """
         모든 프로젝트 멤버를 조회합니다.
@@ -2,15 +2,30 @@ from typing import List, Optional
 from sqlalchemy import select, exists
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from cache import TenantCache
 from db.model import TenantModel
 from domain import Tenant
 from repository.interface import ITenantRepository
 
 
 class TenantPgRepository(ITenantRepository):
+    """
+    테넌트 저장소
+
+    `cache`가 주어지면 캐시에 있는 테넌트는 DB를 거치지 않고 응답하고, 캐시에 없으면 DB에서
+    조회해 찾은 테넌트를 캐시에 넣습니다. (다른 프로세스가 만든 테넌트는 다음 갱신 전까지 캐시에
+    없으므로 캐시에 없다는 것만으로 존재하지 않는다고 판단하지 않음) 저장/삭제 시 캐시를 함께 갱신합니다.
+    """
     
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, cache: Optional[TenantCache] = None):
         self.session = session
+        self.cache = cache
+
+    def _cached(self, tenant: Optional[Tenant]) -> Optional[Tenant]:
+        """DB에서 찾은 테넌트를 캐시에 넣습니다."""
+        if tenant is not None and self.cache is not None:
+            self.cache.put(tenant)
+        return tenant
     
     async def save(self, entity: Tenant) -> Tenant:
         """
@@ -18,12 +33,15 @@ class TenantPgRepository(ITenantRepository):
         """
         tenant_model = TenantModel.from_domain(entity)
         
-        # upsert
-        self.session.add(tenant_model)
+        # upsert: ID가 있으면 기존 행을 갱신 (add는 항상 INSERT를 시도함)
+        tenant_model = await self.session.merge(tenant_model)
         await self.session.commit()
         await self.session.refresh(tenant_model)
         
-        return tenant_model.to_domain()
+        tenant = tenant_model.to_domain()
+        if self.cache is not None:
+            self.cache.put(tenant)
+        return tenant
     
     async def delete(self, id: int) -> bool:
         """
@@ -35,16 +53,38 @@ class TenantPgRepository(ITenantRepository):
         
         await self.session.delete(tenant)
         await self.session.commit()
+        if self.cache is not None:
+            self.cache.remove(id)
         return True
     
     async def get_by_id(self, id: int) -> Optional[Tenant]:
         """
         ID로 테넌트를 조회합니다.
         """
+        if self.cache is not None:
+            tenant = self.cache.get_by_id(id)
+            if tenant is not None:
+                return tenant
+
         tenant = await self.session.get(TenantModel, id)
         if not tenant:
             return None
-        return tenant.to_domain()
+        return self._cached(tenant.to_domain())
+    
+    async def get_by_ids(self, ids: List[int]) -> List[Tenant]:
+        """
+        여러 ID의 테넌트를 한 번의 쿼리로 조회합니다. 존재하지 않는 ID는 결과에서 빠집니다.
+        """
+        found = []
+        missing = set(ids)
+        if self.cache is not None:
+            found = [tenant for tenant in (self.cache.get_by_id(id) for id in missing) if tenant]
+            missing -= {tenant.id for tenant in found}
+        if not missing:
+            return found
+        stmt = select(TenantModel).where(TenantModel.id.in_(missing))
+        result = await self.session.execute(stmt)
+        return found + [self._cached(tenant.to_domain()) for tenant in result.scalars().all()]
     
     async def get_all(self) -> List[Tenant]:
         """
@@ -65,6 +105,10 @@ class TenantPgRepository(ITenantRepository):
         """
         해당 ID의 테넌트가 존재하는지 확인합니다.
         """
+        if self.cache is not None:
+            # 캐시에 없으면 DB에서 조회하며 찾은 테넌트는 캐시에 들어감
+            return await self.get_by_id(id) is not None
+
         stmt = select(exists().where(TenantModel.id == id))
         result = await self.session.execute(stmt)
         return result.scalar()
@@ -73,15 +117,23 @@ class TenantPgRepository(ITenantRepository):
         """
         테넌트 이름으로 테넌트를 조회합니다.
         """
+        if self.cache is not None:
+            tenant = self.cache.get_by_name(name)
+            if tenant is not None:
+                return tenant
+
         stmt = select(TenantModel).where(TenantModel.name == name)
         result = await self.session.execute(stmt)
         tenant = result.scalars().first()
-        return tenant.to_domain() if tenant else None
+        return self._cached(tenant.to_domain()) if tenant else None
     
     async def exists_by_name(self, name: str) -> bool:
         """
         해당 이름의 테넌트가 존재하는지 확인합니다.
         """
+        if self.cache is not None:
+            return await self.get_by_name(name) is not None
+
         stmt = select(exists().where(TenantModel.name == name))
         result = await self.session.execute(stmt)
         return result.scalar()
\ No newline at end of file
@@ -1,9 +1,13 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
 from sqlalchemy import select, exists
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from cache import coalesce
 from db.model import UserModel
 from domain import User
+from exception.domain import UserAlreadyExistsException
 from repository.interface import IUserRepository
 
 
@@ -15,12 +19,22 @@ class UserPgRepository(IUserRepository):
     async def save(self, entity: User) -> User:
         """
         사용자 엔티티를 저장하거나 업데이트합니다.
+        다른 사용자가 사용 중인 이메일이면 UserAlreadyExistsException이 발생합니다.
         """
         user_model = UserModel.from_domain(entity)
         
-        # upsert
-        self.session.add(user_model)
-        await self.session.commit()
+        # upsert: ID가 있으면 기존 행을 갱신 (add는 항상 INSERT를 시도함)
+        user_model = await self.session.merge(user_model)
+        try:
+            await self.session.commit()
+        except IntegrityError:
+            await self.session.rollback()
+            # email 유일 제약 위반만 도메인 예외로 바꾸고, 그 외 제약 위반은 그대로 전달
+            # (id가 None이면 `id != None`은 IS NOT NULL이 되어 모든 행과 비교)
+            stmt = select(exists().where(UserModel.email == entity.email, UserModel.id != entity.id))
+            if (await self.session.execute(stmt)).scalar():
+                raise UserAlreadyExistsException(entity.email)
+            raise
         await self.session.refresh(user_model)
         
         return user_model.to_domain()
@@ -41,10 +55,12 @@ class UserPgRepository(IUserRepository):
         """
         모든 사용자 조회
         """
-        result = await self.session.execute(select(UserModel).offset(skip).limit(limit))
+        stmt = select(UserModel).order_by(UserModel.id).offset(skip).limit(limit).execution_options(read_replica=True)
+        result = await self.session.execute(stmt)
         users = result.scalars().all()
         return [user.to_domain() for user in users]
     
+    @coalesce
     async def get_by_id(self, id: int) -> Optional[User]:
         """
         ID로 사용자를 조회합니다.
@@ -54,6 +70,16 @@ class UserPgRepository(IUserRepository):
             return None
         return user.to_domain()
     
+    async def get_by_ids(self, ids: List[int]) -> List[User]:
+        """
+        여러 ID의 사용자를 한 번의 쿼리로 조회합니다. 존재하지 않는 ID는 결과에서 빠집니다.
+        """
+        if not ids:
+            return []
+        stmt = select(UserModel).where(UserModel.id.in_(set(ids)))
+        result = await self.session.execute(stmt)
+        return [user.to_domain() for user in result.scalars().all()]
+    
     async def get_all(self) -> List[User]:
         """
         모든 사용자를 조회합니다.
@@ -77,6 +103,21 @@ class UserPgRepository(IUserRepository):
         result = await self.session.execute(stmt)
         return result.scalar()
     
+    async def get_all_emails(self) -> List[str]:
+        """
+        모든 사용자의 이메일을 조회합니다. (email 인덱스만 읽음)
+        """
+        result = await self.session.execute(select(UserModel.email))
+        return list(result.scalars().all())
+
+    async def get_emails_updated_since(self, since: datetime) -> List[str]:
+        """
+        since 이후 생성/수정된 사용자의 이메일을 조회합니다. (updated_at 인덱스 사용)
+        """
+        result = await self.session.execute(select(UserModel.email).where(UserModel.updated_at >= since))
+        return list(result.scalars().all())
+    
+    @coalesce
     async def get_by_email(self, email: str) -> Optional[User]:
         """
         이메일로 사용자를 조회합니다.
@@ -90,16 +131,31 @@ class UserPgRepository(IUserRepository):
         """
         테넌트 ID로 사용자 목록을 조회합니다.
         """
-        stmt = select(UserModel).where(UserModel.tenant_id == tenant_id)
+        stmt = select(UserModel).where(UserModel.tenant_id == tenant_id).order_by(UserModel.id).execution_options(read_replica=True)
         result = await self.session.execute(stmt.offset(skip).limit(limit))
         users = result.scalars().all()
         return [user.to_domain() for user in users]
     
+    async def stream_by_tenant_id(self, tenant_id: int, batch_size: int = 1000) -> AsyncIterator[User]:
+        """
+        테넌트의 모든 사용자를 서버 측 커서로 batch_size개씩 읽어 하나씩 반환합니다.
+        목록 전체를 메모리에 올리지 않습니다.
+        """
+        stmt = (
+            select(UserModel)
+            .where(UserModel.tenant_id == tenant_id)
+            .order_by(UserModel.id)
+            .execution_options(yield_per=batch_size, read_replica=True)
+        )
+        result = await self.session.stream(stmt)
+        async for user in result.scalars():
+            yield user.to_domain()
+    
     async def get_admin_users(self, skip: int = 0, limit: int = 100) -> List[User]:
         """
         관리자 사용자 목록을 조회합니다.
         """
-        stmt = select(UserModel).where(UserModel.is_admin == True)
+        stmt = select(UserModel).where(UserModel.is_admin == True).order_by(UserModel.id).execution_options(read_replica=True)
         result = await self.session.execute(stmt.offset(skip).limit(limit))
         users = result.scalars().all()
         return [user.to_domain() for user in users]
@@ -110,4 +166,30 @@ class UserPgRepository(IUserRepository):
         """
         stmt = select(exists().where(UserModel.email == email))
         result = await self.session.execute(stmt)
-        return result.scalar()
\ No newline at end of file
+        return result.scalar()
+    
+    async def get_version(self, id: int) -> Optional[datetime]:
+        """
+        ID로 사용자의 수정 시각만 조회합니다. (ETag 확인용 경량 조회)
+        """
+        result = await self.session.execute(select(UserModel.updated_at).where(UserModel.id == id))
+        return result.scalar()
+    
+    async def get_versions(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        tenant_id: int = None,
+        admin_only: bool = False,
+    ) -> List[Tuple[int, datetime]]:
+        """
+        목록 조회와 같은 조건으로 사용자의 (ID, 수정 시각)만 조회합니다. (ETag 확인용 경량 조회)
+        """
+        stmt = select(UserModel.id, UserModel.updated_at)
+        if tenant_id is not None:
+            stmt = stmt.where(UserModel.tenant_id == tenant_id)
+        if admin_only:
+            stmt = stmt.where(UserModel.is_admin == True)
+        stmt = stmt.order_by(UserModel.id).offset(skip).limit(limit).execution_options(read_replica=True)
+        result = await self.session.execute(stmt)
+        return [(id, updated_at) for id, updated_at in result.all()]
@@ -1,2 +1,3 @@
 from service.user_service import UserService
-from service.project_service import ProjectService
\ No newline at end of file
+from service.project_service import ProjectService
+from service.change_feed_service import ChangeFeedService
\ No newline at end of file
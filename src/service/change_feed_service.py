@@ -0,0 +1,76 @@
+import base64
+import json
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from config import APIConfig
+from db.model import CHANGE_FEED_ENTITIES
+from repository.interface import IChangeFeedRepository
+from exception.domain import InvalidChangeCursorException, UnknownChangeFeedEntityException
+
+
+class ChangeFeedService:
+    """
+    엔티티 변경 피드 서비스
+
+    커서는 생성/수정 워터마크와 삭제(tombstone) 워터마크를 함께 담습니다. 각 워터마크는
+    마지막으로 전달한 행의 (updated_at, id)이므로 다음 요청은 인덱스를 따라 그 이후의 변경만 읽습니다.
+    늦게 커밋된 트랜잭션의 변경을 건너뛰지 않도록 settle_seconds보다 최근의 변경은 다음 요청으로 미룹니다.
+
+    tombstone은 ORM 삭제(session.delete)에서만 자동으로 기록됩니다. 벌크/core DELETE나 DB에서 직접
+    지운 행은 삭제하는 코드가 db.session.tombstone_rows로 기록하지 않으면 피드에 전달되지 않습니다.
+    """
+    
+    def __init__(self, change_feed_repository: IChangeFeedRepository, settle_seconds: float = None):
+        self.change_feed_repository = change_feed_repository
+        self.settle_seconds = APIConfig.CHANGE_FEED_SETTLE_SECONDS if settle_seconds is None else settle_seconds
+    
+    @staticmethod
+    def encode_cursor(cursor: Dict[str, Any]) -> str:
+        """워터마크를 URL에 넣을 수 있는 문자열로 변환합니다."""
+        payload = {
+            key: [watermark[0].isoformat(), watermark[1]]
+            for key, watermark in cursor.items() if watermark is not None
+        }
+        return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+    
+    @staticmethod
+    def decode_cursor(cursor: Optional[str]) -> Dict[str, Any]:
+        """문자열 커서를 워터마크로 변환합니다."""
+        if not cursor:
+            return {"changes": None, "deletes": None}
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+            return {
+                key: (datetime.fromisoformat(payload[key][0]), int(payload[key][1])) if key in payload else None
+                for key in ("changes", "deletes")
+            }
+        except (ValueError, TypeError, KeyError, IndexError):
+            raise InvalidChangeCursorException(cursor)
+    
+    async def get_changes(self, entity_type: str, cursor: Optional[str] = None, limit: int = 100, tenant_id: int = None) -> Dict[str, Any]:
+        """
+        커서 이후 변경된 엔티티와 삭제된 엔티티 ID를 조회합니다.
+        """
+        if entity_type not in CHANGE_FEED_ENTITIES:
+            raise UnknownChangeFeedEntityException(entity_type)
+        limit = max(1, min(limit, APIConfig.CHANGE_FEED_MAX_LIMIT))
+        watermarks = self.decode_cursor(cursor)
+        until = datetime.now() - timedelta(seconds=self.settle_seconds)
+        
+        changes = await self.change_feed_repository.get_changes(entity_type, watermarks["changes"], until, limit + 1, tenant_id)
+        deletes = await self.change_feed_repository.get_deletes(entity_type, watermarks["deletes"], until, limit + 1, tenant_id)
+        has_more = len(changes) > limit or len(deletes) > limit
+        changes, deletes = changes[:limit], deletes[:limit]
+        
+        if changes:
+            watermarks["changes"] = (changes[-1]["updated_at"], changes[-1]["id"])
+        if deletes:
+            watermarks["deletes"] = (deletes[-1]["updated_at"], deletes[-1]["id"])
+        
+        return {
+            "changes": changes,
+            "deleted_ids": [tombstone["entity_id"] for tombstone in deletes],
+            "next_cursor": self.encode_cursor(watermarks),
+            "has_more": has_more,
+        }
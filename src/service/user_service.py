@@ -1,7 +1,10 @@
 from datetime import datetime
-from typing import List
+from typing import AsyncIterator, List, Optional, Tuple
 
+from cache import UserCache, EmailExistenceFilter, strip_credentials
+from db.shard import EmailDirectory
 from domain.user import User
+from utils import hash_password
 from repository.interface import IUserRepository
 from exception.domain import (
     UserNotFoundException,
@@ -11,9 +14,32 @@ from exception.domain import (
 
 
 class UserService:
+    """
+    사용자 서비스
+
+    `user_cache`가 주어지면 ID/이메일 조회를 캐시에서 먼저 찾고, 저장/삭제 시 캐시를 무효화합니다.
+    조회 결과는 `with_credentials=True`로 요청한 경우에만 비밀번호 해시와 인증 코드를 포함합니다.
+    `email_filter`가 주어지면 확실히 가입되지 않은 이메일은 DB 조회 없이 판별합니다. 다른 프로세스의
+    가입은 필터 동기화 간격만큼 늦게 반영되며, 그 사이의 중복 가입은 email 유일 제약이 막습니다.
+    `email_directory`가 주어지면(샤드가 여러 개인 경우) 로그인 시 샤드를 찾을 수 있도록
+    사용자의 이메일과 테넌트를 전역 디렉터리에 기록합니다.
+    """
     
-    def __init__(self, user_repository: IUserRepository):
+    def __init__(
+        self,
+        user_repository: IUserRepository,
+        user_cache: Optional[UserCache] = None,
+        email_filter: Optional[EmailExistenceFilter] = None,
+        email_directory: Optional[EmailDirectory] = None,
+    ):
         self.user_repository = user_repository
+        self.user_cache = user_cache
+        self.email_filter = email_filter
+        self.email_directory = email_directory
+
+    def _email_absent(self, email: str) -> bool:
+        """필터로 확실히 가입되지 않은 이메일인지 확인합니다."""
+        return self.email_filter is not None and not self.email_filter.might_exist(email)
 
     async def get_all_user(self, skip: int = 0, limit: int = 100) -> List[User]:
         """모든 사용자 조회"""
@@ -23,7 +49,8 @@ class UserService:
         """
         새로운 사용자를 생성합니다.
         """
-        if await self.user_repository.exists_by_email(email):
+        # 필터가 아직 모르는 다른 프로세스의 가입과 겹치면 저장 시 email 유일 제약에서 거절됨
+        if not self._email_absent(email) and await self.user_repository.exists_by_email(email):
             raise UserAlreadyExistsException(email)
         
         user = User.create(
@@ -34,25 +61,77 @@ class UserService:
             is_admin=is_admin
         )
         
-        return await self.user_repository.save(user)
+        return await self._save(user)
     
-    async def get_user_by_id(self, user_id: int) -> User:
+    async def get_user_by_id(self, user_id: int, with_credentials: bool = False) -> User:
         """
         ID로 사용자를 조회합니다.
         """
+        if self.user_cache is not None and not with_credentials:
+            user = await self.user_cache.get_by_id(user_id)
+            if user is not None:
+                return user
+
         user = await self.user_repository.get_by_id(user_id)
         if not user:
             raise UserNotFoundException(user_id=str(user_id))
-        return user
+        return await self._cached(user, with_credentials)
     
-    async def get_user_by_email(self, email: str) -> User:
+    async def get_user_by_email(self, email: str, with_credentials: bool = False) -> User:
         """
         이메일로 사용자를 조회합니다.
         """
+        if self._email_absent(email):
+            raise UserNotFoundException(email=email)
+
+        if self.user_cache is not None and not with_credentials:
+            user = await self.user_cache.get_by_email(email)
+            if user is not None:
+                return user
+
         user = await self.user_repository.get_by_email(email)
         if not user:
             raise UserNotFoundException(email=email)
-        return user
+        return await self._cached(user, with_credentials)
+
+    async def get_users_by_ids(self, user_ids: List[int]) -> Tuple[List[User], List[int]]:
+        """
+        여러 ID의 사용자를 한 번에 조회합니다.
+        캐시에 없는 ID만 저장소에서 한 번의 쿼리로 읽으며, (요청 순서대로 찾은 사용자, 없는 ID 목록)을 반환합니다.
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+        found = {}
+        if self.user_cache is not None:
+            for user_id in user_ids:
+                user = await self.user_cache.get_by_id(user_id)
+                if user is not None:
+                    found[user_id] = user
+
+        missing = [user_id for user_id in user_ids if user_id not in found]
+        if missing:
+            for user in await self.user_repository.get_by_ids(missing):
+                found[user.id] = await self._cached(user, with_credentials=False)
+
+        users = [found[user_id] for user_id in user_ids if user_id in found]
+        return users, [user_id for user_id in user_ids if user_id not in found]
+
+    async def _cached(self, user: User, with_credentials: bool) -> User:
+        """DB에서 읽은 사용자를 캐시에 넣고, 요청에 맞게 자격 증명을 제거해 반환합니다."""
+        if self.user_cache is not None:
+            await self.user_cache.put(user)
+        return user if with_credentials else strip_credentials(user)
+
+    async def _save(self, user: User) -> User:
+        """사용자를 저장하고 캐시된 이전 상태를 무효화합니다."""
+        if self.email_directory is not None:
+            # 저장 전에 기록: 저장이 실패해 남은 항목은 로그인 시 사용자를 찾지 못할 뿐임
+            await self.email_directory.register(user.email, user.tenant_id)
+        saved = await self.user_repository.save(user)
+        if self.email_filter is not None:
+            self.email_filter.add(saved.email)
+        if self.user_cache is not None:
+            await self.user_cache.invalidate(user_id=saved.id, email=saved.email)
+        return saved
     
     async def get_users_by_tenant(self, tenant_id: int, skip: int = 0, limit: int = 100) -> List[User]:
         """
@@ -60,17 +139,45 @@ class UserService:
         """
         return await self.user_repository.get_by_tenant_id(tenant_id, skip, limit)
     
+    def stream_users_by_tenant(self, tenant_id: int, batch_size: int = 1000) -> AsyncIterator[User]:
+        """
+        테넌트의 모든 사용자를 스트리밍으로 조회합니다. (내보내기용)
+        """
+        return self.user_repository.stream_by_tenant_id(tenant_id, batch_size)
+    
     async def get_admin_users(self, skip: int = 0, limit: int = 100) -> List[User]:
         """
         관리자 사용자 목록을 조회합니다.
         """
         return await self.user_repository.get_admin_users(skip, limit)
     
+    async def get_user_version(self, user_id: int) -> Optional[datetime]:
+        """
+        사용자의 수정 시각만 조회합니다. 캐시에 있으면 DB를 조회하지 않습니다.
+        """
+        if self.user_cache is not None:
+            user = await self.user_cache.get_by_id(user_id)
+            if user is not None:
+                return user.updated_at
+        return await self.user_repository.get_version(user_id)
+    
+    async def get_user_versions(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        tenant_id: int = None,
+        admin_only: bool = False,
+    ) -> List[Tuple[int, datetime]]:
+        """
+        사용자 목록의 (ID, 수정 시각)만 조회합니다.
+        """
+        return await self.user_repository.get_versions(skip, limit, tenant_id, admin_only)
+    
     async def authenticate_user(self, email: str, password: str) -> User:
         """
         사용자 인증을 수행합니다.
         """
-        user = await self.get_user_by_email(email)
+        user = await self.get_user_by_email(email, with_credentials=True)
         
         user.verify_password(password)
         
@@ -80,22 +187,34 @@ class UserService:
         """
         사용자 정보를 업데이트합니다.
         """
-        return await self.user_repository.save(user)
+        return await self._save(user)
     
     async def delete_user(self, user_id: int) -> bool:
         """
         사용자를 삭제합니다.
         """
-        if not await self.user_repository.exists(user_id):
+        if self.email_filter is not None or self.email_directory is not None:
+            # 필터/디렉터리에서 제거할 이메일이 필요하므로 존재 확인 대신 사용자를 조회
+            user = await self.user_repository.get_by_id(user_id)
+            if not user:
+                raise UserNotFoundException(user_id=str(user_id))
+        elif not await self.user_repository.exists(user_id):
             raise UserNotFoundException(user_id=str(user_id))
         
-        return await self.user_repository.delete(user_id)
+        deleted = await self.user_repository.delete(user_id)
+        if deleted and self.email_filter is not None:
+            self.email_filter.remove(user.email)
+        if deleted and self.email_directory is not None:
+            await self.email_directory.remove(user.email)
+        if self.user_cache is not None:
+            await self.user_cache.invalidate(user_id=user_id)
+        return deleted
     
     async def change_password(self, user_id: int, current_password: str, new_password: str) -> User:
         """
         사용자 비밀번호를 변경합니다.
         """
-        user = await self.get_user_by_id(user_id)
+        user = await self.get_user_by_id(user_id, with_credentials=True)
         
         user.change_password(current_password, new_password)
         
@@ -105,7 +224,7 @@ class UserService:
         """
         이메일 인증 코드를 생성합니다.
         """
-        user = await self.get_user_by_id(user_id)
+        user = await self.get_user_by_id(user_id, with_credentials=True)
         
         email_code = user.generate_email_code(expires_in_minutes)
         
@@ -117,7 +236,7 @@ class UserService:
         """
         이메일 인증을 수행합니다.
         """
-        user = await self.get_user_by_id(user_id)
+        user = await self.get_user_by_id(user_id, with_credentials=True)
         
         user.verify_email(email_code)
         
@@ -127,7 +246,7 @@ class UserService:
         """
         비밀번호 재설정 요청을 처리합니다.
         """
-        user = await self.get_user_by_email(email)
+        user = await self.get_user_by_email(email, with_credentials=True)
         
         if user.email_code:
             if datetime.now() < user.email_code_expires_at:
@@ -146,7 +265,7 @@ class UserService:
         """
         이메일 코드의 유효성을 검증합니다.
         """
-        user = await self.get_user_by_id(user_id)
+        user = await self.get_user_by_id(user_id, with_credentials=True)
         
         # 코드가 유효한지 확인
         if not user.email_code or user.email_code != email_code:
@@ -162,11 +281,11 @@ class UserService:
         """
         비밀번호를 재설정합니다.
         """
-        user = await self.get_user_by_id(user_id)
+        user = await self.get_user_by_id(user_id, with_credentials=True)
         
         # 비밀번호 변경
-        user.password = new_password
-        user.hash_password()
+        user.password_hash = hash_password(new_password)
+        user.update_timestamp()
         
         # 인증 코드 초기화
         user.email_code = None
@@ -0,0 +1,65 @@
+import pytest
+from datetime import datetime
+
+from api.etag import make_etag, users_etag
+from domain import User
+
+
+def make_user(id, updated_at):
+    return User(id=id, email=f"user{id}@example.com", name="U", password_hash="h", tenant_id=1, updated_at=updated_at)
+
+
+def test_etag_changes_with_version():
+    """수정 시각이나 목록 구성이 바뀌면 ETag가 달라지는지 테스트"""
+    first = datetime(2024, 1, 1)
+    second = datetime(2024, 1, 2)
+
+    assert users_etag([make_user(1, first)]) == make_etag([(1, first)])
+    assert users_etag([make_user(1, first)]) != users_etag([make_user(1, second)])
+    assert users_etag([make_user(1, first)]) != users_etag([make_user(1, first), make_user(2, first)])
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_returns_304(tmp_path):
+    """If-None-Match가 현재 ETag와 같으면 본문 없이 304를 반환하는지 테스트"""
+    pytest.importorskip("aiosqlite")
+    httpx = pytest.importorskip("httpx")
+    from fastapi import FastAPI
+    from api.user_api import router
+    from api.dependency import get_user_service, get_read_user_service
+    from db.session import PgSessionManager
+    from repository.pg import UserPgRepository
+    from service import UserService
+
+    manager = PgSessionManager(database_url=f"sqlite+aiosqlite:///{tmp_path / 'etag.db'}", replica_urls=[])
+    await manager.init_db()
+
+    async def override_user_service():
+        async with manager.async_session_maker() as session:
+            yield UserService(UserPgRepository(session))
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_user_service] = override_user_service
+    app.dependency_overrides[get_read_user_service] = override_user_service
+
+    try:
+        async with manager.async_session_maker() as session:
+            user = await UserPgRepository(session).save(User(email="a@example.com", name="A", password_hash="h", tenant_id=1))
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            for path in [f"/users/{user.id}", "/users", "/users/by-tenant/1"]:
+                response = await client.get(path)
+                assert response.status_code == 200
+                etag = response.headers["etag"]
+
+                response = await client.get(path, headers={"If-None-Match": etag})
+                assert response.status_code == 304
+                assert response.content == b""
+                assert response.headers["etag"] == etag
+
+                response = await client.get(path, headers={"If-None-Match": '"stale"'})
+                assert response.status_code == 200
+    finally:
+        await manager.close_db()
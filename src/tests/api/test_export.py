@@ -0,0 +1,79 @@
+import csv
+import io
+import json
+import logging
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_export_tenant_users(tmp_path, caplog):
+    """테넌트 사용자를 NDJSON/CSV로 스트리밍 내보내는지 테스트"""
+    pytest.importorskip("aiosqlite")
+    httpx = pytest.importorskip("httpx")
+    from fastapi import FastAPI
+    from api.user_api import router
+    from api.dependency import get_tenant_session_manager
+    from db.session import PgSessionManager
+    from domain import User
+    from repository.pg import UserPgRepository
+
+    manager = PgSessionManager(database_url=f"sqlite+aiosqlite:///{tmp_path / 'export.db'}", replica_urls=[])
+    await manager.init_db()
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_tenant_session_manager] = lambda: manager
+
+    try:
+        async with manager.async_session_maker() as session:
+            repository = UserPgRepository(session)
+            for i in range(1200):
+                await repository.save(User(email=f"user{i}@example.com", name=f"U{i}", password_hash="h", tenant_id=1 if i % 2 else 2))
+
+        caplog.set_level(logging.INFO, logger="notaai.export")
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/users/by-tenant/1/export")
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "application/x-ndjson"
+            rows = [json.loads(line) for line in response.text.splitlines()]
+            assert len(rows) == 600
+            assert all(row["tenant_id"] == 1 for row in rows)
+            assert "password_hash" not in rows[0]
+            assert [row["id"] for row in rows] == sorted(row["id"] for row in rows)
+
+            response = await client.get("/users/by-tenant/2/export", params={"format": "csv"})
+            assert response.status_code == 200
+            rows = list(csv.DictReader(io.StringIO(response.text)))
+            assert len(rows) == 600
+            assert rows[0]["email"] == "user0@example.com"
+
+        # 처리량은 print 대신 로거로 기록
+        assert any(record.name == "notaai.export" and "600 rows" in record.getMessage() for record in caplog.records)
+        # 스트리밍이 끝나면 세션 슬롯이 반납되어야 함
+        assert all(limiter.snapshot()["in_use"] == 0 for limiter in manager.fair_limiters.values())
+    finally:
+        await manager.close_db()
+
+
+@pytest.mark.asyncio
+async def test_unsent_export_holds_no_connection(tmp_path):
+    """본문을 보내지 않고 닫힌 내보내기 응답이 세션 슬롯과 커넥션을 잡고 있지 않은지 테스트"""
+    pytest.importorskip("aiosqlite")
+    from starlette.requests import Request
+    from api.user_api import export_users_by_tenant
+    from db.session import PgSessionManager, BULK_LANE
+
+    manager = PgSessionManager(database_url=f"sqlite+aiosqlite:///{tmp_path / 'export.db'}", replica_urls=[])
+    await manager.init_db()
+    request = Request({"type": "http", "method": "GET", "headers": [], "client": ("10.0.0.1", 1234)})
+
+    try:
+        response = await export_users_by_tenant(request, tenant_id=1, format="ndjson", session_manager=manager)
+        # 첫 청크 전에 연결이 끊기거나 미들웨어가 실패한 경우처럼 본문을 읽지 않고 닫음
+        await response.body_iterator.aclose()
+
+        assert manager.fair_limiters[BULK_LANE].snapshot()["in_use"] == 0
+        assert manager.engines[BULK_LANE].pool.checkedout() == 0
+    finally:
+        await manager.close_db()
+
@@ -0,0 +1,26 @@
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_metrics_require_admin(user):
+    """지표 API가 미인증 요청은 401, 관리자가 아닌 사용자는 403으로 거부하는지 테스트"""
+    httpx = pytest.importorskip("httpx")
+    from fastapi import FastAPI
+    from api.metrics_api import router
+    from auth.security import get_current_user
+
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/api/metrics/loop")
+        assert response.status_code == 401
+
+        app.dependency_overrides[get_current_user] = lambda: user
+        response = await client.get("/api/metrics/loop")
+        assert response.status_code == 403
+
+        user.is_admin = True
+        response = await client.get("/api/metrics/loop")
+        assert response.status_code == 200
+        assert "p95_seconds" in response.json()
@@ -0,0 +1,58 @@
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_project_members_resolve_users_in_one_query(tmp_path):
+    """멤버 수와 관계없이 프로젝트/멤버 조회가 사용자 정보를 IN 쿼리 하나로 가져오는지 테스트"""
+    pytest.importorskip("aiosqlite")
+    httpx = pytest.importorskip("httpx")
+    from fastapi import FastAPI
+    from sqlalchemy import event
+    from api.project_api import router
+    from api.dependency import get_tenant_session_manager
+    from db.session import PgSessionManager
+    from domain import User
+    from domain.project import Project, ProjectMember
+    from repository.pg import UserPgRepository, ProjectPgRepository, ProjectMemberPgRepository
+
+    manager = PgSessionManager(database_url=f"sqlite+aiosqlite:///{tmp_path / 'project.db'}", replica_urls=[])
+    await manager.init_db()
+
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    app.dependency_overrides[get_tenant_session_manager] = lambda: manager
+
+    try:
+        async with manager.async_session_maker() as session:
+            users = [
+                await UserPgRepository(session).save(User(email=f"user{i}@example.com", name=f"U{i}", password_hash="h", tenant_id=1))
+                for i in range(20)
+            ]
+            project = await ProjectPgRepository(session).save(Project(name="p", owner_id=users[0].id, tenant_id=1))
+            for user in users:
+                await ProjectMemberPgRepository(session).save(ProjectMember(project_id=project.id, user_id=user.id, role="VIEWER", invited_by=users[0].id))
+
+        statements = []
+        event.listen(manager.engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get(f"/api/projects/{project.id}/members")
+            assert response.status_code == 200, response.text
+            members = response.json()
+            assert [member["user"]["email"] for member in members] == [user.email for user in users]
+            assert "password_hash" not in members[0]["user"]
+            assert len(statements) == 3
+
+            statements.clear()
+            response = await client.get(f"/api/projects/{project.id}")
+            assert response.status_code == 200, response.text
+            body = response.json()
+            assert body["owner"]["email"] == users[0].email
+            assert len(body["members"]) == 20 and body["members"][5]["user"]["id"] == users[5].id
+            # 프로젝트 + 멤버(selectinload) + 소유자/멤버 사용자 IN 쿼리
+            assert len(statements) == 3
+
+            assert (await client.get("/api/projects/999")).status_code == 404
+            assert (await client.get("/api/projects/999/members")).status_code == 404
+    finally:
+        await manager.close_db()
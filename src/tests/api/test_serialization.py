@@ -0,0 +1,54 @@
+import json
+import pytest
+from datetime import datetime
+
+from api.serialization import dumps, users_response
+from domain import User
+
+
+@pytest.mark.asyncio
+async def test_fast_serialization_matches_response_model():
+    """빠른 직렬화 결과가 response_model 직렬화 결과와 같은지 테스트"""
+    httpx = pytest.importorskip("httpx")
+    from fastapi import FastAPI
+    from api.dependency import get_read_user_service
+    from api.user_api import router
+    from config import APIConfig
+
+    now = datetime(2024, 1, 1, 12, 30, 15, 123456)
+    users = [User(id=i, email=f"user{i}@example.com", name=f"User {i}", password_hash="h", tenant_id=1, created_at=now) for i in range(3)]
+
+    class StaticUserService:
+        async def get_all_user(self, skip=0, limit=100):
+            return users
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_read_user_service] = lambda: StaticUserService()
+
+    original = APIConfig.FAST_SERIALIZATION
+    try:
+        bodies = []
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            for fast in (False, True):
+                APIConfig.FAST_SERIALIZATION = fast
+                response = await client.get("/users")
+                assert response.status_code == 200
+                assert "etag" in response.headers
+                bodies.append(response.json())
+    finally:
+        APIConfig.FAST_SERIALIZATION = original
+
+    assert bodies[0] == bodies[1]
+    assert "password_hash" not in bodies[1][0]
+
+
+def test_dumps_encodes_datetime():
+    """datetime이 ISO 형식으로 인코딩되는지 테스트"""
+    assert json.loads(dumps({"at": datetime(2024, 1, 1)})) == {"at": "2024-01-01T00:00:00"}
+
+
+def test_default_mode_returns_domain_objects():
+    """빠른 직렬화를 끄면 response_model 직렬화를 위해 목록을 그대로 반환하는지 테스트"""
+    users = [User(id=1, email="a@example.com", name="A", password_hash="h", tenant_id=1)]
+    assert users_response(users, fast=False) is users
@@ -0,0 +1,49 @@
+import json
+import logging
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_server_timing_header_and_log(caplog):
+    """DB/해시/직렬화 시간이 Server-Timing 헤더와 로그에 기록되는지 테스트"""
+    pytest.importorskip("aiosqlite")
+    httpx = pytest.importorskip("httpx")
+    from fastapi import APIRouter, FastAPI
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from middleware import ServerTimingMiddleware
+    from monitoring import instrument_engine
+    from monitoring.route import TimedRoute
+    from utils import hash_password
+
+    engine = create_async_engine("sqlite+aiosqlite://")
+    instrument_engine(engine.sync_engine)
+
+    router = APIRouter(prefix="/items", route_class=TimedRoute)
+
+    @router.get("/{item_id}")
+    async def get_item(item_id: int):
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        hash_password("password123")
+        return {"id": item_id}
+
+    app = FastAPI()
+    app.add_middleware(ServerTimingMiddleware)
+    app.include_router(router, prefix="/api")
+
+    try:
+        with caplog.at_level(logging.INFO, logger="notaai.timing"):
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+                response = await client.get("/api/items/7")
+    finally:
+        await engine.dispose()
+
+    assert response.status_code == 200
+    metrics = {part.split(";")[0] for part in response.headers["server-timing"].split(", ")}
+    assert {"db", "hash", "serialize", "total"} <= metrics
+
+    log = json.loads(caplog.records[-1].getMessage())
+    assert log["route"] == "/api/items/{item_id}"
+    assert log["db_count"] == 1
+    assert log["hash_ms"] > 0
@@ -0,0 +1,37 @@
+import pytest
+
+from benchmarks.bench_hot_paths import BENCHMARKS, compare, measure, run
+from config import AuthConfig
+
+
+@pytest.mark.parametrize("name", list(BENCHMARKS))
+def test_benchmark_runs(name, monkeypatch):
+    """모든 벤치마크가 예외 없이 측정되어야 함"""
+    monkeypatch.setattr(AuthConfig, "SECRET_KEY", "test-secret")
+    monkeypatch.setattr(AuthConfig, "ALGORITHM", "HS256")
+    result = measure(BENCHMARKS[name](), rounds=1, min_round_time=0)
+    assert result["median_us"] > 0
+
+
+def test_compare_marks_regression_over_threshold():
+    baseline = {"a": {"median_us": 10.0}, "b": {"median_us": 10.0}}
+    results = {"a": {"median_us": 12.0}, "b": {"median_us": 13.0}, "new": {"median_us": 1.0}}
+
+    rows = {row["name"]: row for row in compare(results, baseline, threshold=0.25)}
+
+    assert not rows["a"]["regression"]
+    assert rows["b"]["regression"]
+    assert "new" not in rows
+
+
+def test_run_restores_jwt_config(monkeypatch):
+    """JWT 설정이 비어 있어도 측정되고, 측정 후 전역 설정이 원래대로 돌아와야 함"""
+    monkeypatch.setattr(AuthConfig, "SECRET_KEY", None)
+    monkeypatch.setattr(AuthConfig, "ALGORITHM", None)
+
+    results = run(["jwt.create_access_token", "jwt.decode_token"], rounds=1, min_round_time=0)
+
+    assert all(result["median_us"] > 0 for result in results.values())
+    assert AuthConfig.SECRET_KEY is None
+    assert AuthConfig.ALGORITHM is None
+
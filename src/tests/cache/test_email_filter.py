@@ -0,0 +1,118 @@
+import pytest
+
+from cache import CountingBloomFilter, EmailExistenceFilter
+from domain import User
+from exception.domain import UserNotFoundException
+from service import UserService
+
+
+def test_bloom_filter_add_and_remove():
+    """추가한 값은 항상 있다고 판별하고, 삭제한 값은 없다고 판별하는지 테스트"""
+    bloom = CountingBloomFilter(capacity=1000, error_rate=0.01)
+    emails = [f"user{i}@example.com" for i in range(1000)]
+    for email in emails:
+        bloom.add(email)
+
+    assert all(bloom.might_contain(email) for email in emails)
+
+    bloom.remove("user1@example.com")
+    assert not bloom.might_contain("user1@example.com")
+    assert bloom.might_contain("user2@example.com")
+
+
+def test_bloom_filter_false_positive_rate():
+    """오탐률이 설정한 값 근처인지 테스트"""
+    bloom = CountingBloomFilter(capacity=1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(f"user{i}@example.com")
+
+    false_positives = sum(bloom.might_contain(f"bot{i}@example.com") for i in range(10000))
+    assert false_positives < 300
+
+
+def test_filter_not_ready_falls_through():
+    """필터가 구성되기 전에는 모든 이메일을 있을 수도 있다고 판별하는지 테스트"""
+    email_filter = EmailExistenceFilter(capacity=100)
+    assert email_filter.might_exist("anyone@example.com")
+
+
+@pytest.mark.asyncio
+async def test_rebuild_keeps_emails_added_during_rebuild():
+    """재구성 중에 가입한 이메일이 유실되지 않는지 테스트"""
+    email_filter = EmailExistenceFilter(capacity=100)
+
+    async def load_emails():
+        email_filter.add("new@example.com")
+        return ["old@example.com"]
+
+    await email_filter.rebuild(load_emails)
+
+    assert email_filter.might_exist("old@example.com")
+    assert email_filter.might_exist("new@example.com")
+
+
+@pytest.mark.asyncio
+async def test_sync_adds_emails_from_other_processes():
+    """다른 프로세스에서 가입한 이메일이 동기화로 반영되는지 테스트"""
+    from datetime import datetime, timedelta
+    from repository.memory import MemoryStore, UserMemoryRepository
+
+    repository = UserMemoryRepository(MemoryStore())
+    email_filter = EmailExistenceFilter(capacity=100, sync_overlap_seconds=5)
+    await email_filter.rebuild(repository.get_all_emails)
+
+    # 다른 프로세스의 가입 (이 프로세스의 필터에는 add되지 않음)
+    await repository.save(User(email="other@example.com", name="O", password_hash="h", tenant_id=1))
+    old = await repository.save(User(email="old@example.com", name="O", password_hash="h", tenant_id=1))
+    old.updated_at = datetime.now() - timedelta(minutes=10)
+    await repository.save(old)
+    assert not email_filter.might_exist("other@example.com")
+
+    since = []
+
+    async def load_emails_since(value):
+        since.append(value)
+        return await repository.get_emails_updated_since(value)
+
+    assert await email_filter.sync(load_emails_since) == 1
+    assert email_filter.might_exist("other@example.com")
+    assert not email_filter.might_exist("old@example.com")
+
+    # 겹쳐 읽은 구간의 이메일은 다시 추가하지 않음
+    assert await email_filter.sync(load_emails_since) == 0
+    assert since[1] - since[0] < timedelta(seconds=5)
+    assert email_filter.stats()["synced"] == 1
+
+
+@pytest.mark.asyncio
+async def test_service_skips_database_for_unknown_email(user_repository_mock):
+    """가입되지 않은 이메일의 조회/인증/재설정/가입 확인이 DB를 거치지 않는지 테스트"""
+    email_filter = EmailExistenceFilter(capacity=100)
+    email_filter.build(["test@example.com"])
+    service = UserService(user_repository_mock, email_filter=email_filter)
+
+    with pytest.raises(UserNotFoundException):
+        await service.get_user_by_email("bot@example.com")
+    with pytest.raises(UserNotFoundException):
+        await service.authenticate_user("bot@example.com", "password123")
+    with pytest.raises(UserNotFoundException):
+        await service.request_password_reset("bot@example.com")
+    user_repository_mock.get_by_email.assert_not_called()
+
+    user_repository_mock.save.side_effect = lambda user: user
+    await service.create_user(email="new@example.com", name="New", password="password123", tenant_id=1)
+    user_repository_mock.exists_by_email.assert_not_called()
+    assert email_filter.might_exist("new@example.com")
+
+
+@pytest.mark.asyncio
+async def test_service_delete_removes_email(user_repository_mock):
+    """사용자 삭제 시 필터에서 이메일이 제거되는지 테스트"""
+    email_filter = EmailExistenceFilter(capacity=100)
+    email_filter.build(["test@example.com"])
+    service = UserService(user_repository_mock, email_filter=email_filter)
+    user_repository_mock.get_by_id.return_value = User(id=1, email="test@example.com", name="T", password_hash="h", tenant_id=1)
+    user_repository_mock.delete.return_value = True
+
+    assert await service.delete_user(1)
+    assert not email_filter.might_exist("test@example.com")
@@ -0,0 +1,150 @@
+import pytest
+import asyncio
+
+from cache import SingleFlight, coalesce
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution():
+    """같은 키의 동시 호출이 한 번만 실행되고 결과 복사본을 받는지 테스트"""
+    group = SingleFlight()
+    calls = 0
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"id": 1}
+
+    results = await asyncio.gather(*[group.do(("user", 1), load) for _ in range(50)])
+
+    assert calls == 1
+    assert all(result == {"id": 1} for result in results)
+    assert len({id(result) for result in results}) == 50
+    assert group.shared == 49
+    assert group.in_flight() == 0
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared_and_not_cached():
+    """실패한 실행의 예외가 follower에게 전달되고, 이후 호출은 다시 실행되는지 테스트"""
+    group = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(group.do("key", fail), group.do("key", fail), return_exceptions=True)
+    assert all(isinstance(result, ValueError) for result in results)
+
+    async def succeed():
+        return 1
+
+    assert await group.do("key", succeed) == 1
+    assert group.executed == 2
+
+
+@pytest.mark.asyncio
+async def test_follower_retries_when_leader_cancelled():
+    """leader가 취소되면 follower가 직접 실행하는지 테스트"""
+    group = SingleFlight()
+
+    async def slow():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    leader = asyncio.ensure_future(group.do("key", slow))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(group.do("key", slow))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await asyncio.wait_for(follower, 1) == "done"
+
+
+@pytest.mark.asyncio
+async def test_repository_lookups_coalesced(tmp_path):
+    """동시에 같은 사용자를 조회하는 요청이 쿼리 하나를 공유하는지 테스트"""
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy import event
+    from db.session import PgSessionManager
+    from domain import User
+    from repository.pg import UserPgRepository
+
+    manager = PgSessionManager(database_url=f"sqlite+aiosqlite:///{tmp_path / 'sf.db'}", replica_urls=[])
+    await manager.init_db()
+    try:
+        async with manager.async_session_maker() as session:
+            user = await UserPgRepository(session).save(User(email="a@example.com", name="A", password_hash="h", tenant_id=1))
+
+        statements = []
+        event.listen(manager.engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        async def lookup():
+            async with manager.async_session_maker() as session:
+                return await UserPgRepository(session).get_by_id(user.id)
+
+        results = await asyncio.gather(*[lookup() for _ in range(10)])
+
+        assert all(result.email == "a@example.com" for result in results)
+        assert len([sql for sql in statements if sql.lstrip().upper().startswith("SELECT")]) == 1
+    finally:
+        await manager.close_db()
+
+
+class _FakeBind:
+    url = "sqlite://primary"
+
+
+class _FakeSession:
+    def __init__(self, **info):
+        self.bind = _FakeBind()
+        self.info = info
+
+
+class _FakeRouter:
+    def has_replicas(self):
+        return True
+
+
+class _SlowRepository:
+    calls = 0
+
+    def __init__(self, session):
+        self.session = session
+
+    @coalesce
+    async def get(self, id):
+        _SlowRepository.calls += 1
+        await asyncio.sleep(0.01)
+        return {"id": id}
+
+
+@pytest.mark.asyncio
+async def test_coalesce_respects_session_routing():
+    """라우팅이 다른 세션끼리, primary로 고정된 세션은 조회를 합치지 않는지 테스트"""
+    _SlowRepository.calls = 0
+    await asyncio.gather(
+        _SlowRepository(_FakeSession(read_only=True, replica_index=0)).get(1),
+        _SlowRepository(_FakeSession(read_only=True, replica_index=0)).get(1),
+    )
+    assert _SlowRepository.calls == 1
+
+    _SlowRepository.calls = 0
+    await asyncio.gather(
+        _SlowRepository(_FakeSession(read_only=True, replica_index=0)).get(1),
+        _SlowRepository(_FakeSession(read_only=False)).get(1),
+        _SlowRepository(_FakeSession(read_only=False, force_primary=True)).get(1),
+    )
+    assert _SlowRepository.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_coalesce_waits_for_replica_choice():
+    """replica를 아직 고르지 않은 읽기 전용 세션끼리는 서로 다른 replica로 갈 수 있으므로 합치지 않는지 테스트"""
+    _SlowRepository.calls = 0
+    await asyncio.gather(
+        _SlowRepository(_FakeSession(read_only=True, replica_router=_FakeRouter())).get(1),
+        _SlowRepository(_FakeSession(read_only=True, replica_router=_FakeRouter())).get(1),
+    )
+    assert _SlowRepository.calls == 2
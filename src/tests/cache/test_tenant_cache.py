@@ -0,0 +1,110 @@
+import pytest
+from unittest.mock import AsyncMock
+
+from cache import TenantCache
+from domain import Tenant
+from repository.pg import TenantPgRepository
+
+
+def test_cache_lookup_returns_copies():
+    """캐시 조회 결과를 수정해도 캐시 내용이 바뀌지 않는지 테스트"""
+    cache = TenantCache(ttl_seconds=60)
+    cache.load([Tenant(id=1, name="nota"), Tenant(id=2, name="other")])
+
+    tenant = cache.get_by_name("nota")
+    tenant.name = "changed"
+
+    assert cache.get_by_id(1).name == "nota"
+    assert cache.exists_by_name("other")
+    assert cache.get_by_id(3) is None
+
+
+def test_cache_put_and_remove():
+    """이름이 바뀐 테넌트 저장과 삭제가 캐시에 반영되는지 테스트"""
+    cache = TenantCache(ttl_seconds=60)
+    cache.load([Tenant(id=1, name="nota")])
+
+    cache.put(Tenant(id=1, name="renamed"))
+    assert not cache.exists_by_name("nota")
+    assert cache.get_by_name("renamed").id == 1
+
+    cache.remove(1)
+    assert cache.get_by_id(1) is None
+    assert not cache.exists_by_name("renamed")
+
+
+def test_cache_staleness():
+    """TTL이 지나면 다시 적재가 필요한지 테스트"""
+    cache = TenantCache(ttl_seconds=0)
+    assert not cache.is_loaded()
+    cache.load([])
+    assert cache.is_loaded()
+    assert cache.is_stale()
+
+
+@pytest.mark.asyncio
+async def test_repository_reads_from_loaded_cache():
+    """캐시가 적재되어 있으면 테넌트 조회에 DB 쿼리가 발생하지 않는지 테스트"""
+    session = AsyncMock()
+    cache = TenantCache(ttl_seconds=60)
+    cache.load([Tenant(id=1, name="nota")])
+    repository = TenantPgRepository(session, cache)
+
+    assert (await repository.get_by_id(1)).name == "nota"
+    assert (await repository.get_by_name("nota")).id == 1
+    assert await repository.exists_by_name("nota")
+    assert await repository.exists(1)
+
+    session.get.assert_not_called()
+    session.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_repository_falls_back_to_database_on_miss(tmp_path):
+    """다른 프로세스가 만들어 캐시에 없는 테넌트를 DB에서 찾아 캐시에 넣는지 테스트"""
+    pytest.importorskip("aiosqlite")
+    from db.session import PgSessionManager
+
+    manager = PgSessionManager(database_url=f"sqlite+aiosqlite:///{tmp_path / 'tenant_miss.db'}", replica_urls=[])
+    await manager.init_db()
+    cache = TenantCache(ttl_seconds=60)
+    cache.load([])
+
+    try:
+        async with manager.async_session_maker() as session:
+            # 캐시 없이 저장 (다른 프로세스)
+            tenant = await TenantPgRepository(session).save(Tenant(name="other"))
+
+        async with manager.async_session_maker() as session:
+            repository = TenantPgRepository(session, cache)
+            assert await repository.exists(tenant.id)
+            assert cache.exists(tenant.id)
+            assert (await repository.get_by_name("other")).id == tenant.id
+            assert not await repository.exists(tenant.id + 1)
+            assert [t.id for t in await repository.get_by_ids([tenant.id, tenant.id + 1])] == [tenant.id]
+    finally:
+        await manager.close_db()
+
+
+@pytest.mark.asyncio
+async def test_repository_save_and_delete_update_cache(tmp_path):
+    """저장/삭제 시 캐시가 갱신되는지 테스트"""
+    pytest.importorskip("aiosqlite")
+    from db.session import PgSessionManager
+
+    manager = PgSessionManager(database_url=f"sqlite+aiosqlite:///{tmp_path / 'tenant.db'}", replica_urls=[])
+    await manager.init_db()
+    cache = TenantCache(ttl_seconds=60)
+    cache.load([])
+
+    try:
+        async with manager.async_session_maker() as session:
+            repository = TenantPgRepository(session, cache)
+            tenant = await repository.save(Tenant(name="nota"))
+            assert cache.get_by_name("nota").id == tenant.id
+
+            assert await repository.delete(tenant.id)
+            assert not cache.exists(tenant.id)
+            assert await repository.get_by_name("nota") is None
+    finally:
+        await manager.close_db()
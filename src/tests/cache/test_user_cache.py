@@ -0,0 +1,108 @@
+import pytest
+
+from cache import UserCache
+from domain import User
+from service import UserService
+
+
+def make_user(id=1, email="test@example.com"):
+    return User(id=id, email=email, name="Test User", password_hash="hashed", tenant_id=1)
+
+
+@pytest.mark.asyncio
+async def test_cache_never_stores_credentials(user_cache):
+    """캐시된 사용자에 비밀번호 해시가 남지 않는지 테스트"""
+    user = make_user()
+    user.email_code = "code"
+    await user_cache.put(user)
+
+    cached = await user_cache.get_by_email("test@example.com")
+    assert cached.id == 1
+    assert cached.password_hash is None
+    assert cached.email_code is None
+    # 원본은 변경되지 않음
+    assert user.password_hash == "hashed"
+
+
+@pytest.mark.asyncio
+async def test_cache_lru_eviction_and_stats():
+    """최대 크기를 넘으면 가장 오래 사용하지 않은 항목이 제거되는지 테스트"""
+    cache = UserCache(max_size=2, ttl_seconds=60)
+    await cache.put(make_user(1, "a@example.com"))
+    await cache.put(make_user(2, "b@example.com"))
+    await cache.get_by_id(1)
+    await cache.put(make_user(3, "c@example.com"))
+
+    assert await cache.get_by_id(2) is None
+    assert await cache.get_by_email("b@example.com") is None
+    assert (await cache.get_by_email("a@example.com")).id == 1
+
+    stats = cache.stats()
+    assert stats["size"] == 2
+    assert stats["hits"] == 2
+    assert stats["misses"] == 2
+    assert stats["hit_rate"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_cache_ttl_expiry():
+    """TTL이 지난 항목은 조회되지 않는지 테스트"""
+    cache = UserCache(max_size=10, ttl_seconds=0)
+    await cache.put(make_user())
+    assert await cache.get_by_id(1) is None
+
+
+@pytest.mark.asyncio
+async def test_remote_tier_shared_between_processes(fake_redis):
+    """2차 캐시에 저장된 사용자를 다른 인스턴스가 조회하고 무효화하는지 테스트"""
+    writer = UserCache(max_size=10, ttl_seconds=60, remote=fake_redis)
+    reader = UserCache(max_size=10, ttl_seconds=60, remote=fake_redis)
+    await writer.put(make_user())
+
+    cached = await reader.get_by_email("test@example.com")
+    assert cached.id == 1
+    assert cached.password_hash is None
+    assert reader.stats()["remote_hits"] == 1
+
+    await writer.invalidate(user_id=1, email="test@example.com")
+    reader.clear()
+    assert await reader.get_by_id(1) is None
+
+
+@pytest.mark.asyncio
+async def test_service_reads_through_cache(user_repository_mock, user_cache):
+    """서비스 조회가 두 번째부터 캐시에서 응답하는지 테스트"""
+    service = UserService(user_repository_mock, user_cache)
+    user_repository_mock.get_by_id.return_value = make_user()
+
+    first = await service.get_user_by_id(1)
+    second = await service.get_user_by_id(1)
+
+    assert first.password_hash is None
+    assert second.email == "test@example.com"
+    user_repository_mock.get_by_id.assert_called_once_with(1)
+
+    # 자격 증명이 필요한 조회는 항상 저장소에서 읽음
+    user = await service.get_user_by_id(1, with_credentials=True)
+    assert user.password_hash == "hashed"
+    assert user_repository_mock.get_by_id.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_service_save_and_delete_invalidate(user_repository_mock, user_cache):
+    """저장/삭제 시 캐시가 무효화되는지 테스트"""
+    service = UserService(user_repository_mock, user_cache)
+    user_repository_mock.get_by_email.return_value = make_user()
+    await service.get_user_by_email("test@example.com")
+
+    renamed = make_user()
+    renamed.name = "Renamed"
+    user_repository_mock.save.side_effect = lambda user: user
+    await service.update_user(renamed)
+    assert await user_cache.get_by_id(1) is None
+
+    await service.get_user_by_email("test@example.com")
+    user_repository_mock.exists.return_value = True
+    user_repository_mock.delete.return_value = True
+    await service.delete_user(1)
+    assert await user_cache.get_by_email("test@example.com") is None
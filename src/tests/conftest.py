@@ -5,4 +5,7 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from tests.fixture.user_fixture import *
-from tests.fixture.project_fixture import *
\ No newline at end of file
+from tests.fixture.project_fixture import *
+from tests.fixture.cache_fixture import *
+from tests.fixture.query_fixture import *
+from tests.fixture.repository_fixture import *
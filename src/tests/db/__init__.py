@@ -0,0 +1 @@
+# tests.db 패키지 초기화 파일
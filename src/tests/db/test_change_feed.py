@@ -0,0 +1,71 @@
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_change_feed_pages_changes_and_deletes(tmp_path):
+    """커서로 변경/삭제를 빠짐없이 한 번씩 전달하는지 테스트"""
+    pytest.importorskip("aiosqlite")
+    from db.model import ProjectModel, ProjectMemberModel
+    from db.session import PgSessionManager
+    from domain import User
+    from repository.pg import UserPgRepository, ChangeFeedPgRepository
+    from service import ChangeFeedService
+
+    manager = PgSessionManager(database_url=f"sqlite+aiosqlite:///{tmp_path / 'feed.db'}", replica_urls=[])
+    await manager.init_db()
+
+    async def read(entity_type, cursor=None, limit=2, tenant_id=None):
+        async with manager.async_session_maker() as session:
+            service = ChangeFeedService(ChangeFeedPgRepository(session), settle_seconds=0)
+            return await service.get_changes(entity_type, cursor, limit, tenant_id)
+
+    try:
+        async with manager.async_session_maker() as session:
+            repository = UserPgRepository(session)
+            users = [
+                await repository.save(User(email=f"user{i}@example.com", name=f"U{i}", password_hash="h", tenant_id=1 + i % 2))
+                for i in range(5)
+            ]
+            project = ProjectModel(name="p", owner_id=users[0].id, tenant_id=1)
+            session.add(project)
+            await session.flush()
+            session.add(ProjectMemberModel(project_id=project.id, user_id=users[2].id, role="EDITOR", invited_by=users[0].id))
+            await session.commit()
+
+        # 전체 변경을 2개씩 페이지로 읽음
+        seen, cursor = [], None
+        while True:
+            page = await read("user", cursor)
+            seen.extend(change["id"] for change in page["changes"])
+            cursor = page["next_cursor"]
+            if not page["has_more"]:
+                break
+        assert seen == [user.id for user in users]
+        assert "password_hash" not in page["changes"][0]
+
+        # 새 변경이 없으면 빈 결과
+        assert (await read("user", cursor))["changes"] == []
+
+        # 삭제는 cascade된 멤버십까지 tombstone으로 전달
+        async with manager.async_session_maker() as session:
+            assert await UserPgRepository(session).delete(users[2].id)
+
+        page = await read("user", cursor)
+        assert page["changes"] == []
+        assert page["deleted_ids"] == [users[2].id]
+        assert len((await read("project_member"))["deleted_ids"]) == 1
+
+        # 테넌트 필터
+        tenant_page = await read("user", tenant_id=2, limit=10)
+        assert {change["tenant_id"] for change in tenant_page["changes"]} == {2}
+    finally:
+        await manager.close_db()
+
+
+def test_invalid_cursor():
+    """해석할 수 없는 커서를 거절하는지 테스트"""
+    from service import ChangeFeedService
+    from exception.domain import InvalidChangeCursorException
+
+    with pytest.raises(InvalidChangeCursorException):
+        ChangeFeedService.decode_cursor("not-a-cursor")
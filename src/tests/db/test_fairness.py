@@ -0,0 +1,102 @@
+import pytest
+import asyncio
+
+from db.fairness import TenantFairLimiter, TenantQuotaTimeoutException
+
+
+@pytest.mark.asyncio
+async def test_tenant_quota_limits_concurrency():
+    """테넌트 하나가 할당량 이상의 슬롯을 잡지 못하는지 테스트"""
+    limiter = TenantFairLimiter(capacity=4, tenant_quota=2)
+
+    await limiter.acquire(1)
+    await limiter.acquire(1)
+    waiter = asyncio.ensure_future(limiter.acquire(1))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    # 다른 테넌트는 남은 슬롯을 바로 사용
+    await asyncio.wait_for(limiter.acquire(2), 0.1)
+
+    limiter.release(1)
+    await asyncio.wait_for(waiter, 0.1)
+
+    stats = limiter.snapshot()["tenants"]
+    assert stats["1"]["active"] == 2
+    assert stats["1"]["throttled"] == 1
+    assert stats["2"]["throttled"] == 0
+
+
+@pytest.mark.asyncio
+async def test_weighted_fair_queueing_when_saturated():
+    """풀이 포화되면 가중치 비율대로 대기 요청에 슬롯을 나눠주는지 테스트"""
+    limiter = TenantFairLimiter(capacity=1, tenant_quota=10, weights={1: 1.0, 2: 3.0})
+    await limiter.acquire(None)
+
+    order = []
+
+    async def worker(tenant_id):
+        await limiter.acquire(tenant_id)
+        order.append(tenant_id)
+
+    tasks = [asyncio.ensure_future(worker(tenant_id)) for tenant_id in [1] * 4 + [2] * 4]
+    await asyncio.sleep(0)
+
+    for _ in range(8):
+        limiter.release(order[-1] if order else None)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+    await asyncio.gather(*tasks)
+    # 가중치가 3배인 테넌트 2가 먼저 대부분의 슬롯을 받음
+    assert order[:4].count(2) == 3
+
+
+@pytest.mark.asyncio
+async def test_acquire_timeout():
+    """제한 시간 안에 슬롯을 얻지 못하면 예외가 발생하는지 테스트"""
+    limiter = TenantFairLimiter(capacity=1, tenant_quota=1, timeout=0.05)
+    await limiter.acquire(1)
+
+    with pytest.raises(TenantQuotaTimeoutException):
+        await limiter.acquire(1)
+
+    assert limiter.snapshot()["tenants"]["1"]["timeouts"] == 1
+
+    limiter.release(1)
+    stats = limiter.snapshot()
+    assert stats["in_use"] == 0
+    assert stats["queued"] == 0
+    # 유휴 상태가 된 테넌트의 지표는 retired에 합산됨
+    assert stats["tenants"] == {}
+    assert stats["retired"]["timeouts"] == 1
+    assert stats["retired"]["max_wait_seconds"] >= 0.05
+
+
+@pytest.mark.asyncio
+async def test_idle_tenants_evicted():
+    """사용/대기 중인 요청이 없는 테넌트의 상태가 정리되어 테넌트 수만큼 쌓이지 않는지 테스트"""
+    limiter = TenantFairLimiter(capacity=1, tenant_quota=1)
+
+    for tenant_id in range(100):
+        async with limiter.slot(tenant_id):
+            pass
+    assert limiter.stats == {}
+    assert limiter.snapshot()["retired"]["acquired"] == 100
+
+    # 포화 중에는 가상 종료 시각이 남은 테넌트만 유지되고, 대기열이 비면 모두 정리됨
+    await limiter.acquire(1)
+    waiters = [asyncio.ensure_future(limiter.acquire(tenant_id)) for tenant_id in (2, 3)]
+    await asyncio.sleep(0)
+    assert set(limiter._last_finish) == {2, 3}
+
+    limiter.release(1)
+    await waiters[0]
+    assert 1 not in limiter.stats
+
+    limiter.release(2)
+    await waiters[1]
+    limiter.release(3)
+    assert limiter.stats == {}
+    assert limiter._last_finish == {}
+    assert limiter._waiters == []
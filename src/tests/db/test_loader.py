@@ -0,0 +1,118 @@
+import pytest
+import asyncio
+
+
+@pytest.mark.asyncio
+async def test_loads_in_same_tick_are_batched():
+    """같은 tick의 조회가 한 번의 일괄 조회로 처리되는지 테스트"""
+    from repository.loader import BatchLoader
+
+    calls = []
+
+    async def batch_fn(ids):
+        calls.append(sorted(ids))
+        return [type("Entity", (), {"id": id})() for id in ids if id != 3]
+
+    loader = BatchLoader(batch_fn)
+    results = await asyncio.gather(*[loader.load(id) for id in [1, 2, 3, 2]])
+
+    assert calls == [[1, 2, 3]]
+    assert [result.id if result else None for result in results] == [1, 2, None, 2]
+
+    # 이미 조회한 키는 다시 조회하지 않음
+    assert (await loader.load(1)).id == 1
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_errors_reach_waiters():
+    """일괄 조회 결과 처리 중 발생한 예외도 기다리던 호출자에게 전달되는지 테스트"""
+    from repository.loader import BatchLoader
+
+    async def batch_fn(ids):
+        return [object()]
+
+    loader = BatchLoader(batch_fn)
+    with pytest.raises(AttributeError):
+        await asyncio.wait_for(asyncio.gather(loader.load(1), loader.load(2)), timeout=1)
+    assert not loader._tasks
+
+
+@pytest.mark.asyncio
+async def test_user_loader_issues_single_query(tmp_path):
+    """N번의 사용자 조회가 쿼리 하나로 처리되는지 테스트"""
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy import event
+    from db.session import PgSessionManager
+    from domain import User
+    from repository.loader import Loaders
+    from repository.pg import UserPgRepository
+
+    manager = PgSessionManager(database_url=f"sqlite+aiosqlite:///{tmp_path / 'loader.db'}", replica_urls=[])
+    await manager.init_db()
+    try:
+        async with manager.async_session_maker() as session:
+            repository = UserPgRepository(session)
+            users = [
+                await repository.save(User(email=f"user{i}@example.com", name=f"U{i}", password_hash="h", tenant_id=1))
+                for i in range(10)
+            ]
+
+        statements = []
+        event.listen(manager.engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        async with manager.async_session_maker() as session:
+            loaders = Loaders.for_session(session)
+            results = await asyncio.gather(*[loaders.users.load(user.id) for user in users], loaders.users.load(999))
+
+        assert [result.email for result in results[:-1]] == [user.email for user in users]
+        assert results[-1] is None
+        assert len(statements) == 1
+        assert loaders.users.batches == 1
+    finally:
+        await manager.close_db()
+
+
+@pytest.mark.asyncio
+async def test_project_member_tenant_loaders_statement_counts(tmp_path):
+    """프로젝트(멤버 selectinload 포함 2개), 멤버, 테넌트 N건 조회의 SQL 문장 수 테스트"""
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy import event
+    from db.session import PgSessionManager
+    from domain import Tenant
+    from domain.project import Project, ProjectMember
+    from repository.loader import Loaders
+    from repository.pg import ProjectPgRepository, ProjectMemberPgRepository, TenantPgRepository
+
+    manager = PgSessionManager(database_url=f"sqlite+aiosqlite:///{tmp_path / 'loader.db'}", replica_urls=[])
+    await manager.init_db()
+    try:
+        async with manager.async_session_maker() as session:
+            tenants = [await TenantPgRepository(session).save(Tenant(name=f"t{i}")) for i in range(5)]
+            projects = [
+                await ProjectPgRepository(session).save(Project(name=f"p{i}", owner_id=1, tenant_id=tenants[0].id))
+                for i in range(5)
+            ]
+            members = [
+                await ProjectMemberPgRepository(session).save(ProjectMember(project_id=project.id, user_id=i, role="VIEWER", invited_by=1))
+                for i, project in enumerate(projects)
+            ]
+
+        statements = []
+        event.listen(manager.engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        async def count(loader, ids):
+            statements.clear()
+            results = await asyncio.gather(*[loader.load(id) for id in ids], loader.load(999))
+            assert [result.id for result in results[:-1]] == ids
+            assert results[-1] is None
+            return len(statements)
+
+        async with manager.async_session_maker() as session:
+            loaders = Loaders.for_session(session)
+            assert await count(loaders.projects, [project.id for project in projects]) == 2
+            assert await count(loaders.project_members, [member.id for member in members]) == 1
+            assert await count(loaders.tenants, [tenant.id for tenant in tenants]) == 1
+    finally:
+        await manager.close_db()
+
@@ -0,0 +1,132 @@
+import pytest
+import asyncio
+
+from db.fairness import TenantQuotaTimeoutException
+
+
+@pytest.mark.asyncio
+async def test_auth_lane_not_starved_by_bulk_lane(tmp_path):
+    """bulk lane 풀이 모두 사용 중이어도 auth lane은 커넥션을 얻는지 테스트"""
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy import text
+    from db.session import PgSessionManager, PoolLane, DEFAULT_LANE, AUTH_LANE, BULK_LANE
+
+    manager = PgSessionManager(
+        database_url=f"sqlite+aiosqlite:///{tmp_path / 'lanes.db'}",
+        replica_urls=[],
+        lanes=[
+            PoolLane(DEFAULT_LANE, pool_size=1),
+            PoolLane(AUTH_LANE, pool_size=1, pool_timeout=0.5),
+            PoolLane(BULK_LANE, pool_size=1, pool_timeout=0.1),
+        ],
+    )
+    assert set(manager.engines) == {DEFAULT_LANE, AUTH_LANE, BULK_LANE}
+
+    try:
+        bulk = manager.get_db(lane=BULK_LANE, tenant_id=1)
+        bulk_session = await bulk.__anext__()
+        await bulk_session.execute(text("SELECT 1"))
+
+        # 같은 lane의 추가 요청은 lane의 대기 시간 안에 실패
+        with pytest.raises(TenantQuotaTimeoutException):
+            await manager.get_db(lane=BULK_LANE, tenant_id=2).__anext__()
+
+        # auth lane은 영향을 받지 않음
+        async def authenticate():
+            async for session in manager.get_db(lane=AUTH_LANE, tenant_id=1):
+                return (await session.execute(text("SELECT 1"))).scalar()
+
+        assert await asyncio.wait_for(authenticate(), 0.5) == 1
+
+        await bulk.aclose()
+        assert manager.fair_limiters[BULK_LANE].snapshot()["in_use"] == 0
+    finally:
+        await manager.close_db()
+
+
+def test_default_lane_required():
+    """default lane 없이 세션 매니저를 생성하는 경우 테스트"""
+    pytest.importorskip("aiosqlite")
+    from db.session import PgSessionManager, PoolLane, AUTH_LANE
+
+    with pytest.raises(ValueError):
+        PgSessionManager(database_url="sqlite+aiosqlite://", replica_urls=[], lanes=[PoolLane(AUTH_LANE, pool_size=1)])
+
+
+@pytest.mark.asyncio
+async def test_auth_connection_released_before_endpoint(tmp_path, monkeypatch):
+    """토큰 검증에 사용한 auth lane 커넥션이 엔드포인트 실행 전에 반납되는지 테스트"""
+    pytest.importorskip("aiosqlite")
+    import httpx
+    from fastapi import Depends, FastAPI
+
+    import db.shard
+    from auth import create_access_token, get_current_active_user
+    from config import AuthConfig
+    from db.session import PgSessionManager, AUTH_LANE
+    from db.shard import ShardDirectory, ShardRouter
+    from domain import User
+    from repository.pg import UserPgRepository
+
+    manager = PgSessionManager(database_url=f"sqlite+aiosqlite:///{tmp_path / 'auth.db'}", replica_urls=[])
+    await manager.init_db()
+    monkeypatch.setattr(db.shard, "shard_router", ShardRouter({"default": manager}, ShardDirectory(["default"], "default")))
+    monkeypatch.setattr(AuthConfig, "SECRET_KEY", "test-secret")
+    monkeypatch.setattr(AuthConfig, "ALGORITHM", "HS256")
+
+    app = FastAPI()
+
+    @app.get("/me")
+    async def me(current_user: User = Depends(get_current_active_user)):
+        return {
+            "email": current_user.email,
+            "auth_slots": manager.fair_limiters[AUTH_LANE].snapshot()["in_use"],
+            "auth_connections": manager.engines[AUTH_LANE].pool.checkedout(),
+        }
+
+    try:
+        async with manager.async_session_maker() as session:
+            user = await UserPgRepository(session).save(User(email="a@example.com", name="A", password_hash="h", tenant_id=1))
+        token = create_access_token({"sub": str(user.id), "tenant_id": 1})
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/me", headers={"Authorization": f"Bearer {token}"})
+
+        assert response.status_code == 200
+        assert response.json() == {"email": "a@example.com", "auth_slots": 0, "auth_connections": 0}
+    finally:
+        await manager.close_db()
+
+
+@pytest.mark.asyncio
+async def test_db_wait_includes_pool_checkout(tmp_path):
+    """커넥션 풀에서 커넥션을 꺼내는 시간도 db_wait 구간에 포함되는지 테스트"""
+    pytest.importorskip("aiosqlite")
+    import time
+    from sqlalchemy import event, text
+    from db.session import PgSessionManager, PoolLane, DEFAULT_LANE
+    from monitoring.timing import start_request
+
+    manager = PgSessionManager(
+        database_url=f"sqlite+aiosqlite:///{tmp_path / 'checkout.db'}",
+        replica_urls=[],
+        lanes=[PoolLane(DEFAULT_LANE, pool_size=1)],
+    )
+
+    # 풀 checkout이 느린 상황을 흉내냄 (슬롯 대기는 없음)
+    @event.listens_for(manager.engine.sync_engine, "checkout")
+    def _slow_checkout(dbapi_connection, connection_record, connection_proxy):
+        time.sleep(0.05)
+
+    try:
+        timings = start_request()
+        async for session in manager.get_db(tenant_id=1):
+            await session.execute(text("SELECT 1"))
+            await session.execute(text("SELECT 1"))
+
+        # 슬롯 획득 1회 + 커넥션 checkout 1회 (같은 트랜잭션의 두 번째 쿼리는 checkout 없음)
+        assert timings.counts["db_wait"] == 2
+        assert timings.totals["db_wait"] >= 0.05
+    finally:
+        await manager.close_db()
@@ -0,0 +1,230 @@
+import pytest
+
+from db.shard import ShardDirectory, ShardRouter
+from exception.domain import TenantMovingException
+
+
+def test_shard_directory_lookup():
+    """디렉터리에 배치된 테넌트와 배치되지 않은 테넌트의 샤드 조회 테스트"""
+    directory = ShardDirectory(["default", "shard_b"], "default", {42: "shard_b"})
+
+    assert directory.shard_for(42) == "shard_b"
+    assert directory.shard_for(7) == "default"
+    assert directory.shard_for(None) == "default"
+
+
+def test_shard_directory_unknown_shard():
+    """등록되지 않은 샤드로 배치하는 경우 테스트"""
+    with pytest.raises(ValueError):
+        ShardDirectory(["default"], "default", {42: "shard_b"})
+
+
+def test_router_rejects_moving_tenant():
+    """이동 중인 테넌트의 세션 요청을 거절하는지 테스트"""
+    directory = ShardDirectory(["default", "shard_b"], "default", {42: "shard_b"})
+    router = ShardRouter({"default": "manager_a", "shard_b": "manager_b"}, directory)
+
+    assert router.session_manager_for(42) == "manager_b"
+    assert router.session_manager_for(1) == "manager_a"
+
+    directory.moving.add(42)
+    with pytest.raises(TenantMovingException):
+        router.session_manager_for(42)
+    assert router.session_manager_for(1) == "manager_a"
+
+
+@pytest.mark.asyncio
+async def test_move_tenant_between_shards(tmp_path):
+    """두 개의 로컬 DB 사이에서 테넌트를 온라인 이동하는 테스트"""
+    pytest.importorskip("aiosqlite")
+    from db.session import PgSessionManager
+    from db.shard_mover import TenantShardMover
+    from db.model import ProjectModel, ProjectMemberModel
+    from domain import Tenant, User
+    from repository.pg import TenantPgRepository, UserPgRepository, ProjectMemberPgRepository
+
+    managers = {
+        "default": PgSessionManager(database_url=f"sqlite+aiosqlite:///{tmp_path / 'a.db'}", replica_urls=[]),
+        "shard_b": PgSessionManager(database_url=f"sqlite+aiosqlite:///{tmp_path / 'b.db'}", replica_urls=[]),
+    }
+    router = ShardRouter(managers, ShardDirectory(managers.keys(), "default"))
+    await router.init_db()
+
+    try:
+        async with managers["default"].async_session_maker() as session:
+            moving = await TenantPgRepository(session).save(Tenant(name="moving"))
+            staying = await TenantPgRepository(session).save(Tenant(name="staying"))
+            owner = await UserPgRepository(session).save(User(email="owner@example.com", name="O", password_hash="h", tenant_id=moving.id))
+            await UserPgRepository(session).save(User(email="other@example.com", name="S", password_hash="h", tenant_id=staying.id))
+            project = ProjectModel(name="p", owner_id=owner.id, tenant_id=moving.id)
+            session.add(project)
+            await session.flush()
+            session.add(ProjectMemberModel(project_id=project.id, user_id=owner.id, role="EDITOR", invited_by=owner.id))
+            await session.commit()
+
+        stats = await TenantShardMover(router, batch_size=1, drain_seconds=0).move(moving.id, "shard_b")
+
+        assert set(stats) == {"tenant", "user", "project", "project_member"}
+        assert all(count >= 1 for count in stats.values())
+        assert router.directory.shard_for(moving.id) == "shard_b"
+        assert router.session_manager_for(moving.id) is managers["shard_b"]
+
+        async with managers["shard_b"].async_session_maker() as session:
+            assert (await UserPgRepository(session).get_by_email("owner@example.com")).tenant_id == moving.id
+            assert len(await ProjectMemberPgRepository(session).get_by_project_id(project.id)) == 1
+
+        async with managers["default"].async_session_maker() as session:
+            assert await UserPgRepository(session).get_by_email("owner@example.com") is None
+            assert await UserPgRepository(session).get_by_email("other@example.com") is not None
+
+            # 다른 프로세스도 디렉터리 테이블에서 새 배치를 읽을 수 있어야 함
+            directory = ShardDirectory(managers.keys(), "default")
+            await directory.load(session)
+            assert directory.shard_for(moving.id) == "shard_b"
+            assert not directory.is_moving(moving.id)
+    finally:
+        await router.close_db()
+
+
+@pytest.mark.asyncio
+async def test_signup_and_login_follow_moved_tenant(tmp_path, monkeypatch):
+    """가입은 본문의 tenant_id로, 로그인은 이메일 디렉터리로 테넌트의 샤드를 찾는지 테스트"""
+    pytest.importorskip("aiosqlite")
+    import httpx
+    from fastapi import FastAPI
+
+    import db.shard
+    from api.auth_api import router as auth_router
+    from config import AuthConfig
+    from db.session import PgSessionManager
+    from db.shard_mover import TenantShardMover
+    from domain import Tenant
+    from repository.pg import TenantPgRepository, UserPgRepository
+
+    managers = {
+        "default": PgSessionManager(database_url=f"sqlite+aiosqlite:///{tmp_path / 'a.db'}", replica_urls=[]),
+        "shard_b": PgSessionManager(database_url=f"sqlite+aiosqlite:///{tmp_path / 'b.db'}", replica_urls=[]),
+    }
+    router = ShardRouter(managers, ShardDirectory(managers.keys(), "default"))
+    await router.init_db()
+    monkeypatch.setattr(db.shard, "shard_router", router)
+    monkeypatch.setattr(AuthConfig, "SECRET_KEY", "test-secret")
+    monkeypatch.setattr(AuthConfig, "ALGORITHM", "HS256")
+
+    app = FastAPI()
+    app.include_router(auth_router, prefix="/api")
+
+    async def signup(client, email, tenant_id):
+        response = await client.post("/api/signup", json={"email": email, "name": "U", "password": "Passw0rd!1", "tenant_id": tenant_id})
+        assert response.status_code == 201, response.text
+
+    async def login(client, email):
+        return await client.post("/api/login", data={"username": email, "password": "Passw0rd!1"})
+
+    async def shard_of(email):
+        for name, manager in managers.items():
+            async with manager.async_session_maker() as session:
+                if await UserPgRepository(session).get_by_email(email) is not None:
+                    return name
+
+    try:
+        async with managers["default"].async_session_maker() as session:
+            tenant = await TenantPgRepository(session).save(Tenant(name="moving"))
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            await signup(client, "before@example.com", tenant.id)
+            assert await shard_of("before@example.com") == "default"
+
+            await TenantShardMover(router, batch_size=10, drain_seconds=0).move(tenant.id, "shard_b")
+
+            assert (await login(client, "before@example.com")).status_code == 200
+            await signup(client, "after@example.com", tenant.id)
+            assert await shard_of("after@example.com") == "shard_b"
+            assert (await login(client, "after@example.com")).status_code == 200
+            assert (await login(client, "unknown@example.com")).status_code == 401
+    finally:
+        await router.close_db()
+
+
+@pytest.mark.asyncio
+async def test_shard_mover_deletes_write_tombstones(tmp_path):
+    """샤드 이동의 core DELETE도 변경 피드 tombstone을 남기는지 테스트"""
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy import select
+    from db.session import PgSessionManager
+    from db.shard_mover import TenantShardMover
+    from db.model import DeletedEntityModel, UserModel
+    from domain import User
+    from repository.pg import UserPgRepository
+
+    managers = {"default": PgSessionManager(database_url=f"sqlite+aiosqlite:///{tmp_path / 'a.db'}", replica_urls=[])}
+    router = ShardRouter(managers, ShardDirectory(managers.keys(), "default"))
+    await router.init_db()
+    mover = TenantShardMover(router, batch_size=1, drain_seconds=0)
+
+    try:
+        async with managers["default"].async_session_maker() as session:
+            users = [
+                await UserPgRepository(session).save(User(email=f"user{i}@example.com", name="U", password_hash="h", tenant_id=7))
+                for i in range(3)
+            ]
+            await mover._delete_ids(session, UserModel.__table__, {users[0].id, users[1].id}, tombstone_tenant_id=7)
+            await mover._delete_ids(session, UserModel.__table__, {users[2].id})
+
+            tombstones = (await session.execute(select(DeletedEntityModel))).scalars().all()
+            assert sorted((t.entity_type, t.entity_id, t.tenant_id) for t in tombstones) == [
+                ("user", users[0].id, 7), ("user", users[1].id, 7),
+            ]
+            assert (await session.execute(select(UserModel))).scalars().all() == []
+    finally:
+        await router.close_db()
+
+
+@pytest.mark.asyncio
+async def test_tenant_path_routes_to_requested_tenant_shard(tmp_path, monkeypatch):
+    """다른 샤드에 있는 테넌트를 경로로 요청하면 호출자 토큰의 샤드가 아니라 그 테넌트의 샤드로 가는지 테스트"""
+    pytest.importorskip("aiosqlite")
+    import httpx
+    from fastapi import FastAPI
+
+    import db.shard
+    from api.user_api import router as user_router
+    from auth.jwt import create_access_token
+    from config import AuthConfig
+    from db.session import PgSessionManager
+    from domain import User
+    from repository.pg import UserPgRepository
+
+    managers = {
+        "default": PgSessionManager(database_url=f"sqlite+aiosqlite:///{tmp_path / 'a.db'}", replica_urls=[]),
+        "shard_b": PgSessionManager(database_url=f"sqlite+aiosqlite:///{tmp_path / 'b.db'}", replica_urls=[]),
+    }
+    router = ShardRouter(managers, ShardDirectory(managers.keys(), "default"))
+    await router.init_db()
+    monkeypatch.setattr(db.shard, "shard_router", router)
+    monkeypatch.setattr(AuthConfig, "SECRET_KEY", "test-secret")
+    monkeypatch.setattr(AuthConfig, "ALGORITHM", "HS256")
+
+    app = FastAPI()
+    app.include_router(user_router, prefix="/api")
+
+    try:
+        async with router.directory_manager.async_session_maker() as session:
+            await router.directory.save(session, 2, "shard_b")
+        async with managers["shard_b"].async_session_maker() as session:
+            await UserPgRepository(session).save(User(email="b@example.com", name="B", password_hash="h", tenant_id=2))
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            for claim in (1, "not-a-number"):
+                headers = {"Authorization": f"Bearer {create_access_token({'sub': '1', 'tenant_id': claim})}"}
+                response = await client.get("/api/users/by-tenant/2", headers=headers)
+                assert response.status_code == 200, response.text
+                assert [user["email"] for user in response.json()] == ["b@example.com"]
+
+                response = await client.get("/api/users/by-tenant/2/export", headers=headers)
+                assert response.status_code == 200
+                assert "b@example.com" in response.text
+    finally:
+        await router.close_db()
+
@@ -2,6 +2,7 @@ import pytest
 from datetime import datetime, timedelta
 from unittest.mock import patch
 
+from domain import User
 from utils import hash_password
 from exception.domain.user_exception import (
     EmailCodeNotGeneratedException,
@@ -95,3 +96,22 @@ def test_reset_password_expired_code(user):
     
     with pytest.raises(EmailCodeExpiredException):
         user.reset_password(code, "new_password123")
+
+
+def test_user_is_slotted(user):
+    """도메인 객체는 인스턴스 __dict__ 없이 선언된 속성만 가짐"""
+    assert not hasattr(user, "__dict__")
+    with pytest.raises(AttributeError):
+        user.unknown_field = 1
+
+
+def test_equal_timestamps_are_shared():
+    """수정되지 않은 엔티티는 created_at과 updated_at이 같은 datetime 객체를 공유"""
+    created_at = datetime(2024, 1, 1)
+    user = User(email="a@example.com", name="a", password_hash=None, tenant_id=1,
+                created_at=created_at, updated_at=datetime(2024, 1, 1))
+    assert user.updated_at is user.created_at
+
+    modified = User(email="a@example.com", name="a", password_hash=None, tenant_id=1,
+                    created_at=created_at, updated_at=datetime(2024, 1, 2))
+    assert modified.updated_at == datetime(2024, 1, 2)
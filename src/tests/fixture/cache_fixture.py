@@ -0,0 +1,32 @@
+import pytest
+
+from cache import UserCache
+
+
+class FakeRedis:
+    """테스트용 프로세스 내 Redis 프로토콜 클라이언트 (get/set/delete만 지원)"""
+
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value.encode() if isinstance(value, str) else value
+        return True
+
+    async def delete(self, *keys):
+        return sum(1 for key in keys if self.store.pop(key, None) is not None)
+
+
+@pytest.fixture
+def fake_redis():
+    """FakeRedis fixture"""
+    return FakeRedis()
+
+
+@pytest.fixture
+def user_cache():
+    """UserCache fixture"""
+    return UserCache(max_size=100, ttl_seconds=60)
@@ -0,0 +1,14 @@
+import pytest
+
+from monitoring import count_statements
+
+
+@pytest.fixture
+def query_counter():
+    """블록 안에서 실행된 SQL 문장을 기록하는 컨텍스트 매니저 fixture
+
+    with query_counter() as log:
+        ...
+    assert log.count == 1
+    """
+    return count_statements
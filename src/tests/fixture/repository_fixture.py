@@ -0,0 +1,51 @@
+import pytest
+import pytest_asyncio
+
+from repository.memory import (
+    MemoryStore,
+    UserMemoryRepository,
+    TenantMemoryRepository,
+    ProjectMemoryRepository,
+    ProjectMemberMemoryRepository,
+)
+
+
+class Repositories:
+    """계약 테스트에서 사용하는 같은 백엔드의 저장소 묶음"""
+
+    def __init__(self, users, tenants, projects, members):
+        self.users = users
+        self.tenants = tenants
+        self.projects = projects
+        self.members = members
+
+
+@pytest_asyncio.fixture(params=["memory", "sqlite"])
+async def repositories(request):
+    """모든 저장소 구현(메모리, SQLite를 사용하는 Pg 저장소)에 대해 반복되는 저장소 fixture"""
+    if request.param == "memory":
+        store = MemoryStore()
+        yield Repositories(
+            UserMemoryRepository(store),
+            TenantMemoryRepository(store),
+            ProjectMemoryRepository(store),
+            ProjectMemberMemoryRepository(store),
+        )
+        return
+
+    pytest.importorskip("aiosqlite")
+    from db.session import PgSessionManager
+    from repository.pg import UserPgRepository, TenantPgRepository, ProjectPgRepository, ProjectMemberPgRepository
+
+    manager = PgSessionManager(database_url="sqlite+aiosqlite://", replica_urls=[])
+    await manager.init_db()
+    try:
+        async with manager.async_session_maker() as session:
+            yield Repositories(
+                UserPgRepository(session),
+                TenantPgRepository(session),
+                ProjectPgRepository(session),
+                ProjectMemberPgRepository(session),
+            )
+    finally:
+        await manager.close_db()
@@ -0,0 +1,40 @@
+import pytest
+import asyncio
+import time
+
+from monitoring.loop_lag import LoopLagMonitor
+
+
+def blocking_call(seconds):
+    time.sleep(seconds)
+
+
+@pytest.mark.asyncio
+async def test_loop_lag_records_blocking_stack():
+    """동기 호출이 루프를 막으면 지연이 기록되고 해당 호출의 스택이 캡처되는지 테스트"""
+    monitor = LoopLagMonitor(interval=0.01, threshold=0.05)
+    monitor.start()
+    try:
+        await asyncio.sleep(0.05)
+        blocking_call(0.3)
+        await asyncio.sleep(0.05)
+    finally:
+        await monitor.stop()
+
+    stats = monitor.stats()
+    assert stats["samples"] > 0
+    assert stats["max_seconds"] >= 0.2
+    assert stats["p50_seconds"] < 0.05
+    assert stats["stall_count"] == 1
+
+    stall = stats["recent_stalls"][0]
+    assert stall["lag_seconds"] >= 0.2
+    assert any("blocking_call" in frame for frame in stall["stack"])
+
+
+def test_stats_without_samples():
+    """샘플이 없는 경우 지표 테스트"""
+    stats = LoopLagMonitor().stats()
+    assert stats["samples"] == 0
+    assert stats["p99_seconds"] == 0.0
+    assert stats["recent_stalls"] == []
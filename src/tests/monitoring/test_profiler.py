@@ -0,0 +1,94 @@
+import pytest
+import time
+
+from monitoring.profiler import ProfileStore, RouteStackSampler, sign_profile_token, verify_profile_token
+
+SECRET = "profiling-secret"
+
+
+def busy_work(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        sum(range(100))
+
+
+def test_verify_profile_token():
+    """경로에 서명된 토큰만, 만료 전까지 허용되는지 테스트"""
+    now = time.time()
+    token = sign_profile_token(SECRET, "/api/auth/login", int(now) + 60)
+
+    assert verify_profile_token(SECRET, token, "/api/auth/login", 600, now=now)
+    assert not verify_profile_token(SECRET, token, "/api/users", 600, now=now)
+    assert not verify_profile_token("other-secret", token, "/api/auth/login", 600, now=now)
+    assert not verify_profile_token(SECRET, token, "/api/auth/login", 600, now=now + 120)
+    assert not verify_profile_token(SECRET, token, "/api/auth/login", 30, now=now)
+    assert not verify_profile_token("", token, "/api/auth/login", 600, now=now)
+    assert not verify_profile_token(SECRET, "garbage", "/api/auth/login", 600, now=now)
+
+
+def _make_app(store, route_sampler):
+    from fastapi import APIRouter, FastAPI
+    from middleware import ProfilerMiddleware
+
+    router = APIRouter()
+
+    @router.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        busy_work(0.1)
+        return {"id": item_id}
+
+    app = FastAPI()
+    app.add_middleware(ProfilerMiddleware, enabled=True, secret=SECRET, store=store, route_sampler=route_sampler)
+    app.include_router(router)
+    return app
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["sampling", "cprofile"])
+async def test_profile_signed_request(mode):
+    """서명된 요청만 프로파일링되고 요청 ID로 저장되는지 테스트"""
+    httpx = pytest.importorskip("httpx")
+    store = ProfileStore()
+    app = _make_app(store, RouteStackSampler())
+    token = sign_profile_token(SECRET, "/items/1", int(time.time()) + 60)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        plain = await client.get("/items/1")
+        unsigned = await client.get("/items/1", headers={"X-Profile-Token": "1.bad"})
+        profiled = await client.get(
+            "/items/1",
+            params={"profile": token, "profile_mode": mode},
+            headers={"X-Request-ID": "req-1"},
+        )
+
+    assert "x-profile-id" not in plain.headers
+    assert "x-profile-id" not in unsigned.headers
+    assert profiled.headers["x-profile-id"] == "req-1"
+    assert [profile["request_id"] for profile in store.list()] == ["req-1"]
+
+    profile = store.get("req-1")
+    assert profile.mode == mode
+    assert "busy_work" in profile.render()
+    if mode == "sampling":
+        stack, count = profile.folded().splitlines()[0].rsplit(" ", 1)
+        assert "get_item" in stack and int(count) > 0
+
+
+@pytest.mark.asyncio
+async def test_route_sampler_aggregates_by_route():
+    """백그라운드 샘플이 라우트 템플릿별로 집계되는지 테스트"""
+    httpx = pytest.importorskip("httpx")
+    sampler = RouteStackSampler(interval=0.005)
+    app = _make_app(ProfileStore(), sampler)
+
+    sampler.start()
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            await client.get("/items/3")
+    finally:
+        sampler.stop()
+
+    routes = sampler.hot_stacks()
+    assert routes["GET /items/{item_id}"]["samples"] > 0
+    assert "busy_work" in routes["GET /items/{item_id}"]["stacks"][0]["stack"]
+    assert sampler.active == {}
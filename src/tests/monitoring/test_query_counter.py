@@ -0,0 +1,105 @@
+import logging
+import pytest
+
+from monitoring import QueryBudgetExceededException, StatementLog, query_budget
+
+
+def test_statement_log_flags_duplicates_and_n_plus_one():
+    """같은 문장과 파라미터는 중복으로, 반복된 같은 문장은 N+1로 보고되는지 테스트"""
+    log = StatementLog(n_plus_one_threshold=3)
+    log.add("SELECT * FROM project", ())
+    for member_id in [1, 2, 2]:
+        log.add("SELECT * FROM project_member WHERE id = ?", (member_id,))
+
+    assert log.count == 4
+    assert log.duplicates() == {"SELECT * FROM project_member WHERE id = ?": 2}
+    assert log.n_plus_one() == {"SELECT * FROM project_member WHERE id = ?": 3}
+
+
+async def _seed_projects(session):
+    from db.model import ProjectModel, ProjectMemberModel
+    from domain import Tenant, User
+    from repository.pg import TenantPgRepository, UserPgRepository
+
+    tenant = await TenantPgRepository(session).save(Tenant(name="t"))
+    owner = await UserPgRepository(session).save(User(email="owner@example.com", name="O", password_hash="h", tenant_id=tenant.id))
+    member = await UserPgRepository(session).save(User(email="member@example.com", name="M", password_hash="h", tenant_id=tenant.id))
+    projects = [ProjectModel(name=f"p{i}", owner_id=owner.id, tenant_id=tenant.id) for i in range(3)]
+    session.add_all(projects)
+    await session.flush()
+    session.add_all([ProjectMemberModel(project_id=project.id, user_id=member.id, role="EDITOR", invited_by=owner.id) for project in projects])
+    session.add(ProjectModel(name="other", owner_id=member.id, tenant_id=tenant.id))
+    await session.commit()
+    return owner, member
+
+
+@pytest.mark.asyncio
+async def test_project_queries_are_eager_loaded(tmp_path, query_counter):
+    """사용자 프로젝트 조회가 멤버를 포함해 고정된 수의 쿼리로 끝나는지 테스트"""
+    pytest.importorskip("aiosqlite")
+    from db.session import PgSessionManager
+    from repository.pg import ProjectPgRepository
+
+    manager = PgSessionManager(database_url=f"sqlite+aiosqlite:///{tmp_path / 'queries.db'}", replica_urls=[])
+    await manager.init_db()
+    try:
+        async with manager.async_session_maker() as session:
+            owner, member = await _seed_projects(session)
+
+        async with manager.async_session_maker() as session:
+            with query_counter() as log:
+                projects = await ProjectPgRepository(session).get_by_user_id(member.id)
+
+            assert len(projects) == 4
+            assert sum(len(project.members) for project in projects) == 3
+            # 프로젝트 조회 1개 + 멤버 selectinload 1개
+            assert log.count == 2
+            assert log.n_plus_one() == {}
+
+            with query_counter() as log:
+                for project in projects:
+                    await ProjectPgRepository(session).exists(project.id)
+            assert len(log.n_plus_one()) == 1
+    finally:
+        await manager.close_db()
+
+
+@pytest.mark.asyncio
+async def test_query_budget_and_middleware(tmp_path, caplog):
+    """쿼리 예산 초과 시 예외가 발생하고 미들웨어가 문장 수를 기록하는지 테스트"""
+    pytest.importorskip("aiosqlite")
+    httpx = pytest.importorskip("httpx")
+    from fastapi import FastAPI
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from middleware import QueryCounterMiddleware
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'budget.db'}")
+
+    async def run_queries(count):
+        async with engine.connect() as conn:
+            for i in range(count):
+                await conn.execute(text("SELECT :i"), {"i": i})
+
+    app = FastAPI()
+    app.add_middleware(QueryCounterMiddleware)
+
+    @app.get("/items")
+    @query_budget(3, enforce=True)
+    async def get_items(count: int):
+        await run_queries(count)
+        return {"count": count}
+
+    try:
+        with caplog.at_level(logging.INFO, logger="notaai.queries"):
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+                response = await client.get("/items", params={"count": 2})
+                assert response.headers["x-query-count"] == "2"
+
+                with pytest.raises(QueryBudgetExceededException):
+                    await client.get("/items", params={"count": 5})
+    finally:
+        await engine.dispose()
+
+    assert caplog.records[-1].levelno == logging.WARNING
+    assert '"count": 5' in caplog.records[-1].getMessage()
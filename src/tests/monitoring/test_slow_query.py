@@ -0,0 +1,115 @@
+import logging
+import pytest
+
+from monitoring.slow_query import SlowQueryLog, normalize_sql, param_shape
+
+
+def test_normalize_sql_groups_same_query_shape():
+    """리터럴, 파라미터, IN 목록 길이가 달라도 같은 쿼리로 정규화되는지 테스트"""
+    first = normalize_sql("SELECT * FROM \"user\"\n WHERE id IN ($1, $2, $3) AND name = 'kim' LIMIT 10")
+    second = normalize_sql("SELECT * FROM \"user\" WHERE id IN ($1, $2) AND name = 'lee' LIMIT 20")
+
+    assert first == second == "SELECT * FROM \"user\" WHERE id IN (?, ...) AND name = ? LIMIT ?"
+    assert normalize_sql("SELECT x::text FROM t1 WHERE y = :y") == "SELECT x::text FROM t1 WHERE y = ?"
+    assert param_shape((1, "a")) == ["int", "str"]
+    assert param_shape([{"id": 1}, {"id": 2}]) == {"executemany": 2, "row": {"id": "int"}}
+
+
+@pytest.mark.asyncio
+async def test_slow_query_records_caller_and_plan(tmp_path, caplog):
+    """느린 쿼리가 호출한 repository 메서드, 파라미터 형태, 실행 계획과 함께 집계되는지 테스트"""
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+    from db.model.base import Base
+    from repository.pg import UserPgRepository
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'slow.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    slow_log = SlowQueryLog(threshold=0, explain=True)
+    slow_log.instrument(engine)
+
+    try:
+        with caplog.at_level(logging.WARNING, logger="notaai.slow_query"):
+            async with async_sessionmaker(engine)() as session:
+                repository = UserPgRepository(session)
+                await repository.get_by_tenant_id(1)
+                await repository.get_by_tenant_id(2)
+        await slow_log.wait_for_explains()
+    finally:
+        await engine.dispose()
+
+    top = slow_log.top(5, order_by="count")
+    entry = next(entry for entry in top if "WHERE user.tenant_id = ?" in entry["sql"])
+    assert entry["count"] == 2
+    assert entry["callers"] == {"repository.pg.user_pg_repository.UserPgRepository.get_by_tenant_id": 2}
+    assert entry["param_shape"] == ["int", "int", "int"]
+    # tenant_id 인덱스가 없어 전체 스캔하는 계획이 함께 저장됨
+    assert "SCAN user" in str(entry["plan"])
+    assert any('"event": "slow_query"' in record.getMessage() for record in caplog.records)
+
+    with pytest.raises(ValueError):
+        slow_log.top(order_by="unknown")
+
+
+@pytest.mark.asyncio
+async def test_explain_is_not_counted_in_request_statements(tmp_path):
+    """실행 계획 조회가 요청의 쿼리 수 측정(count_statements)에 섞이지 않는지 테스트"""
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from monitoring.query_counter import count_statements
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'explain.db'}")
+    slow_log = SlowQueryLog(threshold=0, explain=True)
+    slow_log.instrument(engine)
+
+    try:
+        with count_statements() as log:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            await slow_log.wait_for_explains()
+    finally:
+        await engine.dispose()
+
+    assert slow_log.top(1)[0]["plan"] is not None
+    assert not any(statement.startswith("EXPLAIN") for statement, _ in log.statements)
+
+
+@pytest.mark.asyncio
+async def test_loop_lag_is_discounted_from_query_time(tmp_path):
+    """쿼리 중에 이벤트 루프가 막힌 시간은 느린 쿼리 판정에서 빠지는지 테스트"""
+    pytest.importorskip("aiosqlite")
+    import time
+    from sqlalchemy import event, text
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    class FakeLagMonitor:
+        total_lag = 0.0
+
+    monitor = FakeLagMonitor()
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'lag.db'}")
+    slow_log = SlowQueryLog(threshold=0.05, explain=False, lag_monitor=monitor)
+    slow_log.instrument(engine)
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _block_loop(conn, cursor, statement, parameters, context, executemany):
+        # 다른 요청이 루프를 막은 것처럼 시간을 보내고 모니터에 지연을 누적
+        time.sleep(0.1)
+        monitor.total_lag += 0.1
+
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        assert slow_log.entries == {}
+
+        event.remove(engine.sync_engine, "before_cursor_execute", _block_loop)
+        slow_log.lag_monitor = None
+        event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: time.sleep(0.1))
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        assert len(slow_log.entries) == 1
+    finally:
+        await engine.dispose()
+
@@ -0,0 +1,106 @@
+import pytest
+
+from domain import Project, ProjectMember, Tenant, User
+from exception.domain import UserAlreadyExistsException
+from repository.memory import (
+    MemoryStore,
+    ProjectMemberMemoryRepository,
+    ProjectMemoryRepository,
+    TenantMemoryRepository,
+    UserMemoryRepository,
+)
+
+
+@pytest.mark.asyncio
+async def test_user_indexes_follow_updates():
+    """사용자 수정/삭제 시 이메일/테넌트/관리자 인덱스가 함께 갱신되는지 테스트"""
+    repository = UserMemoryRepository(MemoryStore())
+    user = await repository.save(User(email="a@example.com", name="A", password_hash="h", tenant_id=1))
+    await repository.save(User(email="b@example.com", name="B", password_hash="h", tenant_id=1, is_admin=True))
+
+    # 반환된 객체를 수정해도 저장된 값은 바뀌지 않음
+    user.email = "changed@example.com"
+    assert (await repository.get_by_email("a@example.com")).id == user.id
+
+    user.tenant_id = 2
+    await repository.save(user)
+
+    assert await repository.get_by_email("a@example.com") is None
+    assert (await repository.get_by_email("changed@example.com")).tenant_id == 2
+    assert [u.email for u in await repository.get_by_tenant_id(1)] == ["b@example.com"]
+    assert [u.email for u in await repository.get_admin_users()] == ["b@example.com"]
+    assert [id for id, _ in await repository.get_versions(tenant_id=2)] == [user.id]
+    assert [u.id async for u in repository.stream_by_tenant_id(2)] == [user.id]
+
+    assert await repository.delete(user.id)
+    assert not await repository.exists_by_email("changed@example.com")
+    assert await repository.count() == 1
+
+
+@pytest.mark.asyncio
+async def test_user_email_is_unique():
+    """이미 다른 사용자가 가진 이메일로는 저장되지 않고 기존 행/인덱스가 유지되는지 테스트"""
+    repository = UserMemoryRepository(MemoryStore())
+    first = await repository.save(User(email="a@example.com", name="A", password_hash="h", tenant_id=1))
+    other = await repository.save(User(email="b@example.com", name="B", password_hash="h", tenant_id=1))
+
+    with pytest.raises(UserAlreadyExistsException):
+        await repository.save(User(email="a@example.com", name="A2", password_hash="h", tenant_id=2))
+
+    other.email = "a@example.com"
+    with pytest.raises(UserAlreadyExistsException):
+        await repository.save(other)
+
+    # 자기 자신의 이메일로 다시 저장하는 것은 허용
+    first.name = "A1"
+    await repository.save(first)
+
+    assert (await repository.get_by_email("a@example.com")).name == "A1"
+    assert (await repository.get_by_email("b@example.com")).id == other.id
+    assert await repository.count() == 2
+
+
+@pytest.mark.asyncio
+async def test_project_members_and_cascade():
+    """프로젝트 조회에 멤버가 채워지고 삭제 시 멤버도 삭제되는지 테스트"""
+    store = MemoryStore()
+    projects = ProjectMemoryRepository(store)
+    members = ProjectMemberMemoryRepository(store)
+    tenant = await TenantMemoryRepository(store).save(Tenant(name="t"))
+
+    owned = await projects.save(Project(name="owned", owner_id=1, tenant_id=tenant.id))
+    joined = await projects.save(Project(name="joined", owner_id=2, tenant_id=tenant.id))
+    await projects.save(Project(name="other", owner_id=2, tenant_id=tenant.id))
+    await members.save(ProjectMember(project_id=joined.id, user_id=1, role="EDITOR", invited_by=2))
+
+    assert [p.name for p in await projects.get_by_user_id(1)] == ["owned", "joined"]
+    assert [m.user_id for m in (await projects.get_by_id(joined.id)).members] == [1]
+    assert len(await projects.get_by_tenant_id(tenant.id)) == 3
+    assert len(await members.get_by_role("EDITOR")) == 1
+
+    assert await projects.delete(joined.id)
+    assert await members.get_by_user_id(1) == []
+    assert [p.id for p in await projects.get_by_user_id(1)] == [owned.id]
+
+
+@pytest.mark.asyncio
+async def test_api_with_memory_repositories():
+    """dependency_overrides로 DB 없이 메모리 저장소를 사용하는 API 테스트"""
+    httpx = pytest.importorskip("httpx")
+    from fastapi import FastAPI
+    from api.dependency import memory_repository_overrides
+    from api.user_api import router
+
+    store = MemoryStore()
+    for i in range(3):
+        await UserMemoryRepository(store).save(User(email=f"user{i}@example.com", name=f"U{i}", password_hash="h", tenant_id=7))
+
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    app.dependency_overrides.update(memory_repository_overrides(store))
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/api/users/by-tenant/7", params={"limit": 2})
+
+    assert response.status_code == 200
+    assert [user["email"] for user in response.json()] == ["user0@example.com", "user1@example.com"]
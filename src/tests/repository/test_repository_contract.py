@@ -0,0 +1,157 @@
+"""
+모든 I*Repository 구현이 만족해야 하는 동작 계약
+
+repositories fixture가 메모리 저장소와 SQLite를 사용하는 Pg 저장소에 대해 각 테스트를 반복합니다.
+저장소 구현을 최적화(upsert, 일괄 조회, 페이지네이션 등)할 때 동작이 같은지 확인하는 용도입니다.
+"""
+import pytest
+from datetime import datetime, timedelta
+
+from domain import Project, ProjectMember, Tenant, User
+from exception.domain import UserAlreadyExistsException
+
+
+async def _tenant_with_users(repositories, name="tenant", count=3, admins=()):
+    tenant = await repositories.tenants.save(Tenant(name=name))
+    users = [
+        await repositories.users.save(User(
+            email=f"{name}-{i}@example.com",
+            name=f"user{i}",
+            password_hash="hash",
+            tenant_id=tenant.id,
+            is_admin=i in admins,
+        ))
+        for i in range(count)
+    ]
+    return tenant, users
+
+
+@pytest.mark.asyncio
+async def test_user_save_round_trip_and_upsert(repositories):
+    """저장한 사용자가 모든 필드와 함께 조회되고, 같은 ID로 다시 저장하면 갱신되는지 테스트"""
+    tenant, _ = await _tenant_with_users(repositories, count=0)
+    user = User(email="a@example.com", name="A", password_hash="hash", tenant_id=tenant.id)
+    user.email_verified = True
+    user.email_code = "123456"
+    user.email_code_expires_at = datetime(2030, 1, 1)
+
+    saved = await repositories.users.save(user)
+    assert saved.id is not None
+
+    loaded = await repositories.users.get_by_id(saved.id)
+    assert (loaded.email, loaded.name, loaded.tenant_id, loaded.is_admin) == ("a@example.com", "A", tenant.id, False)
+    assert (loaded.email_verified, loaded.email_code, loaded.email_code_expires_at) == (True, "123456", datetime(2030, 1, 1))
+
+    loaded.name = "B"
+    loaded.email = "b@example.com"
+    loaded.updated_at = loaded.updated_at + timedelta(seconds=1)
+    updated = await repositories.users.save(loaded)
+
+    assert updated.id == saved.id
+    assert await repositories.users.count() == 1
+    assert (await repositories.users.get_by_id(saved.id)).name == "B"
+    assert await repositories.users.get_by_email("a@example.com") is None
+    assert (await repositories.users.get_by_email("b@example.com")).id == saved.id
+    assert await repositories.users.get_version(saved.id) == updated.updated_at
+
+
+@pytest.mark.asyncio
+async def test_user_save_rejects_duplicate_email(repositories):
+    """다른 사용자가 가진 이메일로 저장하면 두 구현 모두 UserAlreadyExistsException이 발생하는지 테스트"""
+    tenant, (first, second) = await _tenant_with_users(repositories, count=2)
+
+    with pytest.raises(UserAlreadyExistsException):
+        await repositories.users.save(User(email=first.email, name="dup", password_hash="hash", tenant_id=tenant.id))
+
+    second.email = first.email
+    with pytest.raises(UserAlreadyExistsException):
+        await repositories.users.save(second)
+
+    assert (await repositories.users.get_by_email(first.email)).id == first.id
+    assert (await repositories.users.get_by_id(second.id)).email == "tenant-1@example.com"
+    assert await repositories.users.count() == 2
+
+
+@pytest.mark.asyncio
+async def test_user_queries(repositories):
+    """사용자 목록 조회의 필터, ID 순서, 페이지네이션 테스트"""
+    tenant, users = await _tenant_with_users(repositories, "first", count=5, admins=(1, 3))
+    other, _ = await _tenant_with_users(repositories, "second", count=2)
+    ids = [user.id for user in users]
+
+    assert [u.id for u in await repositories.users.get_by_tenant_id(tenant.id, skip=1, limit=3)] == ids[1:4]
+    assert [u.id for u in await repositories.users.get_all_user(skip=0, limit=5)] == ids
+    assert [u.id for u in await repositories.users.get_admin_users()] == [ids[1], ids[3]]
+    assert [u.id async for u in repositories.users.stream_by_tenant_id(tenant.id, batch_size=2)] == ids
+    assert sorted(u.id for u in await repositories.users.get_by_ids([ids[0], ids[2], 9999])) == [ids[0], ids[2]]
+    assert await repositories.users.get_by_ids([]) == []
+
+    versions = await repositories.users.get_versions(skip=0, limit=10, tenant_id=tenant.id, admin_only=True)
+    assert [id for id, _ in versions] == [ids[1], ids[3]]
+    assert len(await repositories.users.get_versions(limit=100)) == 7
+    assert len(await repositories.users.get_by_tenant_id(other.id)) == 2
+
+    assert await repositories.users.exists(ids[0])
+    assert await repositories.users.exists_by_email("first-0@example.com")
+    assert not await repositories.users.exists_by_email("missing@example.com")
+    assert await repositories.users.get_version(9999) is None
+
+    assert await repositories.users.delete(ids[0])
+    assert not await repositories.users.delete(ids[0])
+    assert await repositories.users.get_by_id(ids[0]) is None
+    assert await repositories.users.count() == 6
+
+
+@pytest.mark.asyncio
+async def test_tenant_queries(repositories):
+    """테넌트 조회/존재 확인/삭제 테스트"""
+    first = await repositories.tenants.save(Tenant(name="first"))
+    second = await repositories.tenants.save(Tenant(name="second"))
+
+    assert (await repositories.tenants.get_by_name("second")).id == second.id
+    assert await repositories.tenants.exists_by_name("first")
+    assert not await repositories.tenants.exists_by_name("third")
+    assert sorted(t.id for t in await repositories.tenants.get_by_ids([first.id, second.id, 9999])) == [first.id, second.id]
+    assert await repositories.tenants.count() == 2
+
+    first.name = "renamed"
+    await repositories.tenants.save(first)
+    assert await repositories.tenants.get_by_name("first") is None
+    assert (await repositories.tenants.get_by_id(first.id)).name == "renamed"
+
+    assert await repositories.tenants.delete(second.id)
+    assert not await repositories.tenants.exists(second.id)
+
+
+@pytest.mark.asyncio
+async def test_project_and_member_queries(repositories):
+    """프로젝트 조회에 멤버가 포함되고, 멤버 변경과 프로젝트 삭제가 반영되는지 테스트"""
+    tenant, (owner, member, outsider) = await _tenant_with_users(repositories, count=3)
+    owned = await repositories.projects.save(Project(name="owned", owner_id=owner.id, tenant_id=tenant.id))
+    shared = await repositories.projects.save(Project(name="shared", owner_id=outsider.id, tenant_id=tenant.id))
+    await repositories.projects.save(Project(name="private", owner_id=outsider.id, tenant_id=tenant.id))
+
+    invited = await repositories.members.save(ProjectMember(project_id=shared.id, user_id=member.id, role="VIEWER", invited_by=outsider.id))
+    await repositories.members.save(ProjectMember(project_id=owned.id, user_id=member.id, role="EDITOR", invited_by=owner.id))
+
+    assert [p.name for p in await repositories.projects.get_by_user_id(member.id)] == ["owned", "shared"]
+    assert [p.name for p in await repositories.projects.get_by_user_id(owner.id)] == ["owned"]
+    assert [p.name for p in await repositories.projects.get_by_owner_id(outsider.id)] == ["shared", "private"]
+    assert len(await repositories.projects.get_by_tenant_id(tenant.id)) == 3
+    assert (await repositories.projects.get_by_name("shared")).id == shared.id
+
+    loaded = await repositories.projects.get_by_id(shared.id)
+    assert [(m.user_id, m.role) for m in loaded.members] == [(member.id, "VIEWER")]
+
+    invited.change_role("EDITOR")
+    await repositories.members.save(invited)
+    assert len(await repositories.members.get_by_role("EDITOR")) == 2
+    assert [m.role for m in (await repositories.projects.get_by_id(shared.id)).members] == ["EDITOR"]
+    assert len(await repositories.members.get_by_user_id(member.id)) == 2
+    assert len(await repositories.members.get_by_project_id(owned.id)) == 1
+
+    assert await repositories.projects.delete(shared.id)
+    assert not await repositories.projects.exists(shared.id)
+    assert await repositories.members.get_by_project_id(shared.id) == []
+    assert [p.name for p in await repositories.projects.get_by_user_id(member.id)] == ["owned"]
+    assert await repositories.members.count() == 1
@@ -224,3 +224,33 @@ async def test_delete_user_not_found(user_service, user_repository_mock):
     
     user_repository_mock.exists.assert_called_once_with(999)
     user_repository_mock.delete.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_users_by_ids(user_service, user_repository_mock, user):
+    """여러 ID 일괄 조회 시 없는 ID를 따로 반환하는지 테스트"""
+
+    user_repository_mock.get_by_ids.return_value = [user]
+
+    users, missing_ids = await user_service.get_users_by_ids(["user123", "unknown", "user123"])
+
+    assert [found.id for found in users] == ["user123"]
+    assert users[0].password_hash is None
+    assert missing_ids == ["unknown"]
+    user_repository_mock.get_by_ids.assert_called_once_with(["user123", "unknown"])
+
+
+@pytest.mark.asyncio
+async def test_get_users_by_ids_uses_cache(user_repository_mock, user_cache, user):
+    """캐시에 있는 사용자는 저장소에서 다시 조회하지 않는지 테스트"""
+    from service import UserService
+
+    service = UserService(user_repository_mock, user_cache)
+    await user_cache.put(user)
+    user_repository_mock.get_by_ids.return_value = []
+
+    users, missing_ids = await service.get_users_by_ids(["user123", "unknown"])
+
+    assert [found.id for found in users] == ["user123"]
+    assert missing_ids == ["unknown"]
+    user_repository_mock.get_by_ids.assert_called_once_with(["unknown"])
@@ -0,0 +1,54 @@
+import pytest
+from sqlalchemy import func, select
+
+from db.model import UserModel, ProjectModel, ProjectMemberModel
+from tools.seed_data import SeedGenerator, SeedPlan, max_ids, seed, zipf_allocation
+
+
+def test_zipf_allocation_is_skewed_and_keeps_total():
+    counts = zipf_allocation(10000, 100, skew=1.1, minimum=1)
+
+    assert sum(counts) == 10000
+    assert min(counts) >= 1
+    assert counts == sorted(counts, reverse=True)
+    assert counts[0] > 10 * counts[-1]
+
+
+@pytest.mark.asyncio
+async def test_seed_loads_consistent_rows():
+    pytest.importorskip("aiosqlite")
+    from db.session import PgSessionManager
+
+    manager = PgSessionManager(database_url="sqlite+aiosqlite://", replica_urls=[])
+    await manager.init_db()
+    try:
+        async with manager.engine.connect() as conn:
+            plan = SeedPlan(tenants=5, users=200, projects=40)
+            counts = await seed(conn, SeedGenerator(plan, "hash", max_members=20, seed=1), batch_size=50)
+
+            assert counts["tenant"] == 5
+            assert counts["user"] == 200
+            assert counts["project"] == 40
+            assert await conn.scalar(select(func.count()).select_from(ProjectMemberModel)) == counts["project_member"]
+
+            # 소유자와 멤버는 모두 프로젝트와 같은 테넌트의 사용자
+            owner_tenant = (
+                select(func.count()).select_from(ProjectModel)
+                .join(UserModel, UserModel.id == ProjectModel.owner_id)
+                .where(UserModel.tenant_id != ProjectModel.tenant_id)
+            )
+            assert await conn.scalar(owner_tenant) == 0
+            member_tenant = (
+                select(func.count()).select_from(ProjectMemberModel)
+                .join(ProjectModel, ProjectModel.id == ProjectMemberModel.project_id)
+                .join(UserModel, UserModel.id == ProjectMemberModel.user_id)
+                .where(UserModel.tenant_id != ProjectModel.tenant_id)
+            )
+            assert await conn.scalar(member_tenant) == 0
+
+            # 기존 데이터 뒤에 이어서 적재
+            offsets = await max_ids(conn)
+            await seed(conn, SeedGenerator(SeedPlan(2, 10, 2), "hash", id_offsets=offsets, seed=2))
+            assert await conn.scalar(select(func.count()).select_from(UserModel)) == 210
+    finally:
+        await manager.close_db()
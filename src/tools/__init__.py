@@ -0,0 +1 @@
+# tools 패키지 초기화 파일
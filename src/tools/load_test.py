@@ -0,0 +1,356 @@
+"""
+엔드투엔드 부하 테스트
+
+main.py의 FastAPI 앱을 프로세스 안에서 ASGI transport로 호출하거나(기본값),
+uvicorn으로 localhost에 띄운 뒤 HTTP로 호출해 시나리오별 처리량과 라우트별
+p50/p95/p99 지연 시간을 측정합니다. 결과는 JSON으로 저장해 릴리스 간 비교에 사용합니다.
+
+시나리오
+    signup : 새 사용자 가입 폭주
+    login  : 가입된 사용자들의 로그인 폭주
+    reads  : 로그인한 사용자들의 /me, /users 조회
+    reset  : 비밀번호 재설정 요청 -> 재설정 -> 새 비밀번호로 로그인
+
+사용법 (src 디렉터리에서 실행):
+    python -m tools.load_test --backend memory --users 200 --concurrency 20 --output results.json
+    python -m tools.load_test --backend sqlite --mode uvicorn --scenarios login,reads
+    python -m tools.load_test --backend memory --compare results.json
+
+백엔드 설정은 환경 변수로 앱에 전달되므로 앱 모듈을 import하기 전에 설정합니다.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import httpx
+
+SCENARIOS = ["signup", "login", "reads", "reset"]
+PASSWORD = "Passw0rd!1"
+NEW_PASSWORD = "NewPass!23"
+
+
+def percentile(sorted_values: List[float], ratio: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(ratio * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class Recorder:
+    """라우트별 응답 시간과 상태 코드를 기록합니다."""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {}
+        self.statuses: Dict[str, Dict[str, int]] = {}
+        self.errors: Dict[str, int] = {}
+
+    def add(self, route: str, seconds: float, status: Optional[int]) -> None:
+        self.latencies.setdefault(route, []).append(seconds)
+        statuses = self.statuses.setdefault(route, {})
+        key = str(status) if status is not None else "error"
+        statuses[key] = statuses.get(key, 0) + 1
+        if status is None or status >= 400:
+            self.errors[route] = self.errors.get(route, 0) + 1
+
+    def summary(self, duration: float) -> Dict:
+        routes = {}
+        for route, latencies in self.latencies.items():
+            values = sorted(latencies)
+            routes[route] = {
+                "requests": len(values),
+                "errors": self.errors.get(route, 0),
+                "statuses": self.statuses[route],
+                "throughput_rps": round(len(values) / duration, 2) if duration else 0.0,
+                "p50_ms": round(percentile(values, 0.50) * 1000, 2),
+                "p95_ms": round(percentile(values, 0.95) * 1000, 2),
+                "p99_ms": round(percentile(values, 0.99) * 1000, 2),
+                "max_ms": round(values[-1] * 1000, 2),
+            }
+        total = sum(len(latencies) for latencies in self.latencies.values())
+        return {
+            "duration_seconds": round(duration, 3),
+            "requests": total,
+            "errors": sum(self.errors.values()),
+            "throughput_rps": round(total / duration, 2) if duration else 0.0,
+            "routes": routes,
+        }
+
+
+class LoadClient:
+    """요청마다 라우트 이름으로 응답 시간을 기록하는 HTTP 클라이언트"""
+
+    def __init__(self, client: httpx.AsyncClient, recorder: Recorder = None):
+        self.client = client
+        self.recorder = recorder
+
+    async def request(self, route: str, method: str, url: str, **kwargs) -> Optional[httpx.Response]:
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            response = None
+        if self.recorder is not None:
+            self.recorder.add(route, time.perf_counter() - started, response.status_code if response is not None else None)
+        return response
+
+
+async def run_concurrently(jobs, concurrency: int) -> None:
+    """작업 목록을 최대 concurrency개씩 동시에 실행합니다."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(job):
+        async with semaphore:
+            await job()
+
+    await asyncio.gather(*(run(job) for job in jobs))
+
+
+class LoadTest:
+    """사용자 풀을 공유하며 시나리오를 순서대로 실행합니다."""
+
+    def __init__(self, client: httpx.AsyncClient, tenant_id: int, users: int, concurrency: int, iterations: int):
+        self.client = client
+        self.tenant_id = tenant_id
+        self.concurrency = concurrency
+        self.iterations = iterations
+        run_id = uuid.uuid4().hex[:8]
+        self.emails = [f"load-{run_id}-{i}@example.com" for i in range(users)]
+        self.passwords = {email: PASSWORD for email in self.emails}
+        self.tokens: Dict[str, str] = {}
+        self.signed_up = False
+
+    async def _signup(self, client: LoadClient) -> None:
+        async def signup(email):
+            await client.request("POST /api/signup", "POST", "/api/signup", json={
+                "email": email, "name": "Load Test", "password": PASSWORD, "tenant_id": self.tenant_id,
+            })
+
+        await run_concurrently([lambda email=email: signup(email) for email in self.emails], self.concurrency)
+        self.signed_up = True
+
+    async def _login(self, client: LoadClient, email: str) -> None:
+        response = await client.request("POST /api/login", "POST", "/api/login", data={
+            "username": email, "password": self.passwords[email],
+        })
+        if response is not None and response.status_code == 200:
+            self.tokens[email] = response.json()["access_token"]
+
+    async def _ensure_users(self) -> None:
+        """측정하지 않는 준비 단계: 가입과 로그인이 되어 있지 않으면 수행합니다."""
+        setup = LoadClient(self.client)
+        if not self.signed_up:
+            await self._signup(setup)
+        missing = [email for email in self.emails if email not in self.tokens]
+        await run_concurrently([lambda email=email: self._login(setup, email) for email in missing], self.concurrency)
+
+    async def signup(self, client: LoadClient) -> None:
+        await self._signup(client)
+
+    async def login(self, client: LoadClient) -> None:
+        jobs = [lambda email=email: self._login(client, email) for email in self.emails for _ in range(self.iterations)]
+        await run_concurrently(jobs, self.concurrency)
+
+    async def reads(self, client: LoadClient) -> None:
+        async def read(email):
+            headers = {"Authorization": f"Bearer {self.tokens[email]}"}
+            await client.request("GET /api/me", "GET", "/api/me", headers=headers)
+            await client.request("GET /api/users", "GET", "/api/users", params={"limit": 20}, headers=headers)
+
+        emails = [email for email in self.emails if email in self.tokens]
+        await run_concurrently([lambda email=email: read(email) for email in emails for _ in range(self.iterations)], self.concurrency)
+
+    async def reset(self, client: LoadClient) -> None:
+        async def reset_password(email):
+            response = await client.request("POST /api/request-password-reset", "POST", "/api/request-password-reset", json={"email": email})
+            if response is None or response.status_code != 200:
+                return
+            code = response.json()["reset_code"]
+            response = await client.request("POST /api/reset-password", "POST", "/api/reset-password", json={
+                "email": email, "code": code, "new_password": NEW_PASSWORD,
+            })
+            if response is not None and response.status_code == 200:
+                self.passwords[email] = NEW_PASSWORD
+                await self._login(client, email)
+
+        await run_concurrently([lambda email=email: reset_password(email) for email in self.emails], self.concurrency)
+
+    async def run(self, scenarios: List[str]) -> Dict:
+        results = {}
+        for name in scenarios:
+            if name != "signup":
+                await self._ensure_users()
+            recorder = Recorder()
+            started = time.perf_counter()
+            await getattr(self, name)(LoadClient(self.client, recorder))
+            results[name] = recorder.summary(time.perf_counter() - started)
+            print_summary(name, results[name])
+        return results
+
+
+def print_summary(name: str, summary: Dict) -> None:
+    print(f"\n[{name}] {summary['requests']}건, {summary['duration_seconds']}초, {summary['throughput_rps']} req/s, 오류 {summary['errors']}건")
+    print(f"  {'route':<36} {'req':>6} {'err':>5} {'rps':>9} {'p50':>9} {'p95':>9} {'p99':>9}")
+    for route, stats in summary["routes"].items():
+        print(
+            f"  {route:<36} {stats['requests']:>6} {stats['errors']:>5} {stats['throughput_rps']:>9.1f}"
+            f" {stats['p50_ms']:>7.1f}ms {stats['p95_ms']:>7.1f}ms {stats['p99_ms']:>7.1f}ms"
+        )
+
+
+def print_comparison(baseline: Dict, current: Dict) -> None:
+    """기준 결과 대비 시나리오/라우트별 처리량과 p95 변화를 출력합니다."""
+    print(f"\n기준 결과({baseline.get('label') or baseline.get('started_at')})와 비교")
+    for name, summary in current["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if base is None:
+            continue
+        for route, stats in summary["routes"].items():
+            base_stats = base["routes"].get(route)
+            if base_stats is None or not base_stats["p95_ms"] or not base_stats["throughput_rps"]:
+                continue
+            p95 = (stats["p95_ms"] - base_stats["p95_ms"]) / base_stats["p95_ms"] * 100
+            rps = (stats["throughput_rps"] - base_stats["throughput_rps"]) / base_stats["throughput_rps"] * 100
+            print(f"  [{name}] {route:<36} p95 {p95:+7.1f}%  rps {rps:+7.1f}%")
+
+
+def configure_backend(backend: str, db_path: Optional[str]) -> Dict[str, str]:
+    """앱이 사용할 저장소 백엔드 환경 변수를 반환합니다."""
+    env = {
+        "SECRET_KEY": os.environ.get("SECRET_KEY") or "load-test-secret",
+        "ALGORITHM": os.environ.get("ALGORITHM") or "HS256",
+    }
+    if backend == "memory":
+        env["REPOSITORY_BACKEND"] = "memory"
+    else:
+        path = db_path or os.path.join(tempfile.mkdtemp(prefix="notaai-load-"), "load.db")
+        env["REPOSITORY_BACKEND"] = "pg"
+        env["DB_URL"] = f"sqlite+aiosqlite:///{path}"
+    return env
+
+
+async def seed_tenant(backend: str) -> int:
+    """프로세스 안에서 실행한 앱의 저장소에 부하 테스트용 테넌트를 만듭니다."""
+    from cache import get_tenant_cache
+    from domain import Tenant
+
+    if backend == "memory":
+        from repository.memory import get_memory_store, TenantMemoryRepository
+        tenant = await TenantMemoryRepository(get_memory_store()).save(Tenant(name=f"load-{uuid.uuid4().hex[:8]}"))
+    else:
+        from config import DatabaseConfig
+        from db.shard import get_shard_router
+        from repository.pg import TenantPgRepository
+        manager = get_shard_router().managers[DatabaseConfig.DB_DEFAULT_SHARD]
+        async with manager.async_session_maker() as session:
+            tenant = await TenantPgRepository(session).save(Tenant(name=f"load-{uuid.uuid4().hex[:8]}"))
+    get_tenant_cache().put(tenant)
+    return tenant.id
+
+
+async def run_in_process(args, scenarios: List[str]) -> Dict:
+    from main import app
+
+    await app.router.startup()
+    try:
+        tenant_id = await seed_tenant(args.backend)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://load-test", timeout=args.timeout) as client:
+            return await LoadTest(client, tenant_id, args.users, args.concurrency, args.iterations).run(scenarios)
+    finally:
+        await app.router.shutdown()
+
+
+async def wait_until_ready(base_url: str, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get("/api/openapi.json")).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.2)
+    raise SystemExit(f"{timeout}초 안에 서버가 시작되지 않았습니다: {base_url}")
+
+
+async def run_with_uvicorn(args, scenarios: List[str], env: Dict[str, str]) -> Dict:
+    base_url = f"http://127.0.0.1:{args.port}"
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(args.port), "--log-level", "warning"],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        env={**os.environ, **env},
+    )
+    try:
+        await wait_until_ready(base_url, args.startup_timeout)
+        limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+        async with httpx.AsyncClient(base_url=base_url, timeout=args.timeout, limits=limits) as client:
+            return await LoadTest(client, args.tenant_id, args.users, args.concurrency, args.iterations).run(scenarios)
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+async def main(args) -> None:
+    scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        raise SystemExit(f"알 수 없는 시나리오입니다: {', '.join(sorted(unknown))} (사용 가능: {', '.join(SCENARIOS)})")
+
+    env = configure_backend(args.backend, args.db_path)
+    started_at = datetime.now().isoformat(timespec="seconds")
+    if args.mode == "asgi":
+        os.environ.update(env)
+        results = await run_in_process(args, scenarios)
+    else:
+        results = await run_with_uvicorn(args, scenarios, env)
+
+    report = {
+        "label": args.label,
+        "started_at": started_at,
+        "config": {
+            "mode": args.mode,
+            "backend": args.backend,
+            "users": args.users,
+            "concurrency": args.concurrency,
+            "iterations": args.iterations,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+        },
+        "scenarios": results,
+    }
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            print_comparison(json.load(f), report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과를 {args.output}에 저장했습니다.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="NotaAI Auth API 엔드투엔드 부하 테스트")
+    parser.add_argument("--mode", choices=["asgi", "uvicorn"], default="asgi", help="프로세스 내 ASGI 호출 또는 uvicorn 서버")
+    parser.add_argument("--backend", choices=["memory", "sqlite"], default="memory")
+    parser.add_argument("--db-path", default=None, help="sqlite 백엔드의 DB 파일 (기본값: 임시 파일)")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help=f"콤마로 구분한 시나리오 ({', '.join(SCENARIOS)})")
+    parser.add_argument("--users", type=int, default=100, help="가입시킬 사용자 수")
+    parser.add_argument("--concurrency", type=int, default=20, help="동시 요청 수")
+    parser.add_argument("--iterations", type=int, default=1, help="login/reads 시나리오의 사용자별 반복 횟수")
+    parser.add_argument("--timeout", type=float, default=30.0, help="요청 제한 시간(초)")
+    parser.add_argument("--port", type=int, default=8765, help="uvicorn 모드의 포트")
+    parser.add_argument("--startup-timeout", type=float, default=30.0, help="uvicorn 서버 시작 대기 시간(초)")
+    parser.add_argument("--tenant-id", type=int, default=1, help="uvicorn 모드에서 가입에 사용할 테넌트 ID")
+    parser.add_argument("--label", default=None, help="결과에 기록할 이름 (예: 릴리스 버전)")
+    parser.add_argument("--output", default=None, help="결과 JSON 파일 경로")
+    parser.add_argument("--compare", default=None, help="비교할 기준 결과 JSON 파일")
+    asyncio.run(main(parser.parse_args()))
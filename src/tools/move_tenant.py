@@ -0,0 +1,42 @@
+"""
+테넌트 하나를 다른 샤드로 온라인 이동합니다.
+
+사용법 (src 디렉터리에서 실행):
+    python -m tools.move_tenant <tenant_id> <target_shard> [--batch-size 1000] [--drain-seconds 31]
+"""
+import argparse
+import asyncio
+
+from db.shard import get_shard_router
+from db.shard_mover import TenantShardMover
+
+
+async def main(tenant_id: int, target_shard: str, batch_size: int, drain_seconds: float = None) -> None:
+    router = get_shard_router()
+    if target_shard not in router.managers:
+        raise SystemExit(f"등록되지 않은 샤드입니다: {target_shard} (사용 가능: {', '.join(router.managers)})")
+
+    try:
+        mover = TenantShardMover(router, batch_size=batch_size, drain_seconds=drain_seconds)
+        stats = await mover.move(tenant_id, target_shard)
+    finally:
+        await router.close_db()
+
+    if not stats:
+        print(f"테넌트 {tenant_id}는 이미 '{target_shard}' 샤드에 있습니다.")
+        return
+
+    print(f"테넌트 {tenant_id}를 '{target_shard}' 샤드로 이동했습니다.")
+    for table, count in stats.items():
+        print(f"  {table}: {count}행 복사")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="테넌트를 다른 샤드로 온라인 이동합니다.")
+    parser.add_argument("tenant_id", type=int)
+    parser.add_argument("target_shard")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--drain-seconds", type=float, default=None, help="쓰기 중지 후 대기 시간 (기본값: 디렉터리 갱신 주기 + 1초)")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.tenant_id, args.target_shard, args.batch_size, args.drain_seconds))
@@ -0,0 +1,306 @@
+"""
+벤치마크용 대용량 합성 데이터 생성
+
+테넌트/사용자/프로젝트/프로젝트 멤버를 DB 모델의 테이블에 대량으로 적재합니다.
+테넌트 크기는 Zipf 분포로 치우치게(소수의 큰 테넌트와 다수의 작은 테넌트) 나누고,
+프로젝트당 멤버 수는 Pareto 분포를 따릅니다. 같은 --seed는 같은 데이터를 만듭니다.
+
+속도를 위해
+    - ORM 객체를 만들지 않고 테이블에 행 튜플을 직접 적재합니다.
+    - Postgres(asyncpg)는 COPY로, 그 외 DB(SQLite 등)는 배치 executemany로 적재합니다.
+    - 비밀번호 해시는 한 번만 계산해 모든 사용자가 공유합니다. (--password로 로그인 가능)
+ID는 테이블의 현재 최대 ID 다음부터 직접 부여하므로 기존 데이터가 있는 DB에도 추가할 수 있습니다.
+
+사용법 (src 디렉터리에서 실행, 대상 DB는 DatabaseConfig/DB_URL 설정을 따름):
+    python -m tools.seed_data --tenants 1000 --users 10000000 --projects 1000000
+    DB_URL=sqlite+aiosqlite:///seed.db python -m tools.seed_data --tenants 10 --users 10000 --projects 1000
+"""
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+from sqlalchemy import Table, func, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from db.model import TenantModel, UserModel, ProjectModel, ProjectMemberModel
+from db.session import get_session_manager
+from monitoring.slow_query import get_slow_query_log
+from utils import hash_password
+
+DEFAULT_PASSWORD = "Passw0rd!1"
+MEMBER_ROLES = ["ADMIN", "EDITOR", "VIEWER"]
+MEMBER_ROLE_WEIGHTS = [1, 3, 6]
+# created_at/updated_at을 최근 1년에 흩어 updated_at 기준 페이지네이션을 측정할 수 있게 함
+TIMESTAMP_SPREAD_SECONDS = 365 * 24 * 3600
+
+TENANT_COLUMNS = ["id", "name", "created_at", "updated_at"]
+USER_COLUMNS = ["id", "email", "name", "password_hash", "tenant_id", "is_admin", "email_verified", "created_at", "updated_at"]
+PROJECT_COLUMNS = ["id", "name", "description", "owner_id", "tenant_id", "created_at", "updated_at"]
+MEMBER_COLUMNS = ["id", "project_id", "user_id", "role", "invited_by", "created_at", "updated_at"]
+
+
+def zipf_allocation(total: int, buckets: int, skew: float, minimum: int = 0) -> List[int]:
+    """
+    total개를 buckets개로 Zipf(1/rank^skew) 비율에 맞게 나눕니다.
+
+    각 bucket은 최소 minimum개를 받고(total이 충분한 경우), 나머지는 큰 소수점 순으로 배분합니다.
+    """
+    if buckets <= 0:
+        return []
+    minimum = minimum if total >= minimum * buckets else 0
+    weights = [1 / (rank + 1) ** skew for rank in range(buckets)]
+    scale = (total - minimum * buckets) / sum(weights)
+    shares = [weight * scale for weight in weights]
+    counts = [minimum + int(share) for share in shares]
+    remainder = total - sum(counts)
+    for index in sorted(range(buckets), key=lambda i: int(shares[i]) - shares[i])[:remainder]:
+        counts[index] += 1
+    return counts
+
+
+class SeedPlan:
+    """테넌트별 사용자/프로젝트 수와 ID 구간을 계산합니다."""
+
+    def __init__(self, tenants: int, users: int, projects: int, skew: float = 1.1):
+        self.tenants = tenants
+        self.users_per_tenant = zipf_allocation(users, tenants, skew, minimum=1)
+        self.projects_per_tenant = zipf_allocation(projects, tenants, skew)
+        for index, count in enumerate(self.users_per_tenant):
+            # 사용자가 없는 테넌트는 프로젝트 소유자가 없으므로 프로젝트를 만들지 않음
+            if count == 0:
+                self.projects_per_tenant[index] = 0
+
+    @property
+    def users(self) -> int:
+        return sum(self.users_per_tenant)
+
+    @property
+    def projects(self) -> int:
+        return sum(self.projects_per_tenant)
+
+
+class SeedGenerator:
+    """SeedPlan에 따라 테이블별 행 튜플을 생성합니다. (컬럼 순서는 *_COLUMNS)"""
+
+    def __init__(
+        self,
+        plan: SeedPlan,
+        password_hash: str,
+        id_offsets: Dict[str, int] = None,
+        max_members: int = 500,
+        member_alpha: float = 1.2,
+        seed: int = 0,
+        now: datetime = None,
+    ):
+        self.plan = plan
+        self.password_hash = password_hash
+        self.offsets = id_offsets or {}
+        self.max_members = max_members
+        self.member_alpha = member_alpha
+        self.random = random.Random(seed)
+        self.now = now or datetime.now()
+
+        self.tenant_start = self.offsets.get("tenant", 0) + 1
+        # 테넌트마다 연속된 사용자 ID 구간 [start, start + count)
+        self.user_ranges: List[Tuple[int, int]] = []
+        start = self.offsets.get("user", 0) + 1
+        for count in plan.users_per_tenant:
+            self.user_ranges.append((start, count))
+            start += count
+
+    def _timestamp(self) -> datetime:
+        return self.now - timedelta(seconds=self.random.randrange(TIMESTAMP_SPREAD_SECONDS))
+
+    def tenants(self) -> Iterator[tuple]:
+        for index in range(self.plan.tenants):
+            tenant_id = self.tenant_start + index
+            created_at = self._timestamp()
+            yield tenant_id, f"seed-tenant-{tenant_id}", created_at, created_at
+
+    def users(self) -> Iterator[tuple]:
+        for index, (start, count) in enumerate(self.user_ranges):
+            tenant_id = self.tenant_start + index
+            for user_id in range(start, start + count):
+                created_at = self._timestamp()
+                yield (
+                    user_id, f"user{user_id}@tenant{tenant_id}.example.com", f"User {user_id}", self.password_hash,
+                    tenant_id, user_id == start, True, created_at, created_at,
+                )
+
+    def _member_count(self, tenant_users: int) -> int:
+        return min(tenant_users, self.max_members, int(self.random.paretovariate(self.member_alpha)))
+
+    def projects_with_members(self) -> Iterator[Tuple[tuple, List[tuple]]]:
+        """(프로젝트 행, 멤버 행 목록)을 생성합니다. 첫 멤버는 소유자(PROJECT_OWNER)입니다."""
+        project_id = self.offsets.get("project", 0)
+        member_id = self.offsets.get("project_member", 0)
+        for index, count in enumerate(self.plan.projects_per_tenant):
+            tenant_id = self.tenant_start + index
+            user_start, tenant_users = self.user_ranges[index]
+            for _ in range(count):
+                project_id += 1
+                created_at = self._timestamp()
+                user_ids = self.random.sample(range(user_start, user_start + tenant_users), self._member_count(tenant_users))
+                owner_id = user_ids[0]
+                project = (project_id, f"Project {project_id}", None, owner_id, tenant_id, created_at, created_at)
+
+                roles = ["PROJECT_OWNER"] + self.random.choices(MEMBER_ROLES, MEMBER_ROLE_WEIGHTS, k=len(user_ids) - 1)
+                members = []
+                for user_id, role in zip(user_ids, roles):
+                    member_id += 1
+                    members.append((member_id, project_id, user_id, role, owner_id, created_at, created_at))
+                yield project, members
+
+
+def batched(rows: Iterator[tuple], size: int) -> Iterator[List[tuple]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class RowWriter:
+    """
+    행 튜플을 테이블에 적재합니다.
+
+    Postgres(asyncpg)는 COPY(copy_records_to_table)를, 그 외에는 배치 INSERT(executemany)를 사용합니다.
+    """
+
+    def __init__(self, conn: AsyncConnection):
+        self.conn = conn
+        self.use_copy = conn.dialect.name == "postgresql" and conn.dialect.driver == "asyncpg"
+        self.counts: Dict[str, int] = {}
+
+    async def write(self, table: Table, columns: Sequence[str], rows: List[tuple]) -> None:
+        if not rows:
+            return
+        if self.use_copy:
+            raw = await self.conn.get_raw_connection()
+            await raw.driver_connection.copy_records_to_table(table.name, records=rows, columns=list(columns))
+        else:
+            await self.conn.execute(table.insert(), [dict(zip(columns, row)) for row in rows])
+        self.counts[table.name] = self.counts.get(table.name, 0) + len(rows)
+
+
+SEED_TABLES: List[Table] = [
+    TenantModel.__table__,
+    UserModel.__table__,
+    ProjectModel.__table__,
+    ProjectMemberModel.__table__,
+]
+
+
+async def max_ids(conn: AsyncConnection) -> Dict[str, int]:
+    """테이블별 현재 최대 ID (비어 있으면 0)"""
+    return {table.name: (await conn.scalar(select(func.max(table.c.id)))) or 0 for table in SEED_TABLES}
+
+
+async def reset_sequences(conn: AsyncConnection) -> None:
+    """ID를 직접 넣었으므로 Postgres 시퀀스를 최대 ID로 맞춥니다. (SQLite는 자동)"""
+    if conn.dialect.name != "postgresql":
+        return
+    for table in SEED_TABLES:
+        await conn.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('\"{table.name}\"', 'id'), "
+            f"GREATEST((SELECT MAX(id) FROM \"{table.name}\"), 1))"
+        ))
+
+
+async def seed(conn: AsyncConnection, generator: SeedGenerator, batch_size: int = 50000, progress=None) -> Dict[str, int]:
+    """
+    생성기의 행을 부모 → 자식 순서로 적재하고 테이블별 행 수를 반환합니다.
+
+    배치마다 커밋하므로 중간에 실패하면 그때까지 적재된 행은 남습니다.
+    """
+    writer = RowWriter(conn)
+    if conn.dialect.name == "postgresql":
+        # 합성 데이터이므로 커밋마다 WAL flush를 기다리지 않음
+        await conn.execute(text("SET synchronous_commit = off"))
+
+    async def flush(table, columns, rows):
+        if not rows:
+            return
+        await writer.write(table, columns, rows)
+        await conn.commit()
+        if progress is not None:
+            progress(table.name, writer.counts[table.name])
+
+    for rows in batched(generator.tenants(), batch_size):
+        await flush(TenantModel.__table__, TENANT_COLUMNS, rows)
+    for rows in batched(generator.users(), batch_size):
+        await flush(UserModel.__table__, USER_COLUMNS, rows)
+
+    projects, members = [], []
+    for project, project_members in generator.projects_with_members():
+        projects.append(project)
+        members.extend(project_members)
+        if len(projects) >= batch_size or len(members) >= batch_size:
+            await flush(ProjectModel.__table__, PROJECT_COLUMNS, projects)
+            await flush(ProjectMemberModel.__table__, MEMBER_COLUMNS, members)
+            projects, members = [], []
+    await flush(ProjectModel.__table__, PROJECT_COLUMNS, projects)
+    await flush(ProjectMemberModel.__table__, MEMBER_COLUMNS, members)
+
+    await reset_sequences(conn)
+    await conn.commit()
+    return writer.counts
+
+
+async def main(args) -> None:
+    # 대량 적재 배치는 항상 느리므로 느린 쿼리 로그에 남기지 않음
+    get_slow_query_log().threshold = float("inf")
+    manager = get_session_manager()
+    started = time.perf_counter()
+    try:
+        await manager.init_db()
+        plan = SeedPlan(args.tenants, args.users, args.projects, args.skew)
+        largest = max(plan.users_per_tenant, default=0)
+        print(f"테넌트 {plan.tenants}개, 사용자 {plan.users}명 (가장 큰 테넌트 {largest}명), 프로젝트 {plan.projects}개")
+
+        last_report = {}
+
+        def progress(table: str, count: int) -> None:
+            if count - last_report.get(table, 0) >= args.report_every:
+                last_report[table] = count
+                print(f"  {table}: {count}행 ({time.perf_counter() - started:.1f}초)")
+
+        async with manager.engine.connect() as conn:
+            generator = SeedGenerator(
+                plan,
+                hash_password(args.password),
+                id_offsets=await max_ids(conn),
+                max_members=args.max_members,
+                member_alpha=args.member_alpha,
+                seed=args.seed,
+            )
+            counts = await seed(conn, generator, args.batch_size, progress)
+    finally:
+        await manager.close_db()
+
+    print(f"적재 완료 ({time.perf_counter() - started:.1f}초)")
+    for table, count in counts.items():
+        print(f"  {table}: {count}행")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="벤치마크용 대용량 합성 데이터를 생성합니다.")
+    parser.add_argument("--tenants", type=int, default=1000)
+    parser.add_argument("--users", type=int, default=100000)
+    parser.add_argument("--projects", type=int, default=10000)
+    parser.add_argument("--skew", type=float, default=1.1, help="테넌트 크기의 Zipf 지수 (0이면 균등)")
+    parser.add_argument("--max-members", type=int, default=500, help="프로젝트당 최대 멤버 수")
+    parser.add_argument("--member-alpha", type=float, default=1.2, help="프로젝트당 멤버 수의 Pareto 지수 (작을수록 꼬리가 김)")
+    parser.add_argument("--batch-size", type=int, default=50000)
+    parser.add_argument("--password", default=DEFAULT_PASSWORD, help="모든 사용자가 공유하는 비밀번호")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    parser.add_argument("--report-every", type=int, default=1000000, help="진행 상황을 출력할 행 수 간격")
+    args = parser.parse_args()
+
+    asyncio.run(main(args))